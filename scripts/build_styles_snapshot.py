@@ -0,0 +1,54 @@
+"""
+Build the QSS styles snapshot.
+
+Reads every stylesheet in `resources/styles/` and writes
+`src/resources/_styles_snapshot.py` with a `STYLES` dict keyed by the file
+stem (`base`, `light`, `dark`). In frozen (packaged) builds ThemeService
+loads stylesheets from this module, so applying a theme never touches the
+filesystem. From source, ThemeService always reads resources/styles/.
+
+Run before packaging:
+    python scripts/build_styles_snapshot.py
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+STYLES_DIR = ROOT / "resources" / "styles"
+OUTPUT = ROOT / "src" / "resources" / "_styles_snapshot.py"
+
+HEADER = '''"""
+QSS styles snapshot.
+
+Generated by scripts/build_styles_snapshot.py - do not edit by hand.
+"""
+
+'''
+
+
+def build_snapshot(styles_dir: Path = STYLES_DIR, output: Path = OUTPUT) -> Path:
+    """
+    Write the snapshot module.
+
+    Args:
+        styles_dir: Directory containing the .qss files
+        output: Path of the generated module
+
+    Returns:
+        Path of the generated module
+    """
+    lines = [HEADER, "STYLES = {\n"]
+    for qss_file in sorted(styles_dir.glob("*.qss")):
+        content = qss_file.read_text(encoding="utf-8")
+        lines.append(f"    {qss_file.stem!r}: {content!r},\n")
+    lines.append("}\n")
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text("".join(lines), encoding="utf-8")
+    return output
+
+
+if __name__ == "__main__":
+    print(f"Wrote {build_snapshot().relative_to(ROOT)}")
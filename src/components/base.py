@@ -6,39 +6,59 @@ Provides common functionality for all reusable UI components.
 
 from __future__ import annotations
 
-from typing import Any
+import copy
+import sys
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, TypeVar
 
 from PySide6.QtWidgets import QWidget
 from PySide6.QtCore import Signal
 
+_T = TypeVar("_T")
 
-class BaseComponent(QWidget):
+
+def repolish(widget: QWidget) -> None:
     """
-    Base class for all reusable UI components.
+    Re-apply the application stylesheet to a widget.
 
-    Provides:
-    - Props system for configuration
-    - Common signals
-    - Lifecycle hooks
-    - Styling helpers
+    Call after changing a dynamic property used as a QSS selector (e.g.
+    `variant`) on a widget that is already polished. Not needed when the
+    property is set during construction.
 
-    All reusable components should inherit from this class.
+    Args:
+        widget: Widget whose style depends on the changed property
     """
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
 
-    # Common signals
-    clicked = Signal()
-    value_changed = Signal(object)
-    state_changed = Signal(object)
 
-    def __init__(self, parent: QWidget | None = None, **kwargs: Any) -> None:
+class PropsMixin:
+    """
+    Props protocol shared by all reusable components.
+
+    Pure Python mixin (no QWidget inheritance), so components that *are*
+    a Qt widget - e.g. buttons subclassing `QPushButton` - get the same
+    props system and lifecycle hooks as `BaseComponent` without wrapping
+    the real widget in an extra container.
+
+    Usage:
+        class MyButton(QPushButton, PropsMixin):
+            def __init__(self, parent: QWidget | None = None, **kwargs) -> None:
+                super().__init__(parent)
+                self._init_props(**kwargs)
+
+    The Qt base class must come first in the bases list and be
+    initialized before calling `_init_props`.
+    """
+
+    def _init_props(self, **kwargs: Any) -> None:
         """
-        Initialize the component.
+        Store the props and run the component lifecycle hooks.
 
         Args:
-            parent: Parent widget
             **kwargs: Component props
         """
-        super().__init__(parent)
         self._props: dict[str, Any] = kwargs
         self._is_initialized = False
 
@@ -133,3 +153,154 @@ class BaseComponent(QWidget):
     def props(self) -> dict[str, Any]:
         """Get all props."""
         return self._props.copy()
+
+
+def declare_props(**defaults: Any) -> Callable[[type[_T]], type[_T]]:
+    """
+    Declare a fixed prop schema for a `PropsMixin` component.
+
+    Declared props are stored as plain `_p_<name>` instance attributes
+    instead of in the `_props` dict, so hot paths (`_apply_styles`,
+    `_update_ui`) can read e.g. `self._p_size` directly instead of going
+    through `get_prop`. `get_prop`, `set_prop` and `props` keep working for
+    declared and undeclared props; the decorator only adds them when the
+    class body doesn't define its own.
+
+    Defaults are shallow-copied per instance, so mutable defaults such as
+    `items=[]` are never shared between components.
+
+    Note: these are regular attributes, not `__slots__` - PySide6 wrappers
+    always carry an instance `__dict__`, so there is no memory saving.
+
+    Usage:
+        @declare_props(text="", size=ButtonSize.MEDIUM)
+        class MyButton(QPushButton, PropsMixin):
+            ...
+
+    Args:
+        **defaults: Declared prop names and their default values
+
+    Returns:
+        Class decorator
+    """
+    attrs = {key: sys.intern(f"_p_{key}") for key in defaults}
+
+    def _init_props(self: Any, **kwargs: Any) -> None:
+        for key, attr in attrs.items():
+            if key in kwargs:
+                value = kwargs.pop(key)
+            else:
+                value = copy.copy(defaults[key])
+            setattr(self, attr, value)
+        PropsMixin._init_props(self, **kwargs)
+
+    def get_prop(self: Any, key: str, default: Any = None) -> Any:
+        attr = attrs.get(key)
+        if attr is None:
+            return self._props.get(key, default)
+        return getattr(self, attr)
+
+    def set_prop(self: Any, key: str, value: Any) -> None:
+        attr = attrs.get(key)
+        if attr is None:
+            PropsMixin.set_prop(self, key, value)
+            return
+        old_value = getattr(self, attr)
+        setattr(self, attr, value)
+        if self._is_initialized and old_value != value:
+            self._on_prop_changed(key, old_value, value)
+
+    def props(self: Any) -> dict[str, Any]:
+        """Get all props."""
+        values = self._props.copy()
+        for key, attr in attrs.items():
+            values[key] = getattr(self, attr)
+        return values
+
+    generated = {
+        "_init_props": _init_props,
+        "get_prop": get_prop,
+        "set_prop": set_prop,
+        "props": property(props),
+    }
+
+    def decorator(cls: type[_T]) -> type[_T]:
+        # Overrides defined in the class body itself win over the generated ones
+        for name, member in generated.items():
+            if name not in cls.__dict__:
+                setattr(cls, name, member)
+        return cls
+
+    return decorator
+
+
+class BaseComponent(QWidget, PropsMixin):
+    """
+    Base class for all reusable UI components.
+
+    Provides:
+    - Props system for configuration
+    - Common signals
+    - Lifecycle hooks
+    - Styling helpers
+
+    All reusable components should inherit from this class. Components
+    that are a single native widget (e.g. a button) should instead
+    subclass that widget directly and mix in `PropsMixin`.
+    """
+
+    # Common signals
+    clicked = Signal()
+    value_changed = Signal(object)
+    state_changed = Signal(object)
+
+    def __init__(self, parent: QWidget | None = None, **kwargs: Any) -> None:
+        """
+        Initialize the component.
+
+        Args:
+            parent: Parent widget
+            **kwargs: Component props
+        """
+        super().__init__(parent)
+        self._postponed: dict[str, tuple[Any, ...]] | None = None
+        self._init_props(**kwargs)
+
+    def _emit(self, signal: str, *args: Any) -> None:
+        """
+        Emit a component signal, honouring `batch_signals`.
+
+        Inside a `batch_signals()` block only the last arguments of each
+        signal are kept and emitted once when the block exits.
+
+        Args:
+            signal: Signal attribute name (e.g. "value_changed")
+            *args: Signal arguments
+        """
+        if self._postponed is not None:
+            self._postponed[signal] = args
+            return
+        getattr(self, signal).emit(*args)
+
+    @contextmanager
+    def batch_signals(self) -> Iterator[None]:
+        """
+        Postpone and compress signals emitted through `_emit`.
+
+        Usage:
+            with self.batch_signals():
+                for option in options:
+                    ...  # N writes -> at most one emit per signal
+
+        Nested blocks are merged into the outermost one.
+        """
+        if self._postponed is not None:
+            yield
+            return
+        self._postponed = {}
+        try:
+            yield
+        finally:
+            pending, self._postponed = self._postponed, None
+            for signal, args in pending.items():
+                getattr(self, signal).emit(*args)
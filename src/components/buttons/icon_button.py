@@ -1,46 +1,40 @@
 """Icon button component."""
 from __future__ import annotations
-from PySide6.QtWidgets import QPushButton, QWidget, QHBoxLayout
+from PySide6.QtWidgets import QPushButton, QWidget
 from PySide6.QtCore import Qt, QSize
 from PySide6.QtGui import QIcon
-from src.components.base import BaseComponent
+from src.components.base import PropsMixin, declare_props
 
 
-class IconButton(BaseComponent):
+@declare_props(icon=None, size=32, tooltip="")
+class IconButton(QPushButton, PropsMixin):
     """Button with icon only."""
 
+    _p_icon: QIcon | None
+    _p_size: int
+    _p_tooltip: str
+
     def __init__(self, icon: QIcon | None = None, parent: QWidget | None = None, **kwargs) -> None:
         kwargs.setdefault("icon", icon)
 
-        kwargs.setdefault("size", 32)
-
-        kwargs.setdefault("tooltip", "")
-
-        super().__init__(parent, **kwargs)
+        super().__init__(parent)
+        self._init_props(**kwargs)
 
     def _setup_ui(self) -> None:
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        size = self.get_prop("size", 32)
-        self._button = QPushButton()
-        self._button.setFixedSize(size, size)
-        self._button.setCursor(Qt.PointingHandCursor)
-        icon = self.get_prop("icon")
+        size = self._p_size
+        self.setFixedSize(size, size)
+        self.setCursor(Qt.PointingHandCursor)
+        icon = self._p_icon
         if icon:
-            self._button.setIcon(icon)
-            self._button.setIconSize(QSize(size - 8, size - 8))
-        tooltip = self.get_prop("tooltip", "")
+            self.setIcon(icon)
+            self.setIconSize(QSize(size - 8, size - 8))
+        tooltip = self._p_tooltip
         if tooltip:
-            self._button.setToolTip(tooltip)
-        self._apply_styles()
-        layout.addWidget(self._button)
-
-    def _setup_connections(self) -> None:
-        self._button.clicked.connect(self.clicked.emit)
+            self.setToolTip(tooltip)
 
     def _apply_styles(self) -> None:
-        size = self.get_prop("size", 32)
-        self._button.setStyleSheet(f"""
+        size = self._p_size
+        self.setStyleSheet(f"""
             QPushButton {{
                 background: transparent;
                 border: 1px solid #e0e0e0;
@@ -52,4 +46,4 @@ class IconButton(BaseComponent):
 
     def set_icon(self, icon: QIcon) -> None:
         self.set_prop("icon", icon)
-        self._button.setIcon(icon)
+        self.setIcon(icon)
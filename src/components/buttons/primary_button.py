@@ -2,42 +2,35 @@
 from __future__ import annotations
 from PySide6.QtWidgets import QPushButton, QWidget
 from PySide6.QtCore import Qt
-from src.components.base import BaseComponent
+from src.components.base import PropsMixin, declare_props
 from src.core.types import ButtonSize
 
 
-class PrimaryButton(BaseComponent):
+@declare_props(text="", size=ButtonSize.MEDIUM, disabled=False)
+class PrimaryButton(QPushButton, PropsMixin):
     """Primary action button for main actions."""
 
+    _p_text: str
+    _p_size: ButtonSize
+    _p_disabled: bool
+
     def __init__(self, text: str = "", parent: QWidget | None = None, **kwargs) -> None:
         kwargs.setdefault("text", text)
 
-        kwargs.setdefault("size", ButtonSize.MEDIUM)
-
-        kwargs.setdefault("disabled", False)
-
-        super().__init__(parent, **kwargs)
+        super().__init__(kwargs["text"], parent)
+        self._init_props(**kwargs)
 
     def _setup_ui(self) -> None:
-        from PySide6.QtWidgets import QHBoxLayout
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        self._button = QPushButton(self.get_prop("text", ""))
-        self._button.setCursor(Qt.PointingHandCursor)
-        self._apply_styles()
-        layout.addWidget(self._button)
-
-    def _setup_connections(self) -> None:
-        self._button.clicked.connect(self.clicked.emit)
+        self.setCursor(Qt.PointingHandCursor)
 
     def _apply_styles(self) -> None:
-        size = self.get_prop("size", ButtonSize.MEDIUM)
+        size = self._p_size
         sizes = {
             ButtonSize.SMALL: "padding: 6px 12px; font-size: 12px;",
             ButtonSize.MEDIUM: "padding: 10px 20px; font-size: 14px;",
             ButtonSize.LARGE: "padding: 14px 28px; font-size: 16px;",
         }
-        self._button.setStyleSheet(f"""
+        self.setStyleSheet(f"""
             QPushButton {{
                 background-color: #0078D4;
                 color: white;
@@ -50,10 +43,10 @@ class PrimaryButton(BaseComponent):
             QPushButton:pressed {{ background-color: #005A9E; }}
             QPushButton:disabled {{ background-color: #ccc; color: #888; }}
         """)
-        self._button.setEnabled(not self.get_prop("disabled", False))
+        self.setEnabled(not self._p_disabled)
 
     def _update_ui(self) -> None:
-        self._button.setText(self.get_prop("text", ""))
+        self.setText(self._p_text)
         self._apply_styles()
 
     def set_text(self, text: str) -> None:
@@ -1,34 +1,29 @@
 """Secondary button component."""
 from __future__ import annotations
-from PySide6.QtWidgets import QPushButton, QWidget, QHBoxLayout
+from PySide6.QtWidgets import QPushButton, QWidget
 from PySide6.QtCore import Qt
-from src.components.base import BaseComponent
+from src.components.base import PropsMixin, declare_props
 from src.core.types import ButtonSize
 
 
-class SecondaryButton(BaseComponent):
+@declare_props(text="", size=ButtonSize.MEDIUM)
+class SecondaryButton(QPushButton, PropsMixin):
     """Secondary button for less prominent actions."""
 
+    _p_text: str
+    _p_size: ButtonSize
+
     def __init__(self, text: str = "", parent: QWidget | None = None, **kwargs) -> None:
         kwargs.setdefault("text", text)
 
-        kwargs.setdefault("size", ButtonSize.MEDIUM)
-
-        super().__init__(parent, **kwargs)
+        super().__init__(kwargs["text"], parent)
+        self._init_props(**kwargs)
 
     def _setup_ui(self) -> None:
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        self._button = QPushButton(self.get_prop("text", ""))
-        self._button.setCursor(Qt.PointingHandCursor)
-        self._apply_styles()
-        layout.addWidget(self._button)
-
-    def _setup_connections(self) -> None:
-        self._button.clicked.connect(self.clicked.emit)
+        self.setCursor(Qt.PointingHandCursor)
 
     def _apply_styles(self) -> None:
-        self._button.setStyleSheet("""
+        self.setStyleSheet("""
             QPushButton {
                 background-color: white;
                 color: #333;
@@ -42,4 +37,4 @@ class SecondaryButton(BaseComponent):
         """)
 
     def _update_ui(self) -> None:
-        self._button.setText(self.get_prop("text", ""))
+        self.setText(self._p_text)
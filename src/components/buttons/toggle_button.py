@@ -1,55 +1,46 @@
 """Toggle button component."""
 from __future__ import annotations
-from PySide6.QtWidgets import QPushButton, QWidget, QHBoxLayout
-from PySide6.QtCore import Qt, Signal
-from src.components.base import BaseComponent
+from PySide6.QtWidgets import QPushButton, QWidget
+from PySide6.QtCore import Qt, Slot
+from src.components.base import PropsMixin, declare_props
 
 
-class ToggleButton(BaseComponent):
-    """Toggle button with on/off states."""
+@declare_props(text="", checked=False)
+class ToggleButton(QPushButton, PropsMixin):
+    """
+    Toggle button with on/off states.
 
-    toggled = Signal(bool)
+    A checkable `QPushButton`; `toggled(bool)` is the native signal.
+    """
+
+    _p_text: str
+    _p_checked: bool
 
     def __init__(self, text: str = "", parent: QWidget | None = None, **kwargs) -> None:
         kwargs.setdefault("text", text)
 
-        kwargs.setdefault("checked", False)
-
-        super().__init__(parent, **kwargs)
+        super().__init__(kwargs["text"], parent)
+        self._init_props(**kwargs)
 
     def _setup_ui(self) -> None:
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        self._button = QPushButton(self.get_prop("text", ""))
-        self._button.setCheckable(True)
-        self._button.setChecked(self.get_prop("checked", False))
-        self._button.setCursor(Qt.PointingHandCursor)
-        self._apply_styles()
-        layout.addWidget(self._button)
+        self.setCheckable(True)
+        self.setChecked(self._p_checked)
+        self.setCursor(Qt.PointingHandCursor)
+        self.setProperty("class", "toggle")
 
     def _setup_connections(self) -> None:
-        self._button.toggled.connect(self._on_toggled)
+        self.toggled.connect(self._on_toggled)
 
+    @Slot(bool)
     def _on_toggled(self, checked: bool) -> None:
         self.set_prop("checked", checked)
-        self.toggled.emit(checked)
-
-    def _apply_styles(self) -> None:
-        self._button.setStyleSheet("""
-            QPushButton {
-                background: #e9ecef;
-                color: #333;
-                border: none;
-                border-radius: 6px;
-                padding: 10px 20px;
-            }
-            QPushButton:hover { background: #dee2e6; }
-            QPushButton:checked { background: #0078D4; color: white; }
-            QPushButton:checked:hover { background: #106EBE; }
-        """)
+
+    def _update_ui(self) -> None:
+        self.setText(self._p_text)
+        self.setChecked(self._p_checked)
 
     def is_checked(self) -> bool:
-        return self._button.isChecked()
+        return self.isChecked()
 
     def set_checked(self, checked: bool) -> None:
-        self._button.setChecked(checked)
+        self.setChecked(checked)
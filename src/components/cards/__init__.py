@@ -5,14 +5,41 @@ Contains card variants:
 - BasicCard
 - InfoCard
 - ActionCard
+
+Submodules are imported lazily on first attribute access (PEP 562).
 """
 
-from src.components.cards.basic_card import BasicCard
-from src.components.cards.info_card import InfoCard
-from src.components.cards.action_card import ActionCard
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.components.cards.basic_card import BasicCard
+    from src.components.cards.info_card import InfoCard
+    from src.components.cards.action_card import ActionCard
+
+_MODULES = {
+    "BasicCard": "src.components.cards.basic_card",
+    "InfoCard": "src.components.cards.info_card",
+    "ActionCard": "src.components.cards.action_card",
+}
 
 __all__ = [
     "BasicCard",
     "InfoCard",
     "ActionCard",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -20,16 +20,17 @@ class ActionCard(BaseComponent):
 
     def _setup_ui(self) -> None:
         self._frame = QFrame(self)
-        self._frame.setStyleSheet("QFrame { background: white; border: 1px solid #e0e0e0; border-radius: 8px; padding: 16px; }")
+        self._frame.setProperty("class", "card")
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(0, 0, 0, 0)
         main_layout.addWidget(self._frame)
         content_layout = QVBoxLayout(self._frame)
+        content_layout.setContentsMargins(16, 16, 16, 16)
         self._title_label = QLabel(self.get_prop("title", ""))
-        self._title_label.setStyleSheet("font-size: 16px; font-weight: bold;")
+        self._title_label.setProperty("class", "card-title")
         content_layout.addWidget(self._title_label)
         self._desc_label = QLabel(self.get_prop("description", ""))
-        self._desc_label.setStyleSheet("font-size: 14px; color: #666;")
+        self._desc_label.setProperty("class", "card-description")
         self._desc_label.setWordWrap(True)
         content_layout.addWidget(self._desc_label)
         self._actions_layout = QHBoxLayout()
@@ -38,22 +39,22 @@ class ActionCard(BaseComponent):
         self._setup_actions()
 
     def _setup_actions(self) -> None:
-        actions = self.get_prop("actions", [])
-        for action in actions:
-            btn = QPushButton(action.get("text", ""))
-            btn.setCursor(Qt.PointingHandCursor)
-            variant = action.get("variant", "primary")
-            if variant == "danger":
-                btn.setStyleSheet("QPushButton { background: #dc3545; color: white; border: none; border-radius: 4px; padding: 8px 16px; }")
-            else:
-                btn.setStyleSheet("QPushButton { background: #0078D4; color: white; border: none; border-radius: 4px; padding: 8px 16px; }")
-            callback = action.get("callback")
-            if callback:
-                btn.clicked.connect(callback)
-            self._actions_layout.addWidget(btn)
+        for action in self.get_prop("actions", []):
+            self._add_action_button(action)
+
+    def _add_action_button(self, action: dict[str, Any]) -> None:
+        btn = QPushButton(action.get("text", ""))
+        btn.setCursor(Qt.PointingHandCursor)
+        # Set before the button is polished, so the app QSS picks it up
+        if action.get("variant", "primary") == "danger":
+            btn.setProperty("class", "danger")
+        callback = action.get("callback")
+        if callback:
+            btn.clicked.connect(callback)
+        self._actions_layout.addWidget(btn)
 
     def add_action(self, text: str, callback: Any, variant: str = "primary") -> None:
         """Add an action button."""
-        actions = self.get_prop("actions", [])
-        actions.append({"text": text, "callback": callback, "variant": variant})
-        self.set_prop("actions", actions)
+        action = {"text": text, "callback": callback, "variant": variant}
+        self.set_prop("actions", [*self.get_prop("actions", []), action])
+        self._add_action_button(action)
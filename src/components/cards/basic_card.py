@@ -19,6 +19,7 @@ class BasicCard(BaseComponent):
     def _setup_ui(self) -> None:
         self._frame = QFrame(self)
         self._frame.setFrameShape(QFrame.StyledPanel)
+        self._frame.setProperty("class", "card")
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(0, 0, 0, 0)
         main_layout.addWidget(self._frame)
@@ -26,19 +27,13 @@ class BasicCard(BaseComponent):
         self._content_layout.setContentsMargins(16, 16, 16, 16)
         self._content_layout.setSpacing(8)
         self._title_label = QLabel(self.get_prop("title", ""))
-        self._title_label.setStyleSheet("font-size: 18px; font-weight: bold;")
+        self._title_label.setProperty("class", "card-title")
         self._title_label.setVisible(bool(self.get_prop("title")))
         self._content_layout.addWidget(self._title_label)
         self._subtitle_label = QLabel(self.get_prop("subtitle", ""))
-        self._subtitle_label.setStyleSheet("font-size: 14px; color: #666;")
+        self._subtitle_label.setProperty("class", "card-description")
         self._subtitle_label.setVisible(bool(self.get_prop("subtitle")))
         self._content_layout.addWidget(self._subtitle_label)
-        self._apply_styles()
-
-    def _apply_styles(self) -> None:
-        self._frame.setStyleSheet("""
-            QFrame { background: white; border: 1px solid #e0e0e0; border-radius: 8px; }
-        """)
 
     def add_content(self, widget: QWidget) -> None:
         """Add widget to card content."""
@@ -3,6 +3,15 @@ from __future__ import annotations
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QFrame
 from src.components.base import BaseComponent
 
+# Accent colors with a matching QSS rule (QFrame[class="card"][accent="..."])
+_ACCENTS = {
+    "#0078D4": "primary",
+    "#28A745": "success",
+    "#FFC107": "warning",
+    "#DC3545": "danger",
+    "#17A2B8": "info",
+}
+
 
 class InfoCard(BaseComponent):
     """Card for displaying information with accent color."""
@@ -26,18 +35,26 @@ class InfoCard(BaseComponent):
     def _setup_ui(self) -> None:
         color = self.get_prop("color", "#0078D4")
         self._frame = QFrame(self)
-        self._frame.setStyleSheet(f"""
-            QFrame {{ background: white; border: 1px solid #e0e0e0; border-left: 4px solid {color}; border-radius: 4px; padding: 16px; }}
-        """)
+        self._frame.setProperty("class", "card")
+        accent = _ACCENTS.get(color.upper(), color if color in _ACCENTS.values() else None)
+        if accent:
+            self._frame.setProperty("accent", accent)
+        else:
+            # Arbitrary colors have no shared rule; only then style this frame
+            self._frame.setProperty("accent", "custom")
+            self._frame.setStyleSheet(
+                f'QFrame[class="card"] {{ border-left: 4px solid {color}; }}'
+            )
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(0, 0, 0, 0)
         main_layout.addWidget(self._frame)
         content_layout = QVBoxLayout(self._frame)
+        content_layout.setContentsMargins(16, 16, 16, 16)
         self._value_label = QLabel(self.get_prop("value", ""))
-        self._value_label.setStyleSheet("font-size: 28px; font-weight: bold;")
+        self._value_label.setProperty("class", "card-value")
         content_layout.addWidget(self._value_label)
         self._title_label = QLabel(self.get_prop("title", ""))
-        self._title_label.setStyleSheet("font-size: 14px; color: #666;")
+        self._title_label.setProperty("class", "card-description")
         content_layout.addWidget(self._title_label)
 
     def set_value(self, value: str) -> None:
@@ -6,12 +6,27 @@ Contains modal/dialog components:
 - ConfirmDialog
 - AlertDialog
 - FormDialog
+
+Submodules are imported lazily on first attribute access (PEP 562).
 """
 
-from src.components.dialogs.base_dialog import BaseDialog
-from src.components.dialogs.confirm_dialog import ConfirmDialog
-from src.components.dialogs.alert_dialog import AlertDialog
-from src.components.dialogs.form_dialog import FormDialog
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.components.dialogs.base_dialog import BaseDialog
+    from src.components.dialogs.confirm_dialog import ConfirmDialog
+    from src.components.dialogs.alert_dialog import AlertDialog
+    from src.components.dialogs.form_dialog import FormDialog
+
+_MODULES = {
+    "BaseDialog": "src.components.dialogs.base_dialog",
+    "ConfirmDialog": "src.components.dialogs.confirm_dialog",
+    "AlertDialog": "src.components.dialogs.alert_dialog",
+    "FormDialog": "src.components.dialogs.form_dialog",
+}
 
 __all__ = [
     "BaseDialog",
@@ -19,3 +34,16 @@ __all__ = [
     "AlertDialog",
     "FormDialog",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -3,6 +3,9 @@ from __future__ import annotations
 from PySide6.QtWidgets import QWidget, QLabel, QFrame, QVBoxLayout
 from src.components.dialogs.base_dialog import BaseDialog
 
+# Alert types with a matching QSS rule (QFrame[class="alert"][variant="..."])
+_ALERT_TYPES = ("info", "success", "warning", "error")
+
 
 class AlertDialog(BaseDialog):
     """Alert dialog for notifications."""
@@ -14,11 +17,12 @@ class AlertDialog(BaseDialog):
         self._build_ui()
 
     def _build_ui(self) -> None:
-        colors = {"info": "#cfe2ff", "success": "#d1e7dd", "warning": "#fff3cd", "error": "#f8d7da"}
-        bg_color = colors.get(self._alert_type, colors["info"])
+        alert_type = self._alert_type if self._alert_type in _ALERT_TYPES else "info"
         alert_frame = QFrame()
-        alert_frame.setStyleSheet(f"QFrame {{ background: {bg_color}; border-radius: 6px; padding: 16px; }}")
+        alert_frame.setProperty("class", "alert")
+        alert_frame.setProperty("variant", alert_type)
         layout = QVBoxLayout(alert_frame)
+        layout.setContentsMargins(16, 16, 16, 16)
         msg_label = QLabel(self._message)
         msg_label.setWordWrap(True)
         layout.addWidget(msg_label)
@@ -1,6 +1,6 @@
 """Base dialog component."""
 from __future__ import annotations
-from PySide6.QtWidgets import QDialog, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton
+from PySide6.QtWidgets import QDialog, QWidget, QVBoxLayout, QHBoxLayout, QPushButton
 from PySide6.QtCore import Qt
 
 
@@ -30,10 +30,9 @@ class BaseDialog(QDialog):
     def add_button(self, text: str, callback=None, primary: bool = False) -> QPushButton:
         btn = QPushButton(text)
         btn.setCursor(Qt.PointingHandCursor)
-        if primary:
-            btn.setStyleSheet("QPushButton { background: #0078D4; color: white; border: none; border-radius: 6px; padding: 10px 20px; }")
-        else:
-            btn.setStyleSheet("QPushButton { background: white; border: 1px solid #e0e0e0; border-radius: 6px; padding: 10px 20px; }")
+        # Primary is the default QPushButton style of the app stylesheet
+        if not primary:
+            btn.setProperty("class", "secondary")
         if callback:
             btn.clicked.connect(callback)
         self._button_layout.addWidget(btn)
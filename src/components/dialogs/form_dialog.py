@@ -1,7 +1,8 @@
 """Form dialog component."""
 from __future__ import annotations
-from typing import Any
+from typing import Any, Callable
 from PySide6.QtWidgets import QWidget
+from PySide6.QtCore import Slot
 from src.components.dialogs.base_dialog import BaseDialog
 
 
@@ -11,7 +12,7 @@ class FormDialog(BaseDialog):
     def __init__(self, title: str = "Form", parent: QWidget | None = None) -> None:
         super().__init__(title, parent)
         self._form_data: dict[str, Any] = {}
-        self._fields: dict[str, QWidget] = {}
+        self._field_getters: dict[str, Callable[[], Any]] = {}
         self._build_buttons()
 
     def _build_buttons(self) -> None:
@@ -19,15 +20,15 @@ class FormDialog(BaseDialog):
         self.add_button("Submit", self._on_submit, primary=True)
 
     def add_field(self, name: str, widget: QWidget) -> None:
-        self._fields[name] = widget
+        # Resolve how to read the field once; widgets with neither are not collected
+        getter = getattr(widget, "get_value", None) or getattr(widget, "text", None)
+        if getter is not None:
+            self._field_getters[name] = getter
         self.add_content(widget)
 
+    @Slot()
     def _on_submit(self) -> None:
-        for name, widget in self._fields.items():
-            if hasattr(widget, "get_value"):
-                self._form_data[name] = widget.get_value()
-            elif hasattr(widget, "text"):
-                self._form_data[name] = widget.text()
+        self._form_data = {name: getter() for name, getter in self._field_getters.items()}
         self.accept()
 
     def get_data(self) -> dict[str, Any]:
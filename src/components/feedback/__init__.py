@@ -7,13 +7,29 @@ Contains feedback/notification components:
 - ProgressBar
 - Spinner
 - Toast
+
+Submodules are imported lazily on first attribute access (PEP 562).
 """
 
-from src.components.feedback.badge import Badge
-from src.components.feedback.tooltip import Tooltip
-from src.components.feedback.progress_bar import ProgressBar
-from src.components.feedback.spinner import Spinner
-from src.components.feedback.toast import Toast
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.components.feedback.badge import Badge
+    from src.components.feedback.tooltip import Tooltip
+    from src.components.feedback.progress_bar import ProgressBar
+    from src.components.feedback.spinner import Spinner
+    from src.components.feedback.toast import Toast
+
+_MODULES = {
+    "Badge": "src.components.feedback.badge",
+    "Tooltip": "src.components.feedback.tooltip",
+    "ProgressBar": "src.components.feedback.progress_bar",
+    "Spinner": "src.components.feedback.spinner",
+    "Toast": "src.components.feedback.toast",
+}
 
 __all__ = [
     "Badge",
@@ -22,3 +38,16 @@ __all__ = [
     "Spinner",
     "Toast",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
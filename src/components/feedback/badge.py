@@ -1,43 +1,37 @@
 """Badge component."""
 from __future__ import annotations
-from PySide6.QtWidgets import QWidget, QLabel, QHBoxLayout
-from src.components.base import BaseComponent
+from PySide6.QtWidgets import QWidget, QLabel
+from src.components.base import PropsMixin, declare_props, repolish
 
+# Variants with a matching QSS rule (QLabel[class="badge"][variant="..."])
+_VARIANTS = ("primary", "success", "warning", "danger", "info")
 
-class Badge(BaseComponent):
+
+@declare_props(text="", variant="primary")
+class Badge(QLabel, PropsMixin):
     """Badge for status indicators."""
 
+    _p_text: str
+    _p_variant: str
+
     def __init__(self, text: str = "", parent: QWidget | None = None, **kwargs) -> None:
         kwargs.setdefault("text", text)
 
-        kwargs.setdefault("variant", "primary")
-
-        super().__init__(parent, **kwargs)
+        super().__init__(kwargs["text"], parent)
+        self._init_props(**kwargs)
 
     def _setup_ui(self) -> None:
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        self._label = QLabel(self.get_prop("text", ""))
-        self._apply_styles()
-        layout.addWidget(self._label)
+        self.setProperty("class", "badge")
 
     def _apply_styles(self) -> None:
-        colors = {
-            "primary": ("#0078D4", "white"),
-            "success": ("#28A745", "white"),
-            "warning": ("#FFC107", "black"),
-            "danger": ("#DC3545", "white"),
-            "info": ("#17A2B8", "white"),
-        }
-        variant = self.get_prop("variant", "primary")
-        bg, fg = colors.get(variant, colors["primary"])
-        self._label.setStyleSheet(f"""
-            QLabel {{ background: {bg}; color: {fg}; padding: 4px 12px; border-radius: 12px; font-size: 12px; font-weight: bold; }}
-        """)
+        variant = self._p_variant
+        self.setProperty("variant", variant if variant in _VARIANTS else "primary")
+        if self._is_initialized:
+            repolish(self)
 
     def set_text(self, text: str) -> None:
         self.set_prop("text", text)
-        self._label.setText(text)
+        self.setText(text)
 
     def set_variant(self, variant: str) -> None:
         self.set_prop("variant", variant)
@@ -1,35 +1,33 @@
 """Progress bar component."""
 from __future__ import annotations
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QProgressBar as QPB
-from src.components.base import BaseComponent
+from PySide6.QtWidgets import QWidget, QProgressBar as QPB
+from PySide6.QtCore import Signal
+from src.components.base import PropsMixin, declare_props
 
 
-class ProgressBar(BaseComponent):
+@declare_props(value=0, show_text=True)
+class ProgressBar(QPB, PropsMixin):
     """Progress indicator."""
 
-    def __init__(self, parent: QWidget | None = None, **kwargs) -> None:
-        kwargs.setdefault("value", 0)
+    value_changed = Signal(int)
 
-        kwargs.setdefault("show_text", True)
+    _p_value: int
+    _p_show_text: bool
 
-        super().__init__(parent, **kwargs)
+    def __init__(self, parent: QWidget | None = None, **kwargs) -> None:
+        super().__init__(parent)
+        self._init_props(**kwargs)
 
     def _setup_ui(self) -> None:
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        self._progress = QPB()
-        self._progress.setValue(self.get_prop("value", 0))
-        self._progress.setTextVisible(self.get_prop("show_text", True))
-        self._progress.setStyleSheet("""
-            QProgressBar { border: none; border-radius: 8px; background: #e9ecef; text-align: center; min-height: 20px; }
-            QProgressBar::chunk { background: #0078D4; border-radius: 8px; }
-        """)
-        layout.addWidget(self._progress)
+        self.setValue(self._p_value)
+        self.setTextVisible(self._p_show_text)
 
     def set_value(self, value: int) -> None:
+        if value == self.value():
+            return
         self.set_prop("value", value)
-        self._progress.setValue(value)
+        self.setValue(value)
         self.value_changed.emit(value)
 
     def get_value(self) -> int:
-        return self._progress.value()
+        return self.value()
@@ -1,43 +1,100 @@
 """Spinner component."""
 from __future__ import annotations
-from PySide6.QtWidgets import QWidget, QLabel, QVBoxLayout
-from PySide6.QtCore import QTimer, Qt
+from typing import ClassVar
+from PySide6.QtWidgets import QWidget
+from PySide6.QtCore import QEvent, QPointF, QRectF, QTimer, Qt
+from PySide6.QtGui import QPainter, QPalette, QPixmap
 from src.components.base import BaseComponent
 
 
 class Spinner(BaseComponent):
-    """Loading spinner."""
+    """
+    Loading spinner.
+
+    The glyph is rendered once into a pixmap (colored by the theme's
+    `QWidget[class="spinner"]` rule) and painted rotated on each tick.
+    All running spinners share a single timer.
+    """
+
+    _GLYPH = "⟳"
+    _INTERVAL_MS = 100
+
+    _global_timer: ClassVar[QTimer | None] = None
+    _active: ClassVar[set[Spinner]] = set()
 
     def __init__(self, parent: QWidget | None = None, **kwargs) -> None:
         kwargs.setdefault("size", 32)
 
         super().__init__(parent, **kwargs)
         self._angle = 0
-        self._timer = QTimer(self)
-        self._timer.timeout.connect(self._rotate)
+        # Deleted spinners must not stay in the shared tick set
+        self.destroyed.connect(lambda: Spinner._active.discard(self))
 
     def _setup_ui(self) -> None:
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
         size = self.get_prop("size", 32)
-        self._label = QLabel("⟳")
-        self._label.setFixedSize(size, size)
-        self._label.setAlignment(Qt.AlignCenter)
-        self._label.setStyleSheet(f"font-size: {size}px; color: #0078D4;")
-        layout.addWidget(self._label, alignment=Qt.AlignCenter)
+        self.setFixedSize(size, size)
+        self.setProperty("class", "spinner")
+        self._base_pixmap: QPixmap | None = None
+
+    def _render_base_pixmap(self) -> QPixmap:
+        size = self.get_prop("size", 32)
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(round(size * ratio), round(size * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        font = self.font()
+        # Slightly smaller than the widget so rotated corners don't clip
+        font.setPixelSize(round(size * 0.8))
+        painter.setFont(font)
+        painter.setPen(self.palette().color(QPalette.WindowText))
+        painter.drawText(QRectF(0, 0, size, size), Qt.AlignCenter, self._GLYPH)
+        painter.end()
+        return pixmap
+
+    def changeEvent(self, event: QEvent) -> None:
+        # Theme switches change the palette; re-render the glyph lazily
+        if event.type() in (QEvent.PaletteChange, QEvent.StyleChange):
+            self._base_pixmap = None
+        super().changeEvent(event)
+
+    def paintEvent(self, event) -> None:
+        if self._base_pixmap is None:
+            self._base_pixmap = self._render_base_pixmap()
+        half_w = self.width() / 2
+        half_h = self.height() / 2
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+        painter.translate(half_w, half_h)
+        painter.rotate(self._angle)
+        painter.drawPixmap(QPointF(-half_w, -half_h), self._base_pixmap)
+
+    @classmethod
+    def _tick_all(cls) -> None:
+        if not cls._active:
+            cls._global_timer.stop()
+            return
+        for spinner in cls._active:
+            spinner._rotate()
 
     def _rotate(self) -> None:
         self._angle = (self._angle + 30) % 360
-        self._label.setStyleSheet(f"""
-            font-size: {self.get_prop('size', 32)}px; color: #0078D4;
-            qproperty-text: '⟳';
-        """)
+        self.update()
 
     def start(self) -> None:
-        self._timer.start(100)
+        cls = Spinner
+        if cls._global_timer is None:
+            cls._global_timer = QTimer()
+            cls._global_timer.timeout.connect(cls._tick_all)
+        cls._active.add(self)
+        if not cls._global_timer.isActive():
+            cls._global_timer.start(self._INTERVAL_MS)
 
     def stop(self) -> None:
-        self._timer.stop()
+        cls = Spinner
+        cls._active.discard(self)
+        if not cls._active and cls._global_timer is not None:
+            cls._global_timer.stop()
 
     def is_spinning(self) -> bool:
-        return self._timer.isActive()
+        return self in Spinner._active
@@ -1,14 +1,38 @@
 """Toast notification component."""
 from __future__ import annotations
-from PySide6.QtWidgets import QWidget, QLabel, QVBoxLayout, QApplication
-from PySide6.QtCore import QTimer, Qt, QPropertyAnimation, QPoint
+import heapq
+from typing import ClassVar
+from PySide6.QtWidgets import QWidget, QLabel, QVBoxLayout
+from PySide6.QtCore import QTimer, Qt, QPropertyAnimation, QParallelAnimationGroup, QRect, Slot
 from PySide6.QtGui import QGuiApplication
+from shiboken6 import isValid
+
+_TOAST_COLORS = {"info": "#0078D4", "success": "#28A745", "warning": "#FFC107", "error": "#DC3545"}
+
+# Precomputed (window, label) stylesheets per toast type
+_TOAST_STYLES = {
+    toast_type: (
+        f"background: {bg}; border-radius: 8px;",
+        f"color: {'black' if toast_type == 'warning' else 'white'}; font-size: 14px;",
+    )
+    for toast_type, bg in _TOAST_COLORS.items()
+}
 
 
 class Toast(QWidget):
     """Toast notification."""
 
-    _instances: list[Toast] = []
+    # Vertical slots of visible toasts; freed indices are reused lowest-first
+    _slots: ClassVar[list[Toast | None]] = []
+    _free: ClassVar[list[int]] = []
+
+    # Available geometry of the primary screen, refreshed on screen changes
+    _cached_geo: ClassVar[QRect | None] = None
+    _geo_hooked: ClassVar[bool] = False
+
+    _FADE_MS = 150
+    # Toasts whose fade starts in the same event-loop turn share one group
+    _pending_fades: ClassVar[list[Toast]] = []
 
     def __init__(self, message: str, toast_type: str = "info", duration: int = 3000, parent: QWidget | None = None) -> None:
         super().__init__(parent, Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint | Qt.Tool)
@@ -16,35 +40,93 @@ class Toast(QWidget):
         self._toast_type = toast_type
         self._duration = duration
         self._setup_ui()
-        Toast._instances.append(self)
+        self._slot = Toast._acquire_slot(self)
 
     def _setup_ui(self) -> None:
-        colors = {"info": "#0078D4", "success": "#28A745", "warning": "#FFC107", "error": "#DC3545"}
-        bg = colors.get(self._toast_type, colors["info"])
-        fg = "black" if self._toast_type == "warning" else "white"
-        self.setStyleSheet(f"background: {bg}; border-radius: 8px;")
+        window_style, label_style = _TOAST_STYLES.get(self._toast_type, _TOAST_STYLES["info"])
+        self.setStyleSheet(window_style)
         layout = QVBoxLayout(self)
         layout.setContentsMargins(16, 12, 16, 12)
         label = QLabel(self._message)
-        label.setStyleSheet(f"color: {fg}; font-size: 14px;")
+        label.setStyleSheet(label_style)
         layout.addWidget(label)
         self.adjustSize()
+        self._opacity_anim = QPropertyAnimation(self, b"windowOpacity", self)
+        self._opacity_anim.setDuration(self._FADE_MS)
+        self._opacity_anim.setStartValue(1.0)
+        self._opacity_anim.setEndValue(0.0)
+
+    @classmethod
+    def _acquire_slot(cls, toast: Toast) -> int:
+        if cls._free:
+            index = heapq.heappop(cls._free)
+            cls._slots[index] = toast
+            return index
+        cls._slots.append(toast)
+        return len(cls._slots) - 1
+
+    @classmethod
+    def _release_slot(cls, index: int) -> None:
+        cls._slots[index] = None
+        heapq.heappush(cls._free, index)
+
+    @classmethod
+    def _ensure_geo_cache(cls) -> QRect | None:
+        if not cls._geo_hooked:
+            app = QGuiApplication.instance()
+            if app is not None:
+                app.primaryScreenChanged.connect(cls._invalidate_geo)
+                app.screenAdded.connect(cls._invalidate_geo)
+                app.screenRemoved.connect(cls._invalidate_geo)
+                cls._geo_hooked = True
+        if cls._cached_geo is None:
+            screen = QGuiApplication.primaryScreen()
+            if screen:
+                cls._cached_geo = screen.availableGeometry()
+        return cls._cached_geo
+
+    @classmethod
+    def _invalidate_geo(cls, *_args) -> None:
+        cls._cached_geo = None
 
     def show_toast(self) -> None:
-        screen = QGuiApplication.primaryScreen()
-        if screen:
-            geo = screen.availableGeometry()
+        geo = Toast._ensure_geo_cache()
+        if geo is not None:
             x = geo.right() - self.width() - 20
-            y = geo.bottom() - self.height() - 20 - (len(Toast._instances) - 1) * 60
+            y = geo.bottom() - self.height() - 20 - self._slot * 60
             self.move(x, y)
-        self.show()
+        # QWidget.show: the `show` classmethod below shadows it on Toast
+        super().show()
         QTimer.singleShot(self._duration, self._hide)
 
+    @Slot()
     def _hide(self) -> None:
-        if self in Toast._instances:
-            Toast._instances.remove(self)
-        self.close()
-        self.deleteLater()
+        if self._slot is None:
+            return
+        Toast._release_slot(self._slot)
+        self._slot = None
+        if not Toast._pending_fades:
+            QTimer.singleShot(0, Toast._start_pending_fades)
+        Toast._pending_fades.append(self)
+
+    @classmethod
+    def _start_pending_fades(cls) -> None:
+        toasts, cls._pending_fades = cls._pending_fades, []
+        group = QParallelAnimationGroup()
+        for toast in toasts:
+            group.addAnimation(toast._opacity_anim)
+        group.finished.connect(lambda: cls._finish_fades(group, toasts))
+        group.start()
+
+    @staticmethod
+    def _finish_fades(group: QParallelAnimationGroup, toasts: list[Toast]) -> None:
+        for toast in toasts:
+            # A toast may have been deleted by its owner while fading
+            if isValid(toast):
+                toast.close()
+                toast.deleteLater()
+        # Owns the toasts' animations since addAnimation
+        group.deleteLater()
 
     @classmethod
     def show(cls, message: str, toast_type: str = "info", duration: int = 3000) -> Toast:
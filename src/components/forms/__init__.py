@@ -7,13 +7,29 @@ Contains form input components:
 - Checkbox
 - RadioGroup
 - FormField
+
+Submodules are imported lazily on first attribute access (PEP 562).
 """
 
-from src.components.forms.text_input import TextInput
-from src.components.forms.select_input import SelectInput
-from src.components.forms.checkbox import Checkbox
-from src.components.forms.radio_group import RadioGroup
-from src.components.forms.form_field import FormField
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.components.forms.text_input import TextInput
+    from src.components.forms.select_input import SelectInput
+    from src.components.forms.checkbox import Checkbox
+    from src.components.forms.radio_group import RadioGroup
+    from src.components.forms.form_field import FormField
+
+_MODULES = {
+    "TextInput": "src.components.forms.text_input",
+    "SelectInput": "src.components.forms.select_input",
+    "Checkbox": "src.components.forms.checkbox",
+    "RadioGroup": "src.components.forms.radio_group",
+    "FormField": "src.components.forms.form_field",
+}
 
 __all__ = [
     "TextInput",
@@ -22,3 +38,16 @@ __all__ = [
     "RadioGroup",
     "FormField",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
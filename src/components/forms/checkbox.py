@@ -1,41 +1,43 @@
 """Checkbox component."""
 from __future__ import annotations
-from PySide6.QtWidgets import QWidget, QHBoxLayout, QCheckBox as QCB
-from PySide6.QtCore import Signal, Qt
-from src.components.base import BaseComponent
+from PySide6.QtWidgets import QWidget, QCheckBox as QCB
+from PySide6.QtCore import Signal, Slot
+from src.components.base import PropsMixin, declare_props
 
 
-class Checkbox(BaseComponent):
-    """Checkbox input with label."""
+@declare_props(label="", checked=False)
+class Checkbox(QCB, PropsMixin):
+    """
+    Checkbox input with label.
+
+    Emits `checked_changed(bool)` when toggled (the native `toggled` carries
+    the same value).
+    """
 
     checked_changed = Signal(bool)
 
+    _p_label: str
+    _p_checked: bool
+
     def __init__(self, label: str = "", parent: QWidget | None = None, **kwargs) -> None:
         kwargs.setdefault("label", label)
 
-        kwargs.setdefault("checked", False)
-
-        super().__init__(parent, **kwargs)
+        super().__init__(kwargs["label"], parent)
+        self._init_props(**kwargs)
 
     def _setup_ui(self) -> None:
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        self._checkbox = QCB(self.get_prop("label", ""))
-        self._checkbox.setChecked(self.get_prop("checked", False))
-        layout.addWidget(self._checkbox)
-        layout.addStretch()
+        self.setChecked(self._p_checked)
 
     def _setup_connections(self) -> None:
-        self._checkbox.stateChanged.connect(self._on_state_changed)
+        self.toggled.connect(self._on_toggled)
 
-    def _on_state_changed(self, state: int) -> None:
-        checked = state == Qt.Checked
+    @Slot(bool)
+    def _on_toggled(self, checked: bool) -> None:
         self.set_prop("checked", checked)
         self.checked_changed.emit(checked)
-        self.value_changed.emit(checked)
 
     def is_checked(self) -> bool:
-        return self._checkbox.isChecked()
+        return self.isChecked()
 
     def set_checked(self, checked: bool) -> None:
-        self._checkbox.setChecked(checked)
+        self.setChecked(checked)
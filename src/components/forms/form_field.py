@@ -24,24 +24,27 @@ class FormField(BaseComponent):
         if self.get_prop("required"):
             label_text += " *"
         self._label = QLabel(label_text)
-        self._label.setStyleSheet("font-weight: 500;")
+        self._label.setProperty("class", "field-label")
         self._label.setVisible(bool(self.get_prop("label")))
         self._layout.addWidget(self._label)
         self._content_layout = QVBoxLayout()
         self._content_layout.setContentsMargins(0, 0, 0, 0)
         self._layout.addLayout(self._content_layout)
+        self._content_widget: QWidget | None = None
         self._error_label = QLabel(self.get_prop("error", ""))
-        self._error_label.setStyleSheet("color: #dc3545; font-size: 12px;")
+        self._error_label.setProperty("class", "field-error")
         self._error_label.setVisible(bool(self.get_prop("error")))
         self._layout.addWidget(self._error_label)
 
     def set_content(self, widget: QWidget) -> None:
         """Set the form field content widget."""
-        while self._content_layout.count():
-            item = self._content_layout.takeAt(0)
-            if item.widget():
-                item.widget().setParent(None)
+        if widget is self._content_widget:
+            return
+        if self._content_widget is not None:
+            self._content_layout.removeWidget(self._content_widget)
+            self._content_widget.setParent(None)
         self._content_layout.addWidget(widget)
+        self._content_widget = widget
 
     def set_error(self, error: str) -> None:
         self.set_prop("error", error)
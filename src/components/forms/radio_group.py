@@ -1,7 +1,7 @@
 """Radio group component."""
 from __future__ import annotations
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QRadioButton, QButtonGroup
-from PySide6.QtCore import Signal
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QRadioButton, QButtonGroup, QAbstractButton
+from PySide6.QtCore import Signal, Slot
 from src.components.base import BaseComponent
 
 
@@ -23,10 +23,12 @@ class RadioGroup(BaseComponent):
         layout.setSpacing(8)
         self._button_group = QButtonGroup(self)
         self._buttons: dict[str, QRadioButton] = {}
+        self._values_by_button: dict[QAbstractButton, str] = {}
         for option in self.get_prop("options", []):
             radio = QRadioButton(option.get("label", ""))
             value = option.get("value", "")
             self._buttons[value] = radio
+            self._values_by_button[radio] = value
             self._button_group.addButton(radio)
             if value == self.get_prop("value"):
                 radio.setChecked(True)
@@ -35,32 +37,46 @@ class RadioGroup(BaseComponent):
     def _setup_connections(self) -> None:
         self._button_group.buttonClicked.connect(self._on_button_clicked)
 
-    def _on_button_clicked(self, button: QRadioButton) -> None:
-        for value, btn in self._buttons.items():
-            if btn == button:
-                self.set_prop("value", value)
-                self.selection_changed.emit(value)
-                self.value_changed.emit(value)
-                break
+    @Slot(QAbstractButton)
+    def _on_button_clicked(self, button: QAbstractButton) -> None:
+        value = self._values_by_button.get(button)
+        if value is None or value == self.get_prop("value"):
+            return
+        self.set_prop("value", value)
+        self._emit("selection_changed", value)
+        self._emit("value_changed", value)
 
     def get_value(self) -> str:
-        for value, btn in self._buttons.items():
-            if btn.isChecked():
-                return value
-        return ""
+        return self._values_by_button.get(self._button_group.checkedButton(), "")
 
     def set_options(self, options: list) -> None:
-        # Clear existing
-        for btn in self._buttons.values():
-            self._button_group.removeButton(btn)
-            btn.deleteLater()
-        self._buttons.clear()
-        self.set_prop("options", options)
-        # Rebuild
-        layout = self.layout()
-        for option in options:
-            radio = QRadioButton(option.get("label", ""))
-            value = option.get("value", "")
-            self._buttons[value] = radio
-            self._button_group.addButton(radio)
-            layout.addWidget(radio)
+        self.setUpdatesEnabled(False)
+        self._button_group.blockSignals(True)
+        try:
+            with self.batch_signals():
+                # Remove all existing buttons first, then add the new ones
+                for btn in self._buttons.values():
+                    self._button_group.removeButton(btn)
+                    btn.deleteLater()
+                self._buttons.clear()
+                self._values_by_button.clear()
+                self.set_prop("options", options)
+                # The rebuilt buttons start unchecked; report a dropped
+                # selection once, when the batch closes
+                if self.get_prop("value"):
+                    self.set_prop("value", "")
+                    self._emit("selection_changed", "")
+                    self._emit("value_changed", "")
+                for option in options:
+                    radio = QRadioButton(option.get("label", ""))
+                    value = option.get("value", "")
+                    self._buttons[value] = radio
+                    self._values_by_button[radio] = value
+                    self._button_group.addButton(radio)
+                layout = self.layout()
+                for radio in self._buttons.values():
+                    layout.addWidget(radio)
+        finally:
+            self._button_group.blockSignals(False)
+            self.setUpdatesEnabled(True)
+        self.layout().activate()
@@ -1,44 +1,52 @@
 """Select input component."""
 from __future__ import annotations
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QComboBox
-from PySide6.QtCore import Signal
-from src.components.base import BaseComponent
+from PySide6.QtCore import Qt, Signal, Slot
+from PySide6.QtGui import QStandardItem, QStandardItemModel
+from src.components.base import BaseComponent, declare_props
 
 
+@declare_props(label="", options=[], value="")
 class SelectInput(BaseComponent):
     """Dropdown select input."""
 
     selection_changed = Signal(str)
 
+    _p_label: str
+    _p_options: list
+    _p_value: str
+
     def __init__(self, label: str = "", parent: QWidget | None = None, **kwargs) -> None:
         kwargs.setdefault("label", label)
 
-        kwargs.setdefault("options", [])
-
-        kwargs.setdefault("value", "")
-
         super().__init__(parent, **kwargs)
 
     def _setup_ui(self) -> None:
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(4)
-        self._label = QLabel(self.get_prop("label", ""))
-        self._label.setStyleSheet("font-weight: 500;")
-        self._label.setVisible(bool(self.get_prop("label")))
+        self._label = QLabel(self._p_label)
+        self._label.setProperty("class", "field-label")
+        self._label.setVisible(bool(self._p_label))
         layout.addWidget(self._label)
         self._combo = QComboBox()
-        self._combo.setStyleSheet("""
-            QComboBox { border: 1px solid #e0e0e0; border-radius: 6px; padding: 10px 12px; }
-            QComboBox:focus { border-color: #0078D4; }
-        """)
-        for option in self.get_prop("options", []):
-            self._combo.addItem(option.get("label", ""), option.get("value", ""))
+        self._populate(self._p_options)
         layout.addWidget(self._combo)
 
+    def _populate(self, options: list) -> None:
+        # Fill a detached model and install it once, instead of one
+        # rowsInserted/layout pass per addItem
+        model = QStandardItemModel(self._combo)
+        for option in options:
+            item = QStandardItem(option.get("label", ""))
+            item.setData(option.get("value", ""), Qt.UserRole)
+            model.appendRow(item)
+        self._combo.setModel(model)
+
     def _setup_connections(self) -> None:
         self._combo.currentIndexChanged.connect(self._on_selection_changed)
 
+    @Slot(int)
     def _on_selection_changed(self, index: int) -> None:
         value = self._combo.currentData()
         self.set_prop("value", value)
@@ -49,6 +57,11 @@ class SelectInput(BaseComponent):
         return self._combo.currentData()
 
     def set_options(self, options: list) -> None:
-        self._combo.clear()
-        for option in options:
-            self._combo.addItem(option.get("label", ""), option.get("value", ""))
+        previous = self._combo.currentData()
+        self._combo.blockSignals(True)
+        try:
+            self._populate(options)
+        finally:
+            self._combo.blockSignals(False)
+        if self._combo.currentData() != previous:
+            self._on_selection_changed(self._combo.currentIndex())
@@ -1,52 +1,50 @@
 """Text input component."""
 from __future__ import annotations
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QLineEdit
-from PySide6.QtCore import Signal
-from src.components.base import BaseComponent
+from PySide6.QtCore import Signal, Slot
+from src.components.base import BaseComponent, declare_props, repolish
 
 
+@declare_props(label="", placeholder="", value="", required=False, error="")
 class TextInput(BaseComponent):
     """Text input field with label and validation."""
 
     text_changed = Signal(str)
 
+    _p_label: str
+    _p_placeholder: str
+    _p_value: str
+    _p_required: bool
+    _p_error: str
+
     def __init__(self, label: str = "", parent: QWidget | None = None, **kwargs) -> None:
         kwargs.setdefault("label", label)
 
-        kwargs.setdefault("placeholder", "")
-
-        kwargs.setdefault("value", "")
-
-        kwargs.setdefault("required", False)
-
-        kwargs.setdefault("error", "")
-
         super().__init__(parent, **kwargs)
 
     def _setup_ui(self) -> None:
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(4)
-        self._label = QLabel(self.get_prop("label", ""))
-        self._label.setStyleSheet("font-weight: 500;")
-        self._label.setVisible(bool(self.get_prop("label")))
+        self._label = QLabel(self._p_label)
+        self._label.setProperty("class", "field-label")
+        self._label.setVisible(bool(self._p_label))
         layout.addWidget(self._label)
         self._input = QLineEdit()
-        self._input.setPlaceholderText(self.get_prop("placeholder", ""))
-        self._input.setText(self.get_prop("value", ""))
-        self._input.setStyleSheet("""
-            QLineEdit { border: 1px solid #e0e0e0; border-radius: 6px; padding: 10px 12px; }
-            QLineEdit:focus { border-color: #0078D4; }
-        """)
+        self._input.setPlaceholderText(self._p_placeholder)
+        self._input.setText(self._p_value)
+        # Border color for QLineEdit[error="true"] comes from the theme QSS
+        self._input.setProperty("error", bool(self._p_error))
         layout.addWidget(self._input)
-        self._error_label = QLabel(self.get_prop("error", ""))
-        self._error_label.setStyleSheet("color: #dc3545; font-size: 12px;")
-        self._error_label.setVisible(bool(self.get_prop("error")))
+        self._error_label = QLabel(self._p_error)
+        self._error_label.setProperty("class", "field-error")
+        self._error_label.setVisible(bool(self._p_error))
         layout.addWidget(self._error_label)
 
     def _setup_connections(self) -> None:
         self._input.textChanged.connect(self._on_text_changed)
 
+    @Slot(str)
     def _on_text_changed(self, text: str) -> None:
         self.set_prop("value", text)
         self.text_changed.emit(text)
@@ -62,5 +60,6 @@ class TextInput(BaseComponent):
         self.set_prop("error", error)
         self._error_label.setText(error)
         self._error_label.setVisible(bool(error))
-        border_color = "#dc3545" if error else "#e0e0e0"
-        self._input.setStyleSheet(f"QLineEdit {{ border: 1px solid {border_color}; border-radius: 6px; padding: 10px 12px; }}")
+        if self._input.property("error") != bool(error):
+            self._input.setProperty("error", bool(error))
+            repolish(self._input)
@@ -0,0 +1,57 @@
+"""
+On-disk cache for rasterized icons.
+
+Pixmaps are stored as PNG files under the application data directory, so
+icons whose rendering is expensive (style/theme lookups, SVG engines) are
+only rasterized once per size across launches.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Callable
+
+from PySide6.QtGui import QPixmap
+
+from src.utils.helpers import ensure_dir_exists, get_app_data_dir
+
+
+def get_cache_dir() -> Path:
+    """Get the directory holding the cached icon PNGs."""
+    return get_app_data_dir() / "cache" / "icons"
+
+
+def load_cached(
+    key: str,
+    size: int,
+    producer: Callable[[], QPixmap],
+    ratio: float = 1.0,
+) -> QPixmap:
+    """
+    Load a rasterized icon from the disk cache, rendering it on a miss.
+
+    Args:
+        key: Identifier that is stable across processes (not `QIcon.cacheKey()`)
+        size: Logical icon size in pixels
+        producer: Renders the pixmap when it is not cached yet
+        ratio: Device pixel ratio the pixmap is rendered for
+
+    Returns:
+        The cached or freshly rendered pixmap
+    """
+    path = get_cache_dir() / f"{key}_{size}@{ratio:g}x.png"
+    if path.is_file():
+        pixmap = QPixmap(str(path))
+        if not pixmap.isNull():
+            # PNG files don't carry the device pixel ratio
+            pixmap.setDevicePixelRatio(ratio)
+            return pixmap
+
+    pixmap = producer()
+    if not pixmap.isNull():
+        try:
+            ensure_dir_exists(path.parent)
+        except OSError:
+            return pixmap
+        pixmap.save(str(path), "PNG")
+    return pixmap
@@ -1,20 +1,61 @@
 """Icon component."""
 from __future__ import annotations
-from PySide6.QtWidgets import QWidget, QLabel, QVBoxLayout, QStyle
-from PySide6.QtGui import QIcon, QPixmap
+from typing import TYPE_CHECKING
+from PySide6.QtWidgets import QApplication, QWidget, QLabel, QVBoxLayout
+from PySide6.QtGui import QIcon, QPixmap, QPixmapCache
 from PySide6.QtCore import Qt, QSize
-from src.components.base import BaseComponent
+from src.components.base import BaseComponent, declare_props
+from src.components.icons._cache import load_cached
 
+if TYPE_CHECKING:
+    from PySide6.QtWidgets import QStyle
 
+# Standard icons resolved from the application style, one per StandardPixmap
+_STD_ICON_CACHE: dict[QStyle.StandardPixmap, QIcon] = {}
+
+
+def _get_pixmap(icon: QIcon, size: int, disk_key: str | None = None) -> QPixmap:
+    """
+    Rasterize `icon` at `size`, sharing the result through QPixmapCache.
+
+    With a `disk_key`, misses are served from (and stored to) the on-disk
+    icon cache before falling back to rendering the icon.
+    """
+    key = f"icon:{icon.cacheKey()}:{size}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None:
+        if disk_key is None:
+            pixmap = icon.pixmap(QSize(size, size))
+        else:
+            pixmap = load_cached(
+                disk_key,
+                size,
+                lambda: icon.pixmap(QSize(size, size)),
+                QApplication.instance().devicePixelRatio(),
+            )
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+@declare_props(icon=None, size=24, color="", cache_key=None)
 class Icon(BaseComponent):
-    """Icon display component."""
+    """
+    Icon display component.
 
-    def __init__(self, icon: QIcon | None = None, parent: QWidget | None = None, **kwargs) -> None:
-        kwargs.setdefault("icon", icon)
+    Props:
+        icon: Icon to display
+        size: Icon size in pixels
+        color: Icon color
+        cache_key: Stable key for the on-disk pixmap cache (set by `from_standard`)
+    """
 
-        kwargs.setdefault("size", 24)
+    _p_icon: QIcon | None
+    _p_size: int
+    _p_color: str
+    _p_cache_key: str | None
 
-        kwargs.setdefault("color", "")
+    def __init__(self, icon: QIcon | None = None, parent: QWidget | None = None, **kwargs) -> None:
+        kwargs.setdefault("icon", icon)
 
         super().__init__(parent, **kwargs)
 
@@ -22,35 +63,35 @@ class Icon(BaseComponent):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         self._label = QLabel()
-        size = self.get_prop("size", 24)
+        size = self._p_size
         self._label.setFixedSize(size, size)
         self._label.setAlignment(Qt.AlignCenter)
-        icon = self.get_prop("icon")
+        icon = self._p_icon
         if icon:
-            pixmap = icon.pixmap(QSize(size, size))
-            self._label.setPixmap(pixmap)
+            self._label.setPixmap(_get_pixmap(icon, size, self._p_cache_key))
         layout.addWidget(self._label)
 
     def set_icon(self, icon: QIcon) -> None:
+        self.set_prop("cache_key", None)
         self.set_prop("icon", icon)
-        size = self.get_prop("size", 24)
-        pixmap = icon.pixmap(QSize(size, size))
-        self._label.setPixmap(pixmap)
+        self._label.setPixmap(_get_pixmap(icon, self._p_size))
 
     def set_size(self, size: int) -> None:
         self.set_prop("size", size)
         self._label.setFixedSize(size, size)
-        icon = self.get_prop("icon")
+        icon = self._p_icon
         if icon:
-            pixmap = icon.pixmap(QSize(size, size))
-            self._label.setPixmap(pixmap)
+            self._label.setPixmap(_get_pixmap(icon, size, self._p_cache_key))
 
     @staticmethod
     def from_standard(style_icon: QStyle.StandardPixmap, size: int = 24) -> Icon:
         """Create icon from Qt standard icon."""
-        from PySide6.QtWidgets import QApplication
         app = QApplication.instance()
-        if app:
-            icon = app.style().standardIcon(style_icon)
-            return Icon(icon=icon, size=size)
-        return Icon(size=size)
+        if not app:
+            return Icon(size=size)
+        icon = _STD_ICON_CACHE.get(style_icon)
+        if icon is None:
+            icon = _STD_ICON_CACHE[style_icon] = app.style().standardIcon(style_icon)
+        # Standard icons depend on the style, so it is part of the disk key
+        cache_key = f"std-{app.style().name()}-{style_icon.value}"
+        return Icon(icon=icon, size=size, cache_key=cache_key)
@@ -10,7 +10,6 @@ from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QScrollArea,
-    QFrame,
 )
 
 from src.components.base import BaseComponent
@@ -44,51 +43,61 @@ class ContentArea(BaseComponent):
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
 
+        # The scroll area/content widget are built on first use
+        self._scroll: QScrollArea | None = None
+        self._content: QWidget | None = None
+        self._content_layout: QVBoxLayout | None = None
+
+    def _ensure_content(self) -> QVBoxLayout:
+        """Build the content widget (and scroll area) if not built yet."""
+        if self._content_layout is not None:
+            return self._content_layout
+
+        self._content = QWidget()
+        self._content_layout = QVBoxLayout(self._content)
+        padding = self.get_prop("padding", 24)
+        self._content_layout.setContentsMargins(padding, padding, padding, padding)
+        self._content_layout.setSpacing(16)
+
         if self.get_prop("scrollable", True):
             # Scroll area
             self._scroll = QScrollArea()
             self._scroll.setWidgetResizable(True)
-            self._scroll.setFrameShape(QFrame.NoFrame)
-
-            # Content widget
-            self._content = QWidget()
-            self._content_layout = QVBoxLayout(self._content)
-            padding = self.get_prop("padding", 24)
-            self._content_layout.setContentsMargins(padding, padding, padding, padding)
-            self._content_layout.setSpacing(16)
-
+            self._scroll.setFrameShape(QScrollArea.NoFrame)
             self._scroll.setWidget(self._content)
-            layout.addWidget(self._scroll)
+            self.layout().addWidget(self._scroll)
         else:
             # Direct content widget
-            self._content = QWidget()
-            self._content_layout = QVBoxLayout(self._content)
-            padding = self.get_prop("padding", 24)
-            self._content_layout.setContentsMargins(padding, padding, padding, padding)
-            self._content_layout.setSpacing(16)
+            self.layout().addWidget(self._content)
 
-            layout.addWidget(self._content)
+        return self._content_layout
 
     def add_widget(self, widget: QWidget) -> None:
         """Add a widget to the content area."""
-        self._content_layout.addWidget(widget)
+        self._ensure_content().addWidget(widget)
 
     def add_layout(self, layout) -> None:
         """Add a layout to the content area."""
-        self._content_layout.addLayout(layout)
+        self._ensure_content().addLayout(layout)
 
     def add_stretch(self) -> None:
         """Add stretch to content."""
-        self._content_layout.addStretch()
+        self._ensure_content().addStretch()
 
     def clear(self) -> None:
         """Clear all content."""
-        while self._content_layout.count():
-            item = self._content_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        if self._content is None:
+            return
+        # Drop the whole content subtree at once; it is rebuilt on next use
+        outer = self._scroll if self._scroll is not None else self._content
+        self.layout().removeWidget(outer)
+        outer.hide()
+        outer.deleteLater()
+        self._scroll = None
+        self._content = None
+        self._content_layout = None
 
     @property
     def content_layout(self) -> QVBoxLayout:
         """Get the content layout."""
-        return self._content_layout
+        return self._ensure_content()
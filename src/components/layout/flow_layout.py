@@ -7,7 +7,9 @@ Similar to CSS flexbox with flex-wrap: wrap.
 
 from __future__ import annotations
 
-from PySide6.QtWidgets import QLayout, QWidgetItem, QSizePolicy, QWidget
+from collections import OrderedDict
+
+from PySide6.QtWidgets import QLayout, QWidgetItem, QWidget
 from PySide6.QtCore import Qt, QRect, QSize, QPoint
 
 
@@ -32,10 +34,17 @@ class FlowLayout(QLayout):
         self._items: list[QWidgetItem] = []
         self._h_spacing = h_spacing
         self._v_spacing = v_spacing
+        # heightForWidth results by width; cleared whenever the layout changes
+        self._hfw_cache: OrderedDict[int, int] = OrderedDict()
+        self._min_size_cache: QSize | None = None
+
+    _HFW_CACHE_SIZE = 16
 
     def addItem(self, item: QWidgetItem) -> None:
         """Add an item to the layout."""
         self._items.append(item)
+        self._hfw_cache.clear()
+        self._min_size_cache = None
 
     def count(self) -> int:
         """Return number of items in layout."""
@@ -50,6 +59,8 @@ class FlowLayout(QLayout):
     def takeAt(self, index: int) -> QWidgetItem | None:
         """Remove and return item at index."""
         if 0 <= index < len(self._items):
+            self._hfw_cache.clear()
+            self._min_size_cache = None
             return self._items.pop(index)
         return None
 
@@ -63,7 +74,22 @@ class FlowLayout(QLayout):
 
     def heightForWidth(self, width: int) -> int:
         """Calculate the height needed for the given width."""
-        return self._do_layout(QRect(0, 0, width, 0), test_only=True)
+        cache = self._hfw_cache
+        height = cache.get(width)
+        if height is not None:
+            cache.move_to_end(width)
+            return height
+        height = self._do_layout(QRect(0, 0, width, 0), test_only=True)
+        cache[width] = height
+        if len(cache) > self._HFW_CACHE_SIZE:
+            cache.popitem(last=False)
+        return height
+
+    def invalidate(self) -> None:
+        """Drop cached sizes; Qt calls this when child size hints change."""
+        self._hfw_cache.clear()
+        self._min_size_cache = None
+        super().invalidate()
 
     def setGeometry(self, rect: QRect) -> None:
         """Set the geometry of the layout."""
@@ -76,13 +102,17 @@ class FlowLayout(QLayout):
 
     def minimumSize(self) -> QSize:
         """Return the minimum size."""
+        if self._min_size_cache is not None:
+            return QSize(self._min_size_cache)
+
         size = QSize()
         for item in self._items:
             size = size.expandedTo(item.minimumSize())
 
         margins = self.contentsMargins()
         size += QSize(margins.left() + margins.right(), margins.top() + margins.bottom())
-        return size
+        self._min_size_cache = size
+        return QSize(size)
 
     def _do_layout(self, rect: QRect, test_only: bool) -> int:
         """
@@ -98,32 +128,39 @@ class FlowLayout(QLayout):
         margins = self.contentsMargins()
         effective_rect = rect.adjusted(margins.left(), margins.top(), -margins.right(), -margins.bottom())
 
-        x = effective_rect.x()
+        left = effective_rect.x()
+        right = effective_rect.right() + 1
+        h_spacing = self._h_spacing
+        v_spacing = self._v_spacing
+        x = left
         y = effective_rect.y()
         line_height = 0
 
         for item in self._items:
-            widget = item.widget()
-            if widget is None or not widget.isVisible():
+            # Skip explicitly hidden widgets, like Qt's own layouts
+            if item.widget() is None or item.isEmpty():
                 continue
 
             # Get the size hint for this item
             item_size = item.sizeHint()
+            width = item_size.width()
 
             # Check if we need to wrap to next line
-            next_x = x + item_size.width()
-            if next_x > effective_rect.right() + 1 and line_height > 0:
+            next_x = x + width
+            if next_x > right and line_height > 0:
                 # Wrap to next line
-                x = effective_rect.x()
-                y = y + line_height + self._v_spacing
-                next_x = x + item_size.width()
+                x = left
+                y = y + line_height + v_spacing
+                next_x = x + width
                 line_height = 0
 
             if not test_only:
                 item.setGeometry(QRect(QPoint(x, y), item_size))
 
-            x = next_x + self._h_spacing
-            line_height = max(line_height, item_size.height())
+            x = next_x + h_spacing
+            height = item_size.height()
+            if height > line_height:
+                line_height = height
 
         return y + line_height - rect.y() + margins.bottom()
 
@@ -11,11 +11,11 @@ from PySide6.QtWidgets import (
     QHBoxLayout,
     QLabel,
 )
-from PySide6.QtCore import Qt
 
-from src.components.base import BaseComponent
+from src.components.base import BaseComponent, declare_props
 
 
+@declare_props(text="", show_version=True)
 class Footer(BaseComponent):
     """
     Application footer component.
@@ -30,6 +30,9 @@ class Footer(BaseComponent):
         show_version: Show version info
     """
 
+    _p_text: str
+    _p_show_version: bool
+
     def __init__(
         self,
         text: str = "",
@@ -49,17 +52,17 @@ class Footer(BaseComponent):
         layout.setContentsMargins(16, 0, 16, 0)
 
         # Status text
-        self._status_label = QLabel(self.get_prop("text", "Ready"))
-        self._status_label.setStyleSheet("color: #666; font-size: 12px;")
+        self._status_label = QLabel(self._p_text)
+        self._status_label.setProperty("class", "footer-status")
         layout.addWidget(self._status_label)
 
         # Stretch
         layout.addStretch()
 
         # Version
-        if self.get_prop("show_version", True):
+        if self._p_show_version:
             version_label = QLabel("v1.0.0")
-            version_label.setStyleSheet("color: #888; font-size: 11px;")
+            version_label.setProperty("class", "footer-version")
             layout.addWidget(version_label)
 
     def set_status(self, text: str) -> None:
@@ -6,14 +6,16 @@ A 12-column grid system similar to Bootstrap for responsive layouts.
 
 from __future__ import annotations
 
-from typing import List, Optional
+from contextlib import contextmanager
+from typing import Any, Iterator, List, Optional
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QFrame,
+    QGridLayout,
     QSizePolicy,
 )
-from PySide6.QtCore import Qt, QSize
+from PySide6.QtCore import QSize, QTimer, Qt
 
 from src.components.base import BaseComponent
 from src.components.layout.flow_layout import FlowLayout
@@ -42,6 +44,9 @@ class GridColumn(QFrame):
         'xl': 1200,
     }
 
+    # (name, min width) from the widest breakpoint down; computed once
+    _SORTED_BPS = tuple(sorted(BREAKPOINTS.items(), key=lambda bp: bp[1], reverse=True))
+
     def __init__(
         self,
         span: int = 12,
@@ -67,16 +72,13 @@ class GridColumn(QFrame):
         super().__init__(parent)
 
         self._default_span = max(1, min(12, span))
-        self._responsive_spans = {
-            'xs': xs,
-            'sm': sm,
-            'md': md,
-            'lg': lg,
-            'xl': xl,
-        }
+        # Spans in _SORTED_BPS order (xl, lg, md, sm, xs)
+        self._responsive_spans = (xl, lg, md, sm, xs)
         self._current_span = self._default_span
         self._container_width = 1200
         self._spacing = 16
+        # Arguments of the last update_size_for_container call
+        self._last_update: tuple[int, int] | None = None
 
         self._layout = QVBoxLayout(self)
         self._layout.setContentsMargins(0, 0, 0, 0)
@@ -97,18 +99,16 @@ class GridColumn(QFrame):
     def get_span_for_width(self, container_width: int) -> int:
         """Get the column span for a given container width."""
         # Determine which breakpoint we're at
-        current_breakpoint = 'xs'
-        for bp, width in sorted(self.BREAKPOINTS.items(), key=lambda x: x[1], reverse=True):
+        start_index = len(self._SORTED_BPS) - 1
+        for index, (_, width) in enumerate(self._SORTED_BPS):
             if container_width >= width:
-                current_breakpoint = bp
+                start_index = index
                 break
 
         # Check breakpoints from current down to xs
-        breakpoint_order = ['xl', 'lg', 'md', 'sm', 'xs']
-        start_index = breakpoint_order.index(current_breakpoint)
-
-        for bp in breakpoint_order[start_index:]:
-            span = self._responsive_spans.get(bp)
+        spans = self._responsive_spans
+        for index in range(start_index, len(spans)):
+            span = spans[index]
             if span is not None:
                 return span
 
@@ -116,6 +116,9 @@ class GridColumn(QFrame):
 
     def update_size_for_container(self, container_width: int, spacing: int = 16) -> None:
         """Update the column's size based on container width."""
+        if self._last_update == (container_width, spacing):
+            return
+        self._last_update = (container_width, spacing)
         self._container_width = max(100, container_width)
         self._spacing = spacing
         self._current_span = self.get_span_for_width(container_width)
@@ -130,7 +133,9 @@ class GridColumn(QFrame):
         width = int(column_unit * self._current_span) - spacing
         width = max(100, width)
 
-        self.setFixedWidth(width)
+        # setFixedWidth posts a LayoutRequest even when nothing changes
+        if self.minimumWidth() != width or self.maximumWidth() != width:
+            self.setFixedWidth(width)
 
     def sizeHint(self) -> QSize:
         """Return the preferred size based on current span."""
@@ -164,32 +169,88 @@ class GridRow(QFrame):
     A row in the grid system that contains columns.
 
     Uses FlowLayout for automatic wrapping when columns exceed available width.
+    In uniform mode (every column has the same spans) a QGridLayout is used
+    instead and re-filled only when the number of columns per line changes.
     """
 
-    def __init__(self, parent: QWidget | None = None, spacing: int = 16) -> None:
+    def __init__(
+        self,
+        parent: QWidget | None = None,
+        spacing: int = 16,
+        uniform: bool = False,
+    ) -> None:
         """
         Initialize a grid row.
 
         Args:
             parent: Parent widget
             spacing: Spacing between columns
+            uniform: All columns share the same spans (enables QGridLayout)
         """
         super().__init__(parent)
 
         self._columns: List[GridColumn] = []
         self._spacing = spacing
         self._container_width = 0
-
-        # Use FlowLayout for automatic wrapping
-        self._flow_layout = FlowLayout(self, h_spacing=spacing, v_spacing=spacing)
-        self._flow_layout.setContentsMargins(0, 0, 0, 0)
+        self._uniform = uniform
+        self._per_line = 0
+
+        if uniform:
+            self._flow_layout = None
+            self._grid_layout = QGridLayout(self)
+            self._grid_layout.setContentsMargins(0, 0, 0, 0)
+            self._grid_layout.setSpacing(spacing)
+            # Pack cells to the top-left like FlowLayout does
+            self._grid_layout.setAlignment(Qt.AlignLeft | Qt.AlignTop)
+        else:
+            # Use FlowLayout for automatic wrapping
+            self._grid_layout = None
+            self._flow_layout = FlowLayout(self, h_spacing=spacing, v_spacing=spacing)
+            self._flow_layout.setContentsMargins(0, 0, 0, 0)
+
+        # Coalesces the resize events of one event-loop pass into one update
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(0)
+        self._resize_timer.timeout.connect(self._update_column_sizes)
 
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
 
+    @property
+    def uniform_mode(self) -> bool:
+        """Whether the row lays out identical columns with a QGridLayout."""
+        return self._uniform
+
+    def _columns_per_line(self) -> int:
+        """Number of uniform columns that fit on one line."""
+        first = self._columns[0]
+        if self._container_width <= 0:
+            return max(1, GridColumn.TOTAL_COLUMNS // first.current_span)
+        # Same fit rule as FlowLayout: columns plus the gaps between them
+        step = first.maximumWidth() + self._spacing
+        return max(1, (self._container_width + self._spacing) // step)
+
+    def _place_columns(self, force: bool = False) -> None:
+        """Fill the QGridLayout, re-adding cells only when the line length changes."""
+        if not self._columns:
+            return
+        per_line = self._columns_per_line()
+        if per_line == self._per_line and not force:
+            return
+        self._per_line = per_line
+        grid = self._grid_layout
+        for column in self._columns:
+            grid.removeWidget(column)
+        for index, column in enumerate(self._columns):
+            grid.addWidget(column, *divmod(index, per_line))
+
     def add_column(self, column: GridColumn) -> GridColumn:
         """Add a column to this row."""
         self._columns.append(column)
-        self._flow_layout.addWidget(column)
+        if self._uniform:
+            self._place_columns(force=True)
+        else:
+            self._flow_layout.addWidget(column)
         # Trigger initial sizing if we have a width
         if self._container_width > 0:
             self._update_column_sizes()
@@ -208,16 +269,49 @@ class GridRow(QFrame):
         column = GridColumn(span, xs, sm, md, lg, xl, self)
         return self.add_column(column)
 
+    def add_columns_bulk(self, specs: List[dict[str, Any]]) -> List[GridColumn]:
+        """
+        Create and add several columns with a single layout pass.
+
+        Args:
+            specs: One dict of `GridColumn` arguments (span, xs, sm, md, lg, xl) per column
+
+        Returns:
+            The created columns, in order
+        """
+        self.setUpdatesEnabled(False)
+        try:
+            columns = [GridColumn(parent=self, **spec) for spec in specs]
+            self._columns.extend(columns)
+            if self._uniform:
+                self._place_columns(force=True)
+            else:
+                for column in columns:
+                    self._flow_layout.addWidget(column)
+        finally:
+            self.setUpdatesEnabled(True)
+        if self._container_width > 0:
+            self._update_column_sizes()
+        else:
+            self.layout().invalidate()
+        return columns
+
     def _update_column_sizes(self) -> None:
         """Update column sizes based on current container width."""
         if self._container_width <= 0:
             return
 
-        for column in self._columns:
-            column.update_size_for_container(self._container_width, self._spacing)
-
-        # Force layout update
-        self._flow_layout.invalidate()
+        self.setUpdatesEnabled(False)
+        try:
+            for column in self._columns:
+                column.update_size_for_container(self._container_width, self._spacing)
+
+            if self._uniform:
+                self._place_columns()
+            # Force layout update
+            self.layout().invalidate()
+        finally:
+            self.setUpdatesEnabled(True)
         self.updateGeometry()
 
     def resizeEvent(self, event) -> None:
@@ -226,7 +320,7 @@ class GridRow(QFrame):
         new_width = event.size().width()
         if new_width > 0 and new_width != self._container_width:
             self._container_width = new_width
-            self._update_column_sizes()
+            self._resize_timer.start()
 
     def showEvent(self, event) -> None:
         """Handle show event to ensure proper initial sizing."""
@@ -265,13 +359,36 @@ class Grid(BaseComponent):
 
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
 
-    def add_row(self, spacing: int = 16) -> GridRow:
+    def add_row(self, spacing: int = 16, uniform: bool = False) -> GridRow:
         """Add a new row to the grid."""
-        row = GridRow(self, spacing)
+        row = GridRow(self, spacing, uniform)
         self._rows.append(row)
         self._layout.addWidget(row)
         return row
 
+    @contextmanager
+    def batch_updates(self) -> Iterator[None]:
+        """
+        Suspend repaints while rows/columns are being filled.
+
+        Usage:
+            with grid.batch_updates():
+                for ...:
+                    row.create_column(...).add_widget(...)
+
+        Geometry is recomputed once on exit. Nested blocks are merged into
+        the outermost one.
+        """
+        if not self.updatesEnabled():
+            yield
+            return
+        self.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self.setUpdatesEnabled(True)
+            self.updateGeometry()
+
     def add_stretch(self) -> None:
         """Add stretch at the end of the grid."""
         self._layout.addStretch()
@@ -306,15 +423,13 @@ def create_responsive_columns(
         A Grid with all widgets arranged responsively
     """
     grid = Grid(parent)
-    row = grid.add_row()
-
-    for widget in widgets:
-        col = row.create_column(
-            span=columns_lg,
-            lg=columns_lg,
-            md=columns_md,
-            sm=columns_sm
-        )
-        col.add_widget(widget)
+    # Every column shares the same spans, so the row can use QGridLayout
+    row = grid.add_row(uniform=True)
+
+    spec = {"span": columns_lg, "lg": columns_lg, "md": columns_md, "sm": columns_sm}
+    columns = row.add_columns_bulk([spec] * len(widgets))
+    with grid.batch_updates():
+        for col, widget in zip(columns, widgets):
+            col.add_widget(widget)
 
     return grid
@@ -12,11 +12,13 @@ from PySide6.QtWidgets import (
     QLabel,
     QPushButton,
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, Slot
 
 from src.components.base import BaseComponent
 from src.core.container import container
 from src.core.types import Theme
+from src.services.navigation_service import NavigationService
+from src.services.theme_service import ThemeService
 
 
 class Header(BaseComponent):
@@ -50,6 +52,10 @@ class Header(BaseComponent):
 
         super().__init__(parent, **kwargs)
 
+        # Resolved once; the click handlers only use the cached services
+        self._nav = container.resolve(NavigationService)
+        self._theme_service = container.resolve(ThemeService)
+
     def _setup_ui(self) -> None:
         """Setup the header UI."""
         self.setProperty("class", "header")
@@ -64,22 +70,13 @@ class Header(BaseComponent):
         self._back_btn.setFixedSize(32, 32)
         self._back_btn.setCursor(Qt.PointingHandCursor)
         self._back_btn.setVisible(self.get_prop("show_back", False))
-        self._back_btn.setStyleSheet("""
-            QPushButton {
-                background: transparent;
-                border: 1px solid rgba(128, 128, 128, 0.3);
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background: rgba(128, 128, 128, 0.15);
-            }
-        """)
+        self._back_btn.setProperty("class", "header-back")
         layout.addWidget(self._back_btn)
 
         # Title
         self._title_label = QLabel(self.get_prop("title", ""))
-        self._title_label.setStyleSheet("font-size: 18px; font-weight: bold;")
+        # Titles are never HTML; skip QLabel's rich-text detection
+        self._title_label.setTextFormat(Qt.PlainText)
         self._title_label.setProperty("class", "header-title")
         layout.addWidget(self._title_label)
 
@@ -91,17 +88,7 @@ class Header(BaseComponent):
         self._theme_btn.setFixedSize(36, 36)
         self._theme_btn.setCursor(Qt.PointingHandCursor)
         self._theme_btn.setToolTip("Toggle theme")
-        self._theme_btn.setStyleSheet("""
-            QPushButton {
-                background: transparent;
-                border: 1px solid #e0e0e0;
-                border-radius: 18px;
-                font-size: 16px;
-            }
-            QPushButton:hover {
-                background: #f0f0f0;
-            }
-        """)
+        self._theme_btn.setProperty("class", "header-theme-toggle")
         layout.addWidget(self._theme_btn)
 
     def _setup_connections(self) -> None:
@@ -109,25 +96,25 @@ class Header(BaseComponent):
         self._back_btn.clicked.connect(self._on_back_clicked)
         self._theme_btn.clicked.connect(self._on_theme_toggled)
 
+    @Slot()
     def _on_back_clicked(self) -> None:
         """Handle back button click."""
         self.back_clicked.emit()
-        from src.services.navigation_service import NavigationService
-        nav = container.resolve(NavigationService)
-        nav.go_back()
+        self._nav.go_back()
 
+    @Slot()
     def _on_theme_toggled(self) -> None:
         """Handle theme toggle click."""
         self.theme_toggled.emit()
-        from src.services.theme_service import ThemeService
-        theme_service = container.resolve(ThemeService)
-        new_theme = theme_service.toggle_theme()
+        new_theme = self._theme_service.toggle_theme()
         self._update_theme_icon(new_theme)
 
     def _update_theme_icon(self, theme: Theme) -> None:
         """Update theme button icon."""
         icon = "☀️" if theme == Theme.DARK else "🌙"
-        self._theme_btn.setText(icon)
+        # setText already schedules an async update(); skip it when unchanged
+        if self._theme_btn.text() != icon:
+            self._theme_btn.setText(icon)
 
     def set_title(self, title: str) -> None:
         """Set the header title."""
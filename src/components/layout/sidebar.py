@@ -11,8 +11,9 @@ não conhece nenhuma feature específica — por isso pode ficar em
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import partial
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import QTimer, Qt, Signal, Slot
 from PySide6.QtWidgets import (
     QFrame,
     QLabel,
@@ -24,6 +25,7 @@ from PySide6.QtWidgets import (
 from src.components.base import BaseComponent
 from src.core.container import container
 from src.core.types import PageId
+from src.services.navigation_service import NavigationService
 
 
 @dataclass(frozen=True)
@@ -47,10 +49,13 @@ class _SidebarButton(QPushButton):
         super().__init__(parent)
         self._label = label
         self._icon = icon
-        self.setText(f"{icon}  {label}" if icon else label)
+        # Textos dos dois estados, calculados uma vez
+        self._full_text = f"{icon}  {label}" if icon else label
+        self._collapsed_text = icon or self._full_text
+        self.setText(self._full_text)
         self.setCursor(Qt.PointingHandCursor)
         self.setCheckable(True)
-        self._apply_style()
+        self.setProperty("class", "sidebar-item")
 
     @property
     def label(self) -> str:
@@ -62,31 +67,7 @@ class _SidebarButton(QPushButton):
 
     def set_collapsed(self, collapsed: bool) -> None:
         """Mostra apenas ícone quando a sidebar está recolhida."""
-        if collapsed and self._icon:
-            self.setText(self._icon)
-        else:
-            self.setText(f"{self._icon}  {self._label}" if self._icon else self._label)
-
-    def _apply_style(self) -> None:
-        self.setStyleSheet(
-            """
-            QPushButton {
-                background: transparent;
-                border: none;
-                border-radius: 8px;
-                padding: 12px 16px;
-                text-align: left;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background: rgba(128, 128, 128, 0.15);
-            }
-            QPushButton:checked {
-                background: #0078D4;
-                color: white;
-            }
-            """
-        )
+        self.setText(self._collapsed_text if collapsed else self._full_text)
 
 
 class Sidebar(BaseComponent):
@@ -117,6 +98,13 @@ class Sidebar(BaseComponent):
         super().__init__(parent, **kwargs)
         self._active_page: PageId | None = None
         self._items: dict[PageId, _SidebarButton] = {}
+        self._active_item: _SidebarButton | None = None
+        # Junta vários page_changed do mesmo ciclo do event loop numa
+        # única atualização dos botões
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(0)
+        self._update_timer.timeout.connect(self._update_active_item)
         self._setup_navigation_listener()
 
     # -------------------------------------------------------- construção
@@ -135,12 +123,10 @@ class Sidebar(BaseComponent):
         brand_layout.setContentsMargins(8, 0, 8, 16)
 
         app_name = QLabel("PySide6 App")
-        app_name.setStyleSheet("font-size: 16px; font-weight: bold;")
         app_name.setProperty("class", "sidebar-title")
         brand_layout.addWidget(app_name)
 
         version = QLabel("v1.0.0")
-        version.setStyleSheet("font-size: 11px;")
         version.setProperty("class", "sidebar-subtitle")
         brand_layout.addWidget(version)
 
@@ -153,7 +139,6 @@ class Sidebar(BaseComponent):
         self._layout.addWidget(separator)
 
         self._nav_label = QLabel("Navegação")
-        self._nav_label.setStyleSheet("font-size: 11px; margin-top: 8px;")
         self._nav_label.setProperty("class", "sidebar-section")
         self._layout.addWidget(self._nav_label)
 
@@ -172,18 +157,6 @@ class Sidebar(BaseComponent):
         self._collapse_btn.setCursor(Qt.PointingHandCursor)
         self._collapse_btn.setToolTip("Recolher sidebar")
         self._collapse_btn.setProperty("class", "sidebar-collapse")
-        self._collapse_btn.setStyleSheet(
-            """
-            QPushButton {
-                background: transparent;
-                border: 1px solid rgba(128, 128, 128, 0.3);
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background: rgba(128, 128, 128, 0.15);
-            }
-            """
-        )
         self._collapse_btn.clicked.connect(self._toggle_collapse)
         self._layout.addWidget(self._collapse_btn)
 
@@ -202,12 +175,11 @@ class Sidebar(BaseComponent):
             if widget:
                 widget.deleteLater()
         self._items.clear()
+        self._active_item = None
 
         for item in items:
             button = _SidebarButton(item.label, item.icon)
-            button.clicked.connect(
-                lambda _checked=False, pid=item.page_id: self._on_item_clicked(pid)
-            )
+            button.clicked.connect(partial(self._on_item_clicked, item.page_id))
             self._items[item.page_id] = button
             self._items_layout.addWidget(button)
 
@@ -221,26 +193,29 @@ class Sidebar(BaseComponent):
     # ------------------------------------------------------------- eventos
 
     def _setup_navigation_listener(self) -> None:
-        from src.services.navigation_service import NavigationService
-
-        nav = container.resolve(NavigationService)
-        nav.page_changed.connect(self._on_page_changed)
+        self._nav = container.resolve(NavigationService)
+        self._nav.page_changed.connect(self._on_page_changed)
 
     def _on_item_clicked(self, page_id: PageId) -> None:
         self.item_clicked.emit(page_id)
-        from src.services.navigation_service import NavigationService
-
-        nav = container.resolve(NavigationService)
-        nav.navigate_to(page_id)
+        self._nav.navigate_to(page_id)
 
+    @Slot(object, dict)
     def _on_page_changed(self, page_id: PageId, params: dict) -> None:
         self._active_page = page_id
-        self._update_active_item()
+        self._update_timer.start()
 
+    @Slot()
     def _update_active_item(self) -> None:
-        for pid, button in self._items.items():
-            button.setChecked(pid == self._active_page)
-
+        # Só mexe no botão que sai e no que entra (evita re-polir todos)
+        new_item = self._items.get(self._active_page)
+        if self._active_item is not None and self._active_item is not new_item:
+            self._active_item.setChecked(False)
+        if new_item is not None:
+            new_item.setChecked(True)
+        self._active_item = new_item
+
+    @Slot()
     def _toggle_collapse(self) -> None:
         collapsed = not self.get_prop("collapsed", False)
         self.set_prop("collapsed", collapsed)
@@ -1,70 +1,130 @@
 """Data table component."""
 from __future__ import annotations
 from typing import Any
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QTableWidget, QTableWidgetItem, QHeaderView
-from PySide6.QtCore import Signal
-from src.components.base import BaseComponent
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QTableView, QHeaderView
+from PySide6.QtCore import (
+    QAbstractTableModel,
+    QModelIndex,
+    QObject,
+    QPersistentModelIndex,
+    QSortFilterProxyModel,
+    Qt,
+    Signal,
+    Slot,
+)
+from src.components.base import BaseComponent, declare_props
 
 
+class DictTableModel(QAbstractTableModel):
+    """Read-only table model over a list of row dicts, one column per key."""
+
+    def __init__(
+        self,
+        columns: list[dict[str, str]],
+        rows: list[dict[str, Any]],
+        parent: QObject | None = None,
+    ) -> None:
+        super().__init__(parent)
+        self._keys: list[str] = []
+        self._labels: list[str] = []
+        self._rows: list[dict[str, Any]] = []
+        self.set_source(columns, rows)
+
+    def set_source(self, columns: list[dict[str, str]], rows: list[dict[str, Any]]) -> None:
+        """Replace columns and rows with a single model reset."""
+        self.beginResetModel()
+        self._keys = [c.get("key", "") for c in columns]
+        self._labels = [c.get("label", "") for c in columns]
+        self._rows = rows
+        self.endResetModel()
+
+    def row_data(self, row: int) -> dict[str, Any]:
+        return self._rows[row]
+
+    def rowCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._keys)
+
+    def data(self, index: QModelIndex | QPersistentModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        return str(self._rows[index.row()].get(self._keys[index.column()], ""))
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._labels[section]
+        return None
+
+
+@declare_props(columns=[], data=[], sortable=True)
 class DataTable(BaseComponent):
-    """Data table with sorting."""
+    """
+    Data table with sorting.
+
+    Rows are served by a `DictTableModel` over the `data` prop, so
+    `set_data` is a model reset and only visible cells are ever rendered.
+    Sorting goes through a proxy; row indexes passed to signals and
+    returned by `get_selected_row` always refer to `data`.
+    """
 
     row_clicked = Signal(int, dict)
     row_double_clicked = Signal(int, dict)
 
-    def __init__(self, parent: QWidget | None = None, **kwargs) -> None:
-        kwargs.setdefault("columns", [])
-
-        kwargs.setdefault("data", [])
-
-        kwargs.setdefault("sortable", True)
+    _p_columns: list[dict[str, str]]
+    _p_data: list[dict[str, Any]]
+    _p_sortable: bool
 
+    def __init__(self, parent: QWidget | None = None, **kwargs) -> None:
         super().__init__(parent, **kwargs)
 
     def _setup_ui(self) -> None:
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
-        self._table = QTableWidget()
-        self._table.setStyleSheet("""
-            QTableWidget { border: 1px solid #e0e0e0; border-radius: 8px; }
-            QHeaderView::section { background: #f5f5f5; padding: 10px; border: none; font-weight: bold; }
-        """)
+        self._model = DictTableModel(self._p_columns, self._p_data, self)
+        self._proxy = QSortFilterProxyModel(self)
+        self._proxy.setSourceModel(self._model)
+        self._table = QTableView()
+        self._table.setProperty("class", "data-table")
+        self._table.setModel(self._proxy)
         self._table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self._table.verticalHeader().setVisible(False)
-        self._table.setSelectionBehavior(QTableWidget.SelectRows)
-        self._table.setSortingEnabled(self.get_prop("sortable", True))
+        self._table.setSelectionBehavior(QTableView.SelectRows)
+        # Start in data order; enabling sorting otherwise sorts by column 0
+        self._table.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        self._table.setSortingEnabled(self._p_sortable)
         layout.addWidget(self._table)
-        self._populate()
 
     def _setup_connections(self) -> None:
-        self._table.cellClicked.connect(self._on_row_clicked)
-        self._table.cellDoubleClicked.connect(self._on_row_double_clicked)
+        self._table.clicked.connect(self._on_row_clicked)
+        self._table.doubleClicked.connect(self._on_row_double_clicked)
 
     def _populate(self) -> None:
-        columns = self.get_prop("columns", [])
-        data = self.get_prop("data", [])
-        self._table.setColumnCount(len(columns))
-        self._table.setHorizontalHeaderLabels([c.get("label", "") for c in columns])
-        self._table.setRowCount(len(data))
-        for row_idx, row_data in enumerate(data):
-            for col_idx, col in enumerate(columns):
-                key = col.get("key", "")
-                value = str(row_data.get(key, ""))
-                self._table.setItem(row_idx, col_idx, QTableWidgetItem(value))
-
-    def _on_row_clicked(self, row: int, col: int) -> None:
-        data = self.get_prop("data", [])
-        if 0 <= row < len(data):
-            self.row_clicked.emit(row, data[row])
-
-    def _on_row_double_clicked(self, row: int, col: int) -> None:
-        data = self.get_prop("data", [])
-        if 0 <= row < len(data):
-            self.row_double_clicked.emit(row, data[row])
+        # Nothing to show and nothing to clear: skip the model reset
+        model = self._model
+        if not (self._p_columns or self._p_data or model.columnCount() or model.rowCount()):
+            return
+        model.set_source(self._p_columns, self._p_data)
+
+    def _source_row(self, index: QModelIndex) -> int:
+        return self._proxy.mapToSource(index).row()
+
+    @Slot(QModelIndex)
+    def _on_row_clicked(self, index: QModelIndex) -> None:
+        row = self._source_row(index)
+        if row >= 0:
+            self.row_clicked.emit(row, self._model.row_data(row))
+
+    @Slot(QModelIndex)
+    def _on_row_double_clicked(self, index: QModelIndex) -> None:
+        row = self._source_row(index)
+        if row >= 0:
+            self.row_double_clicked.emit(row, self._model.row_data(row))
 
     def set_data(self, data: list[dict[str, Any]]) -> None:
         self.set_prop("data", data)
         self._populate()
 
     def get_selected_row(self) -> int:
-        return self._table.currentRow()
+        return self._source_row(self._table.currentIndex())
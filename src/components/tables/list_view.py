@@ -1,32 +1,27 @@
 """List view component."""
 from __future__ import annotations
-from typing import Any
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QListWidget, QListWidgetItem
-from PySide6.QtCore import Signal
-from src.components.base import BaseComponent
+from PySide6.QtCore import Signal, Slot
+from src.components.base import BaseComponent, declare_props
 
 
+@declare_props(items=[])
 class ListView(BaseComponent):
     """Simple list view."""
 
     item_clicked = Signal(int, object)
     item_double_clicked = Signal(int, object)
 
-    def __init__(self, parent: QWidget | None = None, **kwargs) -> None:
-        kwargs.setdefault("items", [])
+    _p_items: list
 
+    def __init__(self, parent: QWidget | None = None, **kwargs) -> None:
         super().__init__(parent, **kwargs)
 
     def _setup_ui(self) -> None:
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         self._list = QListWidget()
-        self._list.setStyleSheet("""
-            QListWidget { border: 1px solid #e0e0e0; border-radius: 8px; }
-            QListWidget::item { padding: 12px; }
-            QListWidget::item:hover { background: #f5f5f5; }
-            QListWidget::item:selected { background: #0078D4; color: white; }
-        """)
+        self._list.setProperty("class", "list-view")
         layout.addWidget(self._list)
         self._populate()
 
@@ -35,20 +30,25 @@ class ListView(BaseComponent):
         self._list.itemDoubleClicked.connect(self._on_item_double_clicked)
 
     def _populate(self) -> None:
+        # Nothing to show and nothing to clear (e.g. built empty, filled later)
+        if not self._p_items and not self._list.count():
+            return
         self._list.clear()
-        for item in self.get_prop("items", []):
+        for item in self._p_items:
             text = item if isinstance(item, str) else item.get("text", str(item))
             self._list.addItem(text)
 
+    @Slot(QListWidgetItem)
     def _on_item_clicked(self, item: QListWidgetItem) -> None:
         row = self._list.row(item)
-        items = self.get_prop("items", [])
+        items = self._p_items
         data = items[row] if row < len(items) else None
         self.item_clicked.emit(row, data)
 
+    @Slot(QListWidgetItem)
     def _on_item_double_clicked(self, item: QListWidgetItem) -> None:
         row = self._list.row(item)
-        items = self.get_prop("items", [])
+        items = self._p_items
         data = items[row] if row < len(items) else None
         self.item_double_clicked.emit(row, data)
 
@@ -2,34 +2,33 @@
 from __future__ import annotations
 from typing import Any
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QTreeWidget, QTreeWidgetItem
-from PySide6.QtCore import Signal
-from src.components.base import BaseComponent
-
+from PySide6.QtCore import Qt, Signal, Slot
+from src.components.base import BaseComponent, declare_props
 
+@declare_props(items=[], headers=[])
 class TreeView(BaseComponent):
-    """Tree view for hierarchical data."""
+    """
+    Tree view for hierarchical data.
+
+    Only top-level nodes are created up front; the children of a node are
+    created the first time it is expanded.
+    """
 
     item_clicked = Signal(object)
     item_expanded = Signal(object)
 
-    def __init__(self, parent: QWidget | None = None, **kwargs) -> None:
-        kwargs.setdefault("items", [])
-
-        kwargs.setdefault("headers", [])
+    _p_items: list[dict[str, Any]]
+    _p_headers: list[str]
 
+    def __init__(self, parent: QWidget | None = None, **kwargs) -> None:
         super().__init__(parent, **kwargs)
 
     def _setup_ui(self) -> None:
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         self._tree = QTreeWidget()
-        self._tree.setStyleSheet("""
-            QTreeWidget { border: 1px solid #e0e0e0; border-radius: 8px; }
-            QTreeWidget::item { padding: 8px; }
-            QTreeWidget::item:hover { background: #f5f5f5; }
-            QTreeWidget::item:selected { background: #0078D4; color: white; }
-        """)
-        headers = self.get_prop("headers", [])
+        self._tree.setProperty("class", "tree-view")
+        headers = self._p_headers
         if headers:
             self._tree.setHeaderLabels(headers)
         else:
@@ -42,25 +41,38 @@ class TreeView(BaseComponent):
         self._tree.itemExpanded.connect(self._on_item_expanded)
 
     def _populate(self) -> None:
+        # Nothing to show and nothing to clear (e.g. built empty, filled later)
+        if not self._p_items and not self._tree.topLevelItemCount():
+            return
         self._tree.clear()
-        items = self.get_prop("items", [])
-        for item in items:
+        for item in self._p_items:
             self._add_item(item, self._tree.invisibleRootItem())
 
     def _add_item(self, item_data: dict[str, Any], parent: QTreeWidgetItem) -> None:
         text = item_data.get("text", "")
         tree_item = QTreeWidgetItem([text])
-        tree_item.setData(0, 1000, item_data)
+        tree_item.setData(0, Qt.UserRole, item_data)
+        if item_data.get("children"):
+            # Show the expand arrow before the children exist
+            tree_item.setChildIndicatorPolicy(QTreeWidgetItem.ShowIndicator)
         parent.addChild(tree_item)
-        for child in item_data.get("children", []):
-            self._add_item(child, tree_item)
 
+    def _load_children(self, item: QTreeWidgetItem) -> None:
+        if item.childCount():
+            return
+        for child in item.data(0, Qt.UserRole).get("children", []):
+            self._add_item(child, item)
+        item.setChildIndicatorPolicy(QTreeWidgetItem.DontShowIndicatorWhenChildless)
+
+    @Slot(QTreeWidgetItem, int)
     def _on_item_clicked(self, item: QTreeWidgetItem, column: int) -> None:
-        data = item.data(0, 1000)
+        data = item.data(0, Qt.UserRole)
         self.item_clicked.emit(data)
 
+    @Slot(QTreeWidgetItem)
     def _on_item_expanded(self, item: QTreeWidgetItem) -> None:
-        data = item.data(0, 1000)
+        self._load_children(item)
+        data = item.data(0, Qt.UserRole)
         self.item_expanded.emit(data)
 
     def set_items(self, items: list[dict]) -> None:
@@ -92,7 +92,8 @@ class BasePage(QWidget):
             params: Navigation parameters
         """
         self._params = params
-        self._logger.debug(f"Navigated to {self.__class__.__name__} with params: {params}")
+        if self._logger.is_debug_enabled():
+            self._logger.debug("Navigated to %s with params: %s", self.__class__.__name__, params)
 
         if not self._is_initialized:
             self._is_initialized = True
@@ -6,6 +6,8 @@ The main landing page of the application.
 
 from __future__ import annotations
 
+from typing import Callable, NamedTuple
+
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -14,11 +16,47 @@ from PySide6.QtWidgets import (
     QGridLayout,
     QFrame,
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, Signal
+from PySide6.QtGui import QMouseEvent
 
+from src.components.cards.info_card import InfoCard
 from src.core.base_page import BasePage
+from src.core.container import container
 from src.core.types import PageId
 from src.features.home.controller import HomeController
+from src.services.theme_service import ThemeService
+
+# (title, value, accent color) for each stats card
+_STATS = (
+    ("Pages", "3", "#0078D4"),
+    ("Components", "20+", "#28A745"),
+    ("Services", "5", "#FFC107"),
+    ("Design Patterns", "5", "#DC3545"),
+)
+
+
+class QuickAction(NamedTuple):
+    """Entry of the "Quick Actions" section."""
+
+    title: str
+    description: str
+    callback: Callable[[], None]
+
+
+class ClickableFrame(QFrame):
+    """Frame that emits `clicked` when pressed with the left mouse button."""
+
+    clicked = Signal()
+
+    def __init__(self, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self.setProperty("clickable", True)
+        self.setCursor(Qt.PointingHandCursor)
+
+    def mousePressEvent(self, event: QMouseEvent) -> None:
+        if event.button() == Qt.LeftButton:
+            self.clicked.emit()
+        super().mousePressEvent(event)
 
 
 class HomePage(BasePage):
@@ -35,6 +73,7 @@ class HomePage(BasePage):
         """Initialize the home page."""
         super().__init__(parent)
         self._controller = HomeController()
+        self._theme_service = container.resolve(ThemeService)
         self._setup_ui()
         self._setup_connections()
 
@@ -71,14 +110,12 @@ class HomePage(BasePage):
 
         # Title
         self._title_label = QLabel("Welcome to PySide6 App Template")
-        self._title_label.setProperty("class", "heading")
-        self._title_label.setStyleSheet("font-size: 28px; font-weight: bold;")
+        self._title_label.setProperty("class", "page-title")
         layout.addWidget(self._title_label)
 
         # Subtitle
         subtitle = QLabel("A scalable template with design patterns and reusable components")
         subtitle.setProperty("class", "subheading")
-        subtitle.setStyleSheet("font-size: 16px;")
         layout.addWidget(subtitle)
 
         return widget
@@ -90,43 +127,15 @@ class HomePage(BasePage):
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(16)
 
-        stats = [
-            {"title": "Pages", "value": "3", "color": "#0078D4"},
-            {"title": "Components", "value": "20+", "color": "#28A745"},
-            {"title": "Services", "value": "5", "color": "#FFC107"},
-            {"title": "Design Patterns", "value": "5", "color": "#DC3545"},
-        ]
-
-        for i, stat in enumerate(stats):
-            card = self._create_stat_card(stat["title"], stat["value"], stat["color"])
+        for i, (title, value, color) in enumerate(_STATS):
+            card = self._create_stat_card(title, value, color)
             layout.addWidget(card, 0, i)
 
         return widget
 
-    def _create_stat_card(self, title: str, value: str, color: str) -> QFrame:
-        """Create a stat card."""
-        card = QFrame()
-        card.setProperty("class", "card")
-        card.setStyleSheet(f"""
-            QFrame {{
-                border-radius: 8px;
-                padding: 16px;
-                border-left: 4px solid {color};
-            }}
-        """)
-
-        layout = QVBoxLayout(card)
-
-        value_label = QLabel(value)
-        value_label.setStyleSheet("font-size: 32px; font-weight: bold;")
-        layout.addWidget(value_label)
-
-        title_label = QLabel(title)
-        title_label.setProperty("class", "subheading")
-        title_label.setStyleSheet("font-size: 14px;")
-        layout.addWidget(title_label)
-
-        return card
+    def _create_stat_card(self, title: str, value: str, color: str) -> QWidget:
+        """Create a stat card (accent colors are styled by the app QSS)."""
+        return InfoCard(title=title, value=value, color=color)
 
     def _create_actions_section(self) -> QWidget:
         """Create quick actions section."""
@@ -136,25 +145,22 @@ class HomePage(BasePage):
 
         # Section title
         section_title = QLabel("Quick Actions")
-        section_title.setStyleSheet("font-size: 18px; font-weight: bold; margin-bottom: 16px;")
+        section_title.setProperty("class", "section-title")
         layout.addWidget(section_title)
+        layout.addSpacing(16)
 
         # Actions row
         actions_layout = QHBoxLayout()
         actions_layout.setSpacing(16)
 
-        actions = [
-            {"title": "Settings", "description": "Configure application", "action": self._go_to_settings},
-            {"title": "Components", "description": "View component showcase", "action": self._go_to_showcase},
-            {"title": "Toggle Theme", "description": "Switch light/dark mode", "action": self._toggle_theme},
-        ]
+        actions = (
+            QuickAction("Settings", "Configure application", self._go_to_settings),
+            QuickAction("Components", "View component showcase", self._go_to_showcase),
+            QuickAction("Toggle Theme", "Switch light/dark mode", self._toggle_theme),
+        )
 
         for action in actions:
-            card = self._create_action_card(
-                action["title"],
-                action["description"],
-                action["action"]
-            )
+            card = self._create_action_card(action.title, action.description, action.callback)
             actions_layout.addWidget(card)
 
         actions_layout.addStretch()
@@ -164,34 +170,21 @@ class HomePage(BasePage):
 
     def _create_action_card(self, title: str, description: str, callback) -> QFrame:
         """Create an action card."""
-        card = QFrame()
+        card = ClickableFrame()
         card.setProperty("class", "card")
-        card.setCursor(Qt.PointingHandCursor)
-        card.setStyleSheet("""
-            QFrame {
-                border-radius: 8px;
-                padding: 16px;
-                min-width: 200px;
-            }
-            QFrame:hover {
-                border-color: #0078D4;
-            }
-        """)
+        card.clicked.connect(callback)
 
         layout = QVBoxLayout(card)
+        layout.setContentsMargins(16, 16, 16, 16)
 
         title_label = QLabel(title)
-        title_label.setStyleSheet("font-size: 16px; font-weight: bold;")
+        title_label.setProperty("class", "card-title")
         layout.addWidget(title_label)
 
         desc_label = QLabel(description)
-        desc_label.setProperty("class", "subheading")
-        desc_label.setStyleSheet("font-size: 13px;")
+        desc_label.setProperty("class", "card-description")
         layout.addWidget(desc_label)
 
-        # Make card clickable
-        card.mousePressEvent = lambda e: callback()
-
         return card
 
     def _setup_connections(self) -> None:
@@ -218,10 +211,7 @@ class HomePage(BasePage):
 
     def _toggle_theme(self) -> None:
         """Toggle the application theme."""
-        from src.core.container import container
-        from src.services.theme_service import ThemeService
-        theme_service = container.resolve(ThemeService)
-        theme_service.toggle_theme()
+        self._theme_service.toggle_theme()
 
     def on_first_show(self) -> None:
         """Load data on first show."""
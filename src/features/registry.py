@@ -6,7 +6,7 @@ Este módulo é o **único** lugar onde as features são conectadas ao
 
 1. Adicione seu `PageId` em `src/core/types.py`.
 2. Implemente a pasta `src/features/<nome>/` com `page.py`.
-3. Importe e registre aqui na função `register_all_features`.
+3. Adicione a fábrica da página em `feature_page_factories`.
 4. (Opcional) Adicione metadados em `FEATURE_METADATA` para o sidebar
    exibir o label/ícone correto.
 
@@ -17,6 +17,7 @@ detalhado.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Callable
 
 from PySide6.QtWidgets import QWidget
 
@@ -69,14 +70,22 @@ FEATURE_METADATA: list[FeatureMetadata] = [
     ),
 ]
 
+# Índice por `PageId`, montado uma vez no import (usado a cada troca de página)
+_METADATA_BY_ID: dict[PageId, FeatureMetadata] = {
+    meta.page_id: meta for meta in FEATURE_METADATA
+}
 
-def create_feature_pages(parent: QWidget | None = None) -> dict[PageId, QWidget]:
+
+def feature_page_factories(
+    parent: QWidget | None = None,
+) -> dict[PageId, Callable[[], QWidget]]:
     """
-    Instancia todas as páginas de feature.
+    Retorna uma fábrica (callable sem argumentos) para cada página de feature.
 
-    Feito dentro de uma função para postergar os imports — isso evita
-    carregar o código de todas as features quando este módulo é
-    importado só para ler `FEATURE_METADATA`.
+    As páginas só são construídas quando a fábrica é chamada — o
+    `NavigationService` faz isso na primeira navegação. Os imports ficam
+    dentro da função para não carregar o código das features quando este
+    módulo é importado só para ler `FEATURE_METADATA`.
     """
     # Imports locais (lazy) — uma linha por feature.
     from src.features.home.page import HomePage
@@ -86,11 +95,19 @@ def create_feature_pages(parent: QWidget | None = None) -> dict[PageId, QWidget]
     from src.features.responsive_demo.page import ResponsivePage
 
     return {
-        PageId.HOME: HomePage(parent),
-        PageId.SETTINGS: SettingsPage(parent),
-        PageId.SHOWCASE: ShowcasePage(parent),
-        PageId.DASHBOARD: DashboardPage(parent),
-        PageId.RESPONSIVE: ResponsivePage(parent),
+        PageId.HOME: lambda: HomePage(parent),
+        PageId.SETTINGS: lambda: SettingsPage(parent),
+        PageId.SHOWCASE: lambda: ShowcasePage(parent),
+        PageId.DASHBOARD: lambda: DashboardPage(parent),
+        PageId.RESPONSIVE: lambda: ResponsivePage(parent),
+    }
+
+
+def create_feature_pages(parent: QWidget | None = None) -> dict[PageId, QWidget]:
+    """Instancia todas as páginas de feature de uma vez (sem lazy loading)."""
+    return {
+        page_id: factory()
+        for page_id, factory in feature_page_factories(parent).items()
     }
 
 
@@ -99,7 +116,11 @@ def register_all_features(
     parent: QWidget | None = None,
 ) -> dict[PageId, QWidget]:
     """
-    Cria e registra todas as features no `NavigationService`.
+    Registra todas as features no `NavigationService`.
+
+    Só a página padrão é construída aqui; as demais são registradas como
+    fábricas e instanciadas na primeira navegação, tirando o custo de
+    montá-las do caminho de inicialização.
 
     Args:
         nav: Serviço de navegação onde as páginas serão registradas.
@@ -107,25 +128,21 @@ def register_all_features(
             o `MainWindow`).
 
     Returns:
-        Mapa `PageId -> QWidget` com todas as páginas já instanciadas,
-        útil caso o chamador queira adicioná-las manualmente a um
-        `QStackedWidget` sem depender do `NavigationService`.
+        Mapa `PageId -> QWidget` com as páginas instanciadas agora
+        (apenas a padrão).
     """
-    pages = create_feature_pages(parent)
     default_ids = {meta.page_id for meta in FEATURE_METADATA if meta.is_default}
-
-    for page_id, page in pages.items():
-        nav.register_page(
-            page_id,
-            page,
-            is_default=page_id in default_ids,
-        )
+    pages: dict[PageId, QWidget] = {}
+
+    for page_id, factory in feature_page_factories(parent).items():
+        if page_id in default_ids:
+            pages[page_id] = factory()
+            nav.register_page(page_id, pages[page_id], is_default=True)
+        else:
+            nav.register_page_factory(page_id, factory)
     return pages
 
 
 def get_metadata(page_id: PageId) -> FeatureMetadata | None:
     """Retorna os metadados de uma feature pelo seu `PageId`."""
-    for meta in FEATURE_METADATA:
-        if meta.page_id == page_id:
-            return meta
-    return None
+    return _METADATA_BY_ID.get(page_id)
@@ -18,7 +18,7 @@ from PySide6.QtWidgets import (
     QScrollArea,
     QGroupBox,
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QSignalBlocker, Qt, Slot
 
 from src.core.base_page import BasePage
 from src.core.types import PageId
@@ -39,6 +39,13 @@ class SettingsPage(BasePage):
         """Initialize the settings page."""
         super().__init__(parent)
         self._controller = SettingsController()
+        # Last settings applied to the widgets; reloads that return the
+        # same values skip re-setting controls (and their signal handlers).
+        # Any edit made through the page invalidates it, since the controls
+        # then no longer reflect that snapshot.
+        self._last_settings: dict | None = None
+        self._app_name = self.config.get("app.name", "PySide6 App Template")
+        self._app_version = self.config.get("app.version", "1.0.0")
         self._setup_ui()
         self._setup_connections()
 
@@ -57,7 +64,7 @@ class SettingsPage(BasePage):
 
         # Page title
         title = QLabel("Settings")
-        title.setStyleSheet("font-size: 24px; font-weight: bold; color: #1A1A1A;")
+        title.setProperty("class", "heading")
         content_layout.addWidget(title)
 
         # Theme settings
@@ -104,6 +111,10 @@ class SettingsPage(BasePage):
         self._theme_combo.addItem("Light", "light")
         self._theme_combo.addItem("Dark", "dark")
         self._theme_combo.addItem("System", "system")
+        # Theme value -> combo index, so theme updates skip findData()
+        self._theme_index_by_data = {
+            self._theme_combo.itemData(i): i for i in range(self._theme_combo.count())
+        }
         self._theme_combo.currentIndexChanged.connect(self._on_theme_changed)
         theme_row.addWidget(self._theme_combo)
         theme_row.addStretch()
@@ -119,20 +130,12 @@ class SettingsPage(BasePage):
 
         # Remember size
         self._remember_size_check = QCheckBox("Remember window size")
-        self._remember_size_check.stateChanged.connect(
-            lambda state: self._controller.set_setting(
-                "window.remember_size", state == Qt.Checked
-            )
-        )
+        self._remember_size_check.stateChanged.connect(self._on_remember_size_changed)
         layout.addWidget(self._remember_size_check)
 
         # Remember position
         self._remember_pos_check = QCheckBox("Remember window position")
-        self._remember_pos_check.stateChanged.connect(
-            lambda state: self._controller.set_setting(
-                "window.remember_position", state == Qt.Checked
-            )
-        )
+        self._remember_pos_check.stateChanged.connect(self._on_remember_position_changed)
         layout.addWidget(self._remember_pos_check)
 
         return group
@@ -143,15 +146,11 @@ class SettingsPage(BasePage):
         layout = QVBoxLayout(group)
 
         # App info
-        app_name = self.config.get("app.name", "PySide6 App Template")
-        version = self.config.get("app.version", "1.0.0")
-
-        name_label = QLabel(f"<b>{app_name}</b>")
-        name_label.setStyleSheet("color: #1A1A1A;")
+        name_label = QLabel(f"<b>{self._app_name}</b>")
         layout.addWidget(name_label)
 
-        version_label = QLabel(f"Version: {version}")
-        version_label.setStyleSheet("color: #666666;")
+        version_label = QLabel(f"Version: {self._app_version}")
+        version_label.setProperty("class", "text-muted")
         layout.addWidget(version_label)
 
         desc_label = QLabel(
@@ -159,7 +158,8 @@ class SettingsPage(BasePage):
             "with design patterns and reusable components."
         )
         desc_label.setWordWrap(True)
-        desc_label.setStyleSheet("color: #666666; margin-top: 8px;")
+        desc_label.setProperty("class", "text-muted")
+        layout.addSpacing(8)
         layout.addWidget(desc_label)
 
         return group
@@ -171,9 +171,13 @@ class SettingsPage(BasePage):
 
     def _on_settings_loaded(self, settings: dict) -> None:
         """Handle settings loaded."""
+        if settings == self._last_settings:
+            return
+        self._last_settings = settings
+
         # Update theme combo
         theme = settings.get("theme", {}).get("current", "light")
-        index = self._theme_combo.findData(theme)
+        index = self._theme_index_by_data.get(theme, -1)
         if index >= 0:
             self._theme_combo.setCurrentIndex(index)
 
@@ -182,22 +186,35 @@ class SettingsPage(BasePage):
         self._remember_size_check.setChecked(window.get("remember_size", True))
         self._remember_pos_check.setChecked(window.get("remember_position", True))
 
+    @Slot(int)
+    def _on_remember_size_changed(self, state: int) -> None:
+        """Persist the "remember window size" checkbox."""
+        self._last_settings = None
+        self._controller.set_setting("window.remember_size", state == Qt.Checked.value)
+
+    @Slot(int)
+    def _on_remember_position_changed(self, state: int) -> None:
+        """Persist the "remember window position" checkbox."""
+        self._last_settings = None
+        self._controller.set_setting("window.remember_position", state == Qt.Checked.value)
+
     def _on_theme_changed(self, index: int) -> None:
         """Handle theme selection changed."""
+        self._last_settings = None
         theme = self._theme_combo.currentData()
         if theme:
             self._controller.set_theme(theme)
 
     def _on_theme_updated(self, theme: str) -> None:
         """Handle theme updated externally."""
-        index = self._theme_combo.findData(theme)
+        index = self._theme_index_by_data.get(theme, -1)
         if index >= 0 and self._theme_combo.currentIndex() != index:
-            self._theme_combo.blockSignals(True)
-            self._theme_combo.setCurrentIndex(index)
-            self._theme_combo.blockSignals(False)
+            with QSignalBlocker(self._theme_combo):
+                self._theme_combo.setCurrentIndex(index)
 
     def _on_reset_clicked(self) -> None:
         """Handle reset button clicked."""
+        self._last_settings = None
         self._controller.reset_to_defaults()
         self.show_toast("Settings reset to defaults", "success")
 
@@ -6,6 +6,8 @@ Displays examples of all reusable components.
 
 from __future__ import annotations
 
+from typing import Callable
+
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -15,6 +17,8 @@ from PySide6.QtWidgets import (
     QTabWidget,
     QScrollArea,
     QGridLayout,
+    QFormLayout,
+    QSizePolicy,
     QPushButton,
     QLineEdit,
     QComboBox,
@@ -27,11 +31,59 @@ from PySide6.QtWidgets import (
     QGroupBox,
     QButtonGroup,
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, Slot
 
 from src.core.base_page import BasePage
 from src.features.showcase.controller import ShowcaseController
 
+_RADIO_LABELS = ("Radio 1", "Radio 2", "Radio 3")
+
+# (title, content) for the basic card demo
+_BASIC_CARDS = (
+    ("Basic Card", "This is a basic card with simple content."),
+    ("Card with Shadow", "This card has a higher elevation."),
+    ("Bordered Card", "This card uses a border style."),
+)
+
+# (title, value, accent) for the info card demo
+_INFO_CARDS = (
+    ("Users", "1,234", "primary"),
+    ("Revenue", "$12.5K", "success"),
+    ("Orders", "567", "warning"),
+    ("Errors", "12", "danger"),
+)
+
+# (text, variant) for the badge demo
+_BADGES = (
+    ("Primary", "primary"),
+    ("Success", "success"),
+    ("Warning", "warning"),
+    ("Danger", "danger"),
+    ("Info", "info"),
+)
+
+# (title, variant, text) for the alert demo
+_ALERTS = (
+    ("Info", "info", "This is an informational message."),
+    ("Success", "success", "Operation completed successfully!"),
+    ("Warning", "warning", "Please review your changes."),
+    ("Error", "error", "An error occurred. Please try again."),
+)
+
+# (spacing, label) for the spacing demo
+_SPACINGS = (
+    (8, "Compact (8px)"),
+    (16, "Normal (16px)"),
+    (24, "Relaxed (24px)"),
+)
+
+
+def _form_label(text: str) -> QLabel:
+    """Form label that fills its row so the text centres on the padded field."""
+    label = QLabel(text)
+    label.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Expanding)
+    return label
+
 
 class ShowcasePage(BasePage):
     """
@@ -61,25 +113,44 @@ class ShowcasePage(BasePage):
 
         # Page title
         title = QLabel("Component Showcase")
-        title.setStyleSheet("font-size: 24px; font-weight: bold;")
+        title.setProperty("class", "page-title")
         content_layout.addWidget(title)
 
         subtitle = QLabel("Examples of reusable UI components")
-        subtitle.setStyleSheet("font-size: 14px; color: #666; margin-bottom: 16px;")
+        subtitle.setProperty("class", "text-muted")
         content_layout.addWidget(subtitle)
-
-        # Tab widget for categories
-        tabs = QTabWidget()
-        tabs.addTab(self._create_buttons_tab(), "Buttons")
-        tabs.addTab(self._create_inputs_tab(), "Inputs")
-        tabs.addTab(self._create_cards_tab(), "Cards")
-        tabs.addTab(self._create_feedback_tab(), "Feedback")
-        tabs.addTab(self._create_layout_tab(), "Layout")
-
-        content_layout.addWidget(tabs)
+        content_layout.addSpacing(16)
+
+        # Tab widget for categories. Only the first tab is built up front;
+        # the others get an empty placeholder that is filled the first
+        # time the tab is selected.
+        self._tabs = QTabWidget()
+        self._tabs.addTab(self._create_buttons_tab(), "Buttons")
+        self._tab_builders: dict[int, Callable[[], QWidget]] = {}
+        for label, builder in (
+            ("Inputs", self._create_inputs_tab),
+            ("Cards", self._create_cards_tab),
+            ("Feedback", self._create_feedback_tab),
+            ("Layout", self._create_layout_tab),
+        ):
+            placeholder = QWidget()
+            placeholder_layout = QVBoxLayout(placeholder)
+            placeholder_layout.setContentsMargins(0, 0, 0, 0)
+            index = self._tabs.addTab(placeholder, label)
+            self._tab_builders[index] = builder
+        self._tabs.currentChanged.connect(self._on_tab_changed)
+
+        content_layout.addWidget(self._tabs)
 
         self._main_layout.addWidget(content)
 
+    @Slot(int)
+    def _on_tab_changed(self, index: int) -> None:
+        """Build a tab's content the first time it is selected."""
+        builder = self._tab_builders.pop(index, None)
+        if builder is not None:
+            self._tabs.widget(index).layout().addWidget(builder())
+
     def _create_buttons_tab(self) -> QWidget:
         """Create buttons showcase tab."""
         scroll = QScrollArea()
@@ -95,21 +166,16 @@ class ShowcasePage(BasePage):
         primary_layout = QHBoxLayout(primary_group)
 
         btn_small = QPushButton("Small")
-        btn_small.setStyleSheet(self._get_primary_button_style("small"))
-        primary_layout.addWidget(btn_small)
-
+        btn_small.setProperty("variant", "small")
         btn_medium = QPushButton("Medium")
-        btn_medium.setStyleSheet(self._get_primary_button_style("medium"))
-        primary_layout.addWidget(btn_medium)
-
         btn_large = QPushButton("Large")
-        btn_large.setStyleSheet(self._get_primary_button_style("large"))
-        primary_layout.addWidget(btn_large)
-
+        btn_large.setProperty("variant", "large")
         btn_disabled = QPushButton("Disabled")
         btn_disabled.setEnabled(False)
-        btn_disabled.setStyleSheet(self._get_primary_button_style("medium"))
-        primary_layout.addWidget(btn_disabled)
+
+        for btn in (btn_small, btn_medium, btn_large, btn_disabled):
+            btn.setProperty("class", "primary")
+            primary_layout.addWidget(btn)
 
         primary_layout.addStretch()
         layout.addWidget(primary_group)
@@ -118,9 +184,9 @@ class ShowcasePage(BasePage):
         secondary_group = QGroupBox("Secondary Buttons")
         secondary_layout = QHBoxLayout(secondary_group)
 
-        for text in ["Default", "Outline", "Ghost"]:
+        for text in ("Default", "Outline", "Ghost"):
             btn = QPushButton(text)
-            btn.setStyleSheet(self._get_secondary_button_style())
+            btn.setProperty("class", "secondary")
             secondary_layout.addWidget(btn)
 
         secondary_layout.addStretch()
@@ -131,23 +197,12 @@ class ShowcasePage(BasePage):
         danger_layout = QHBoxLayout(danger_group)
 
         btn_danger = QPushButton("Delete")
-        btn_danger.setStyleSheet(self._get_danger_button_style())
+        btn_danger.setProperty("class", "danger")
         danger_layout.addWidget(btn_danger)
 
         btn_danger_outline = QPushButton("Remove")
-        btn_danger_outline.setStyleSheet("""
-            QPushButton {
-                background: transparent;
-                color: #dc3545;
-                border: 1px solid #dc3545;
-                padding: 8px 16px;
-                border-radius: 6px;
-            }
-            QPushButton:hover {
-                background: #dc3545;
-                color: white;
-            }
-        """)
+        btn_danger_outline.setProperty("class", "danger")
+        btn_danger_outline.setProperty("variant", "outline")
         danger_layout.addWidget(btn_danger_outline)
 
         danger_layout.addStretch()
@@ -169,43 +224,37 @@ class ShowcasePage(BasePage):
 
         # Text inputs
         text_group = QGroupBox("Text Inputs")
-        text_layout = QGridLayout(text_group)
+        text_layout = QFormLayout(text_group)
 
-        text_layout.addWidget(QLabel("Default:"), 0, 0)
-        text_layout.addWidget(QLineEdit(), 0, 1)
+        text_layout.addRow(_form_label("Default:"), QLineEdit())
 
-        text_layout.addWidget(QLabel("Placeholder:"), 1, 0)
         placeholder_input = QLineEdit()
         placeholder_input.setPlaceholderText("Enter your name...")
-        text_layout.addWidget(placeholder_input, 1, 1)
+        text_layout.addRow(_form_label("Placeholder:"), placeholder_input)
 
-        text_layout.addWidget(QLabel("Disabled:"), 2, 0)
         disabled_input = QLineEdit("Disabled input")
         disabled_input.setEnabled(False)
-        text_layout.addWidget(disabled_input, 2, 1)
+        text_layout.addRow(_form_label("Disabled:"), disabled_input)
 
-        text_layout.addWidget(QLabel("Password:"), 3, 0)
         password_input = QLineEdit()
         password_input.setEchoMode(QLineEdit.Password)
         password_input.setPlaceholderText("Enter password...")
-        text_layout.addWidget(password_input, 3, 1)
+        text_layout.addRow(_form_label("Password:"), password_input)
 
         layout.addWidget(text_group)
 
         # Selects
         select_group = QGroupBox("Select Inputs")
-        select_layout = QGridLayout(select_group)
+        select_layout = QFormLayout(select_group)
 
-        select_layout.addWidget(QLabel("Dropdown:"), 0, 0)
         combo = QComboBox()
         combo.addItems(["Option 1", "Option 2", "Option 3"])
-        select_layout.addWidget(combo, 0, 1)
+        select_layout.addRow(_form_label("Dropdown:"), combo)
 
-        select_layout.addWidget(QLabel("Editable:"), 1, 0)
         editable_combo = QComboBox()
         editable_combo.setEditable(True)
         editable_combo.addItems(["Apple", "Banana", "Orange"])
-        select_layout.addWidget(editable_combo, 1, 1)
+        select_layout.addRow(_form_label("Editable:"), editable_combo)
 
         layout.addWidget(select_group)
 
@@ -215,12 +264,10 @@ class ShowcasePage(BasePage):
 
         check_layout = QVBoxLayout()
         check_layout.addWidget(QCheckBox("Option A"))
-        check_layout.addWidget(QCheckBox("Option B (checked)"))
-        checks_layout.widget().findChildren(QCheckBox)[1].setChecked(True) if checks_layout.widget() else None
 
-        cb = QCheckBox("Option B (checked)")
-        cb.setChecked(True)
-        check_layout.addWidget(cb)
+        cb_b = QCheckBox("Option B (checked)")
+        cb_b.setChecked(True)
+        check_layout.addWidget(cb_b)
 
         cb_disabled = QCheckBox("Disabled")
         cb_disabled.setEnabled(False)
@@ -229,7 +276,7 @@ class ShowcasePage(BasePage):
 
         radio_layout = QVBoxLayout()
         radio_group = QButtonGroup(widget)
-        for i, text in enumerate(["Radio 1", "Radio 2", "Radio 3"]):
+        for i, text in enumerate(_RADIO_LABELS):
             radio = QRadioButton(text)
             if i == 0:
                 radio.setChecked(True)
@@ -242,19 +289,17 @@ class ShowcasePage(BasePage):
 
         # Spinbox and Slider
         numbers_group = QGroupBox("Number Inputs")
-        numbers_layout = QGridLayout(numbers_group)
+        numbers_layout = QFormLayout(numbers_group)
 
-        numbers_layout.addWidget(QLabel("Spin Box:"), 0, 0)
         spin = QSpinBox()
         spin.setRange(0, 100)
         spin.setValue(50)
-        numbers_layout.addWidget(spin, 0, 1)
+        numbers_layout.addRow(_form_label("Spin Box:"), spin)
 
-        numbers_layout.addWidget(QLabel("Slider:"), 1, 0)
         slider = QSlider(Qt.Horizontal)
         slider.setRange(0, 100)
         slider.setValue(50)
-        numbers_layout.addWidget(slider, 1, 1)
+        numbers_layout.addRow(_form_label("Slider:"), slider)
 
         layout.addWidget(numbers_group)
 
@@ -286,30 +331,19 @@ class ShowcasePage(BasePage):
         # Basic cards
         cards_layout = QHBoxLayout()
 
-        for i, (title, content) in enumerate([
-            ("Basic Card", "This is a basic card with simple content."),
-            ("Card with Shadow", "This card has a higher elevation."),
-            ("Bordered Card", "This card uses a border style."),
-        ]):
+        for title, content in _BASIC_CARDS:
             card = QFrame()
-            card.setStyleSheet(f"""
-                QFrame {{
-                    background: white;
-                    border: 1px solid #e0e0e0;
-                    border-radius: 8px;
-                    padding: 16px;
-                    {'box-shadow: 0 4px 6px rgba(0,0,0,0.1);' if i == 1 else ''}
-                }}
-            """)
+            card.setProperty("class", "card")
             card_layout = QVBoxLayout(card)
+            card_layout.setContentsMargins(16, 16, 16, 16)
 
             title_label = QLabel(title)
-            title_label.setStyleSheet("font-weight: bold; font-size: 16px;")
+            title_label.setProperty("class", "card-title")
             card_layout.addWidget(title_label)
 
             content_label = QLabel(content)
             content_label.setWordWrap(True)
-            content_label.setStyleSheet("color: #666;")
+            content_label.setProperty("class", "card-description")
             card_layout.addWidget(content_label)
 
             cards_layout.addWidget(card)
@@ -320,30 +354,20 @@ class ShowcasePage(BasePage):
         info_group = QGroupBox("Info Cards")
         info_layout = QHBoxLayout(info_group)
 
-        for title, value, color in [
-            ("Users", "1,234", "#0078D4"),
-            ("Revenue", "$12.5K", "#28A745"),
-            ("Orders", "567", "#FFC107"),
-            ("Errors", "12", "#DC3545"),
-        ]:
+        for title, value, accent in _INFO_CARDS:
             card = QFrame()
-            card.setStyleSheet(f"""
-                QFrame {{
-                    background: white;
-                    border-left: 4px solid {color};
-                    border-radius: 4px;
-                    padding: 16px;
-                    min-width: 120px;
-                }}
-            """)
+            card.setProperty("class", "card")
+            card.setProperty("accent", accent)
+            card.setMinimumWidth(120)
             card_layout = QVBoxLayout(card)
+            card_layout.setContentsMargins(16, 16, 16, 16)
 
             value_label = QLabel(value)
-            value_label.setStyleSheet("font-size: 24px; font-weight: bold;")
+            value_label.setProperty("class", "card-value")
             card_layout.addWidget(value_label)
 
             title_label = QLabel(title)
-            title_label.setStyleSheet("color: #666;")
+            title_label.setProperty("class", "card-description")
             card_layout.addWidget(title_label)
 
             info_layout.addWidget(card)
@@ -369,7 +393,7 @@ class ShowcasePage(BasePage):
         progress_group = QGroupBox("Progress Bars")
         progress_layout = QVBoxLayout(progress_group)
 
-        for value in [25, 50, 75, 100]:
+        for value in (25, 50, 75, 100):
             row = QHBoxLayout()
             label = QLabel(f"{value}%")
             label.setMinimumWidth(40)
@@ -387,24 +411,10 @@ class ShowcasePage(BasePage):
         badges_group = QGroupBox("Badges")
         badges_layout = QHBoxLayout(badges_group)
 
-        for text, color, bg in [
-            ("Primary", "white", "#0078D4"),
-            ("Success", "white", "#28A745"),
-            ("Warning", "black", "#FFC107"),
-            ("Danger", "white", "#DC3545"),
-            ("Info", "white", "#17A2B8"),
-        ]:
+        for text, variant in _BADGES:
             badge = QLabel(text)
-            badge.setStyleSheet(f"""
-                QLabel {{
-                    background: {bg};
-                    color: {color};
-                    padding: 4px 12px;
-                    border-radius: 12px;
-                    font-size: 12px;
-                    font-weight: bold;
-                }}
-            """)
+            badge.setProperty("class", "badge")
+            badge.setProperty("variant", variant)
             badges_layout.addWidget(badge)
 
         badges_layout.addStretch()
@@ -414,22 +424,12 @@ class ShowcasePage(BasePage):
         alerts_group = QGroupBox("Alerts")
         alerts_layout = QVBoxLayout(alerts_group)
 
-        for alert_type, bg, border, text in [
-            ("Info", "#cfe2ff", "#b6d4fe", "This is an informational message."),
-            ("Success", "#d1e7dd", "#badbcc", "Operation completed successfully!"),
-            ("Warning", "#fff3cd", "#ffecb5", "Please review your changes."),
-            ("Error", "#f8d7da", "#f5c2c7", "An error occurred. Please try again."),
-        ]:
+        for alert_type, variant, text in _ALERTS:
             alert = QFrame()
-            alert.setStyleSheet(f"""
-                QFrame {{
-                    background: {bg};
-                    border: 1px solid {border};
-                    border-radius: 6px;
-                    padding: 12px;
-                }}
-            """)
+            alert.setProperty("class", "alert")
+            alert.setProperty("variant", variant)
             alert_layout = QHBoxLayout(alert)
+            alert_layout.setContentsMargins(12, 12, 12, 12)
 
             type_label = QLabel(f"<b>{alert_type}:</b>")
             alert_layout.addWidget(type_label)
@@ -463,14 +463,7 @@ class ShowcasePage(BasePage):
         for i in range(3):
             for j in range(4):
                 cell = QFrame()
-                cell.setStyleSheet("""
-                    QFrame {
-                        background: #e9ecef;
-                        border: 1px solid #dee2e6;
-                        border-radius: 4px;
-                        min-height: 60px;
-                    }
-                """)
+                cell.setProperty("class", "layout-cell")
                 cell_layout = QVBoxLayout(cell)
                 cell_layout.addWidget(QLabel(f"Cell ({i},{j})"), alignment=Qt.AlignCenter)
                 grid_layout.addWidget(cell, i, j)
@@ -481,7 +474,7 @@ class ShowcasePage(BasePage):
         spacing_group = QGroupBox("Spacing")
         spacing_layout = QVBoxLayout(spacing_group)
 
-        for spacing, label in [(8, "Compact (8px)"), (16, "Normal (16px)"), (24, "Relaxed (24px)")]:
+        for spacing, label in _SPACINGS:
             row = QHBoxLayout()
             row.setSpacing(spacing)
 
@@ -492,7 +485,7 @@ class ShowcasePage(BasePage):
             for _ in range(4):
                 box = QFrame()
                 box.setFixedSize(40, 40)
-                box.setStyleSheet("background: #0078D4; border-radius: 4px;")
+                box.setProperty("class", "layout-swatch")
                 row.addWidget(box)
 
             row.addStretch()
@@ -504,63 +497,6 @@ class ShowcasePage(BasePage):
         scroll.setWidget(widget)
         return scroll
 
-    def _get_primary_button_style(self, size: str = "medium") -> str:
-        """Get primary button style."""
-        sizes = {
-            "small": "padding: 4px 12px; font-size: 12px;",
-            "medium": "padding: 8px 16px; font-size: 14px;",
-            "large": "padding: 12px 24px; font-size: 16px;",
-        }
-        return f"""
-            QPushButton {{
-                background-color: #0078D4;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                {sizes.get(size, sizes['medium'])}
-            }}
-            QPushButton:hover {{
-                background-color: #106EBE;
-            }}
-            QPushButton:pressed {{
-                background-color: #005A9E;
-            }}
-            QPushButton:disabled {{
-                background-color: #cccccc;
-            }}
-        """
-
-    def _get_secondary_button_style(self) -> str:
-        """Get secondary button style."""
-        return """
-            QPushButton {
-                background-color: white;
-                color: #333;
-                border: 1px solid #e0e0e0;
-                border-radius: 6px;
-                padding: 8px 16px;
-            }
-            QPushButton:hover {
-                background-color: #f5f5f5;
-                border-color: #d0d0d0;
-            }
-        """
-
-    def _get_danger_button_style(self) -> str:
-        """Get danger button style."""
-        return """
-            QPushButton {
-                background-color: #dc3545;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-            }
-            QPushButton:hover {
-                background-color: #c82333;
-            }
-        """
-
     def on_show(self) -> None:
         """Called when page is shown."""
         self.logger.debug("Showcase page shown")
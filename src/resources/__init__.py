@@ -0,0 +1,5 @@
+"""
+Bundled resources module.
+
+Holds generated resource modules (see scripts/build_styles_snapshot.py).
+"""
@@ -110,6 +110,18 @@ class LoggerService(BaseService):
         """Log an exception with traceback."""
         self._logger.exception(message, *args, **kwargs)
 
+    def is_debug_enabled(self) -> bool:
+        """
+        Check whether debug messages would be emitted.
+
+        Use to skip building expensive debug messages when they'd be
+        discarded anyway.
+
+        Returns:
+            True if the logger is enabled for DEBUG
+        """
+        return self._logger.isEnabledFor(logging.DEBUG)
+
     def set_level(self, level: int | str) -> None:
         """
         Set the logging level.
@@ -29,6 +29,7 @@ class NavigationEntry:
 
 
 NavigationGuard = Callable[[PageId, dict[str, Any]], bool]
+PageFactory = Callable[[], QWidget]
 
 
 class NavigationService(BaseService):
@@ -41,12 +42,14 @@ class NavigationService(BaseService):
     - Navigation guards for access control
     - Parameter passing between pages
     - Page lifecycle hooks
+    - Lazy page construction via factories
 
     Usage:
         nav = NavigationService()
 
-        # Register pages
+        # Register pages (eagerly, or lazily via a factory)
         nav.register_page(PageId.HOME, home_page)
+        nav.register_page_factory(PageId.SETTINGS, lambda: SettingsPage())
 
         # Navigate
         nav.navigate_to(PageId.SETTINGS, {"tab": "general"})
@@ -69,6 +72,7 @@ class NavigationService(BaseService):
         """Initialize the navigation service."""
         self._stack_widget: QStackedWidget | None = None
         self._pages: dict[PageId, QWidget] = {}
+        self._factories: dict[PageId, PageFactory] = {}
         self._history: list[NavigationEntry] = []
         self._current_index: int = -1
         self._guards: list[NavigationGuard] = []
@@ -105,6 +109,42 @@ class NavigationService(BaseService):
         if is_default:
             self._default_page = page_id
 
+    def register_page_factory(
+        self,
+        page_id: PageId,
+        factory: PageFactory,
+        is_default: bool = False
+    ) -> None:
+        """
+        Register a page that is only built on first navigation.
+
+        The factory is called once, the first time the page is needed;
+        the resulting widget is then registered like any other page.
+
+        Args:
+            page_id: Unique identifier for the page
+            factory: Callable returning the page widget
+            is_default: Whether this is the default/home page
+        """
+        self._factories[page_id] = factory
+
+        if is_default:
+            self._default_page = page_id
+
+    def _get_page(self, page_id: PageId) -> QWidget:
+        """
+        Return the page widget, building it from its factory if needed.
+
+        The factory is only dropped once it has returned, so a factory that
+        raises leaves the page registered and a later call retries it.
+        """
+        page = self._pages.get(page_id)
+        if page is None:
+            page = self._factories[page_id]()
+            del self._factories[page_id]
+            self.register_page(page_id, page)
+        return page
+
     def unregister_page(self, page_id: PageId) -> bool:
         """
         Unregister a page.
@@ -121,6 +161,9 @@ class NavigationService(BaseService):
                 self._stack_widget.removeWidget(page)
             del self._pages[page_id]
             return True
+        if page_id in self._factories:
+            del self._factories[page_id]
+            return True
         return False
 
     def navigate_to(
@@ -147,7 +190,7 @@ class NavigationService(BaseService):
         self.navigation_started.emit(page_id, params)
 
         # Check if page is registered
-        if page_id not in self._pages:
+        if not self.is_page_registered(page_id):
             error_msg = f"Page {page_id.name} not registered"
             self.navigation_failed.emit(page_id, error_msg)
             raise NavigationError(error_msg, page_id=page_id)
@@ -157,6 +200,10 @@ class NavigationService(BaseService):
             self.navigation_failed.emit(page_id, "Navigation blocked by guard")
             return False
 
+        # Get the page (building it on first visit) before touching
+        # history, so a failing factory leaves navigation state unchanged
+        page = self._get_page(page_id)
+
         # Truncate forward history if navigating from middle
         if self._current_index < len(self._history) - 1:
             self._history = self._history[:self._current_index + 1]
@@ -166,9 +213,6 @@ class NavigationService(BaseService):
         self._history.append(entry)
         self._current_index = len(self._history) - 1
 
-        # Get and update page
-        page = self._pages[page_id]
-
         # Call page lifecycle hook if available
         if hasattr(page, "on_navigate"):
             page.on_navigate(params)
@@ -194,10 +238,9 @@ class NavigationService(BaseService):
         if not self.can_go_back():
             return False
 
+        entry = self._history[self._current_index - 1]
+        page = self._get_page(entry.page_id)
         self._current_index -= 1
-        entry = self._history[self._current_index]
-
-        page = self._pages[entry.page_id]
 
         # Call page lifecycle hook
         if hasattr(page, "on_navigate"):
@@ -224,10 +267,9 @@ class NavigationService(BaseService):
         if not self.can_go_forward():
             return False
 
+        entry = self._history[self._current_index + 1]
+        page = self._get_page(entry.page_id)
         self._current_index += 1
-        entry = self._history[self._current_index]
-
-        page = self._pages[entry.page_id]
 
         # Call page lifecycle hook
         if hasattr(page, "on_navigate"):
@@ -271,8 +313,8 @@ class NavigationService(BaseService):
     def get_current_page(self) -> QWidget | None:
         """Get current page widget."""
         page_id = self.get_current_page_id()
-        if page_id:
-            return self._pages.get(page_id)
+        if page_id and self.is_page_registered(page_id):
+            return self._get_page(page_id)
         return None
 
     def get_current_params(self) -> dict[str, Any]:
@@ -335,8 +377,8 @@ class NavigationService(BaseService):
 
     def is_page_registered(self, page_id: PageId) -> bool:
         """Check if a page is registered."""
-        return page_id in self._pages
+        return page_id in self._pages or page_id in self._factories
 
     def get_registered_pages(self) -> list[PageId]:
-        """Get list of registered page IDs."""
-        return list(self._pages.keys())
+        """Get list of registered page IDs (built or not)."""
+        return [*self._pages, *self._factories]
@@ -6,6 +6,8 @@ Manages application themes and stylesheets.
 
 from __future__ import annotations
 
+import os
+import sys
 from pathlib import Path
 
 from PySide6.QtCore import Signal
@@ -35,10 +37,38 @@ class ThemeService(BaseService):
     # Signals
     theme_changed = Signal(object)  # Theme
 
+    # Named theme colors as (r, g, b); QColor is only built for the requested key
+    _LIGHT_COLORS: dict[str, tuple[int, int, int]] = {
+        "primary": (0, 120, 215),
+        "secondary": (108, 117, 125),
+        "success": (40, 167, 69),
+        "danger": (220, 53, 69),
+        "warning": (255, 193, 7),
+        "info": (23, 162, 184),
+        "light": (248, 249, 250),
+        "dark": (52, 58, 64),
+        "background": (255, 255, 255),
+        "surface": (255, 255, 255),
+        "text": (33, 37, 41),
+        "text_secondary": (108, 117, 125),
+        "border": (222, 226, 230),
+    }
+    _DARK_COLORS: dict[str, tuple[int, int, int]] = {
+        **_LIGHT_COLORS,
+        "primary": (42, 130, 218),
+        "background": (30, 30, 30),
+        "surface": (45, 45, 45),
+        "text": (255, 255, 255),
+        "text_secondary": (170, 170, 170),
+        "border": (68, 68, 68),
+    }
+
     def _on_init(self) -> None:
         """Initialize the theme service."""
         self._current_theme = Theme.LIGHT
         self._styles_path = self._find_styles_path()
+        self._qss_raw = self._preload_stylesheets()
+        self._palettes: dict[Theme, QPalette] = {}
 
     def _find_styles_path(self) -> Path:
         """Find the styles directory with fallback options."""
@@ -53,7 +83,6 @@ class ThemeService(BaseService):
             return path2
 
         # Try using __file__ of the main module
-        import sys
         if hasattr(sys.modules.get('__main__'), '__file__') and sys.modules['__main__'].__file__:
             main_file = Path(sys.modules['__main__'].__file__).resolve()
             path3 = main_file.parent / "resources" / "styles"
@@ -116,16 +145,41 @@ class ThemeService(BaseService):
         # Also set palette for native widgets
         self._apply_palette()
 
-    def _load_stylesheet(self, filename: str) -> str:
-        """Load a stylesheet file."""
-        file_path = self._styles_path / filename
-        if file_path.exists():
+    def _preload_stylesheets(self) -> dict[str, str]:
+        """
+        Read every stylesheet into memory once.
+
+        In frozen (packaged) builds, prefers the generated styles snapshot
+        (see scripts/build_styles_snapshot.py). Otherwise - and when the
+        snapshot is missing - does a single scan of `resources/styles/`, so
+        a stale local snapshot never hides edits to the .qss files in dev.
+        Theme switches then only concatenate in-memory strings.
+
+        Returns:
+            Mapping of stylesheet filename (e.g. "dark.qss") to its contents
+        """
+        if getattr(sys, "frozen", False):
             try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    return f.read()
-            except IOError:
-                return ""
-        return ""
+                from src.resources._styles_snapshot import STYLES
+
+                return {f"{name}.qss": qss for name, qss in STYLES.items()}
+            except ImportError:
+                pass
+
+        stylesheets: dict[str, str] = {}
+        try:
+            with os.scandir(self._styles_path) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".qss"):
+                        with open(entry.path, "rb") as f:
+                            stylesheets[entry.name] = f.read().decode("utf-8")
+        except OSError:
+            pass
+        return stylesheets
+
+    def _load_stylesheet(self, filename: str) -> str:
+        """Get a preloaded stylesheet by filename."""
+        return self._qss_raw.get(filename, "")
 
     def _apply_palette(self) -> None:
         """Apply color palette for native widgets."""
@@ -133,9 +187,29 @@ class ThemeService(BaseService):
         if not app:
             return
 
+        palette = self._palettes.get(self._current_theme)
+        if palette is None:
+            palette = self._build_palette(self._current_theme)
+            self._palettes[self._current_theme] = palette
+
+        app.setPalette(palette)
+
+    def _build_palette(self, theme: Theme) -> QPalette:
+        """
+        Build the color palette for a theme.
+
+        Built once per theme and shared application-wide via
+        `QApplication.setPalette`; widgets inherit it instead of cloning.
+
+        Args:
+            theme: Theme to build the palette for
+
+        Returns:
+            Palette for native widgets
+        """
         palette = QPalette()
 
-        if self._current_theme == Theme.DARK:
+        if theme == Theme.DARK:
             # Dark theme colors
             palette.setColor(QPalette.ColorRole.Window, QColor(30, 30, 30))
             palette.setColor(QPalette.ColorRole.WindowText, QColor(255, 255, 255))
@@ -167,7 +241,7 @@ class ThemeService(BaseService):
             palette.setColor(QPalette.ColorRole.HighlightedText, QColor(255, 255, 255))
             palette.setColor(QPalette.ColorRole.PlaceholderText, QColor(102, 102, 102))  # #666666
 
-        app.setPalette(palette)
+        return palette
 
     def _detect_system_theme(self) -> Theme:
         """
@@ -195,22 +269,9 @@ class ThemeService(BaseService):
         Returns:
             QColor for the requested color
         """
-        colors = {
-            "primary": QColor(0, 120, 215) if self._current_theme == Theme.LIGHT else QColor(42, 130, 218),
-            "secondary": QColor(108, 117, 125),
-            "success": QColor(40, 167, 69),
-            "danger": QColor(220, 53, 69),
-            "warning": QColor(255, 193, 7),
-            "info": QColor(23, 162, 184),
-            "light": QColor(248, 249, 250),
-            "dark": QColor(52, 58, 64),
-            "background": QColor(255, 255, 255) if self._current_theme == Theme.LIGHT else QColor(30, 30, 30),
-            "surface": QColor(255, 255, 255) if self._current_theme == Theme.LIGHT else QColor(45, 45, 45),
-            "text": QColor(33, 37, 41) if self._current_theme == Theme.LIGHT else QColor(255, 255, 255),
-            "text_secondary": QColor(108, 117, 125) if self._current_theme == Theme.LIGHT else QColor(170, 170, 170),
-            "border": QColor(222, 226, 230) if self._current_theme == Theme.LIGHT else QColor(68, 68, 68),
-        }
-        return colors.get(color_name, QColor(0, 0, 0))
+        table = self._DARK_COLORS if self.is_dark else self._LIGHT_COLORS
+        rgb = table.get(color_name)
+        return QColor(*rgb) if rgb else QColor(0, 0, 0)
 
     @property
     def is_dark(self) -> bool:
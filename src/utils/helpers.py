@@ -1,8 +1,15 @@
 """Helper utilities."""
 from __future__ import annotations
+import math
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+_ELLIPSIS = "..."
+_ELLIPSIS_LEN = len(_ELLIPSIS)
+
 
 def get_app_data_dir(app_name: str = "PySide6AppTemplate") -> Path:
     """Get the application data directory."""
@@ -17,7 +24,9 @@ def get_app_data_dir(app_name: str = "PySide6AppTemplate") -> Path:
 
 def ensure_dir_exists(path: Path) -> Path:
     """Ensure a directory exists, create if not."""
-    path.mkdir(parents=True, exist_ok=True)
+    # stat first: the directory almost always exists already
+    if not os.path.isdir(path):
+        os.makedirs(path, exist_ok=True)
     return path
 
 
@@ -27,24 +36,44 @@ def get_resource_path(relative_path: str) -> Path:
     return base_path / "resources" / relative_path
 
 
+@lru_cache(maxsize=1024)
 def format_file_size(size_bytes: int) -> str:
     """Format file size to human readable."""
-    for unit in ["B", "KB", "MB", "GB", "TB"]:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.1f} PB"
+    if size_bytes < 1024:
+        return f"{size_bytes:.1f} B"
+    if not math.isfinite(size_bytes):
+        return f"{size_bytes:.1f} PB"
+    # Each unit is 2**10 bytes, so the unit index comes straight from the bit length
+    unit_idx = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * unit_idx)):.1f} {_SIZE_UNITS[unit_idx]}"
 
 
-def truncate_text(text: str, max_length: int, suffix: str = "...") -> str:
+def truncate_text(text: str, max_length: int, suffix: str = _ELLIPSIS) -> str:
     """Truncate text to max length."""
     if len(text) <= max_length:
         return text
+    if suffix == _ELLIPSIS:
+        return text[: max_length - _ELLIPSIS_LEN] + _ELLIPSIS
     return text[: max_length - len(suffix)] + suffix
 
 
+def truncate_many(texts: list[str], max_length: int) -> list[str]:
+    """Truncate many texts to max length with an ellipsis (e.g. table columns)."""
+    cut = max_length - _ELLIPSIS_LEN
+    return [text if len(text) <= max_length else text[:cut] + _ELLIPSIS for text in texts]
+
+
 def safe_int(value: str, default: int = 0) -> int:
     """Safely convert to int."""
+    # Fast paths avoid raising/catching for blank and plain-digit input
+    if value is None:
+        return default
+    if isinstance(value, str):
+        value = value.strip()
+        if not value:
+            return default
+        if value.isdecimal() or (value[0] in "+-" and value[1:].isdecimal()):
+            return int(value)
     try:
         return int(value)
     except (ValueError, TypeError):
@@ -53,6 +82,14 @@ def safe_int(value: str, default: int = 0) -> int:
 
 def safe_float(value: str, default: float = 0.0) -> float:
     """Safely convert to float."""
+    if value is None:
+        return default
+    if isinstance(value, str):
+        value = value.strip()
+        if not value:
+            return default
+        if value.isdecimal():
+            return float(value)
     try:
         return float(value)
     except (ValueError, TypeError):
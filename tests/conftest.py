@@ -9,16 +9,12 @@ são singletons (ver `src/services/base.py`), então o fixture
 
 from __future__ import annotations
 
-import sys
-from pathlib import Path
 from typing import Generator
 
 import pytest
 
-# Garante que `src` está no sys.path
-ROOT = Path(__file__).resolve().parent.parent
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
+from src.core.container import Container
+from src.services.base import BaseService
 
 
 @pytest.fixture(scope="session")
@@ -46,8 +42,6 @@ def reset_services() -> Generator[None, None, None]:
     Use este fixture em testes que criam ou resolvem services para
     garantir que cada teste começa com um estado limpo.
     """
-    from src.services.base import BaseService
-
     # Guarda o estado anterior e limpa
     saved = dict(BaseService._instances)
     BaseService._instances.clear()
@@ -65,8 +59,6 @@ def fresh_container() -> Generator:
     Cuidado: `Container` é singleton, então este fixture limpa o
     container global e o restaura ao final.
     """
-    from src.core.container import Container
-
     c = Container()
     snapshot_services = dict(c._services)
     snapshot_factories = dict(c._factories)
@@ -0,0 +1,58 @@
+"""Testes dos botões (`QPushButton` + `PropsMixin`)."""
+
+from __future__ import annotations
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QPushButton
+
+from src.components.buttons import IconButton, PrimaryButton, SecondaryButton
+from src.core.types import ButtonSize
+
+
+class TestButtons:
+    """Os botões são o próprio `QPushButton`, sem widget wrapper."""
+
+    def test_primary_button_construction(self, qtbot) -> None:
+        button = PrimaryButton("Salvar")
+        qtbot.addWidget(button)
+
+        assert isinstance(button, QPushButton)
+        assert button.text() == "Salvar"
+        assert button.get_prop("size") == ButtonSize.MEDIUM
+        assert button.isEnabled()
+
+    def test_set_prop_text_updates_button(self, qtbot) -> None:
+        button = SecondaryButton("Antes")
+        qtbot.addWidget(button)
+
+        button.set_prop("text", "Depois")
+        assert button.text() == "Depois"
+
+    def test_set_prop_disabled_disables_button(self, qtbot) -> None:
+        button = PrimaryButton("Salvar")
+        qtbot.addWidget(button)
+
+        button.set_prop("disabled", True)
+        assert not button.isEnabled()
+        assert button.props["disabled"] is True
+
+    def test_click_emits_native_clicked(self, qtbot) -> None:
+        button = PrimaryButton("Salvar")
+        qtbot.addWidget(button)
+        received: list[object] = []
+
+        def on_click(checked: object = None) -> None:
+            received.append(checked)
+
+        button.clicked.connect(on_click)
+        qtbot.mouseClick(button, Qt.LeftButton)
+
+        # Sinal nativo `clicked(bool)` — não o `clicked()` do BaseComponent
+        assert received == [False]
+
+    def test_icon_button_size_and_tooltip(self, qtbot) -> None:
+        button = IconButton(size=24, tooltip="Ajuda")
+        qtbot.addWidget(button)
+
+        assert button.width() == 24
+        assert button.toolTip() == "Ajuda"
@@ -0,0 +1,24 @@
+"""Testes dos cards."""
+
+from __future__ import annotations
+
+from PySide6.QtWidgets import QPushButton
+
+from src.components.cards import ActionCard
+
+
+class TestActionCard:
+    """Ações viram botões estilizados pela classe QSS, não por `setStyleSheet`."""
+
+    def test_add_action_after_show_adds_button(self, qtbot) -> None:
+        card = ActionCard("Título", "Descrição", actions=[{"text": "Abrir"}])
+        qtbot.addWidget(card)
+        card.show()
+
+        card.add_action("Excluir", None, variant="danger")
+
+        buttons = card.findChildren(QPushButton)
+        assert [b.text() for b in buttons] == ["Abrir", "Excluir"]
+        assert buttons[1].property("class") == "danger"
+        assert all(b.styleSheet() == "" for b in buttons)
+        assert len(card.get_prop("actions")) == 2
@@ -0,0 +1,26 @@
+"""Testes dos diálogos."""
+
+from __future__ import annotations
+
+from PySide6.QtWidgets import QLineEdit, QWidget
+
+from src.components.dialogs import FormDialog
+from src.components.forms import RadioGroup
+
+
+class TestFormDialog:
+    """`FormDialog` coleta os valores dos campos ao submeter."""
+
+    def test_submit_collects_field_values(self, qtbot) -> None:
+        dialog = FormDialog("Cadastro")
+        qtbot.addWidget(dialog)
+        name = QLineEdit("Ana")
+        group = RadioGroup(options=[{"label": "A", "value": "a"}])
+        dialog.add_field("name", name)
+        dialog.add_field("choice", group)
+        dialog.add_field("spacer", QWidget())
+
+        group._buttons["a"].click()
+        dialog._on_submit()
+
+        assert dialog.get_data() == {"name": "Ana", "choice": "a"}
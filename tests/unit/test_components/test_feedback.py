@@ -0,0 +1,99 @@
+"""Testes dos componentes de feedback."""
+
+from __future__ import annotations
+
+from src.components.feedback import ProgressBar, Spinner, Toast
+
+
+class TestToast:
+    """`Toast.show` cria, posiciona e exibe a notificação."""
+
+    def test_show_displays_toast(self, qtbot) -> None:
+        toast = Toast.show("Salvo!", "success", 50)
+        qtbot.addWidget(toast)
+
+        assert toast.isVisible()
+        assert Toast._slots[toast._slot] is toast
+
+    def test_screen_geometry_is_cached(self, qtbot) -> None:
+        Toast._invalidate_geo()
+        first = Toast.show("Um", "info", 50)
+        qtbot.addWidget(first)
+        cached = Toast._cached_geo
+
+        second = Toast.show("Dois", "info", 50)
+        qtbot.addWidget(second)
+
+        assert cached is not None
+        assert Toast._cached_geo is cached
+
+    def test_hidden_toast_slot_is_reused(self, qtbot) -> None:
+        first = Toast("Um", duration=50)
+        second = Toast("Dois", duration=50)
+        qtbot.addWidget(first)
+        qtbot.addWidget(second)
+        slot = first._slot
+
+        first._hide()
+        third = Toast("Três", duration=50)
+        qtbot.addWidget(third)
+
+        assert third._slot == slot
+        assert second._slot != slot
+
+    def test_hide_fades_out_then_deletes(self, qtbot) -> None:
+        toast = Toast.show("Some", "info", 10_000)
+
+        destroyed: list[bool] = []
+        toast.destroyed.connect(lambda: destroyed.append(True))
+
+        toast._hide()
+        assert toast.isVisible()
+
+        qtbot.waitUntil(lambda: destroyed == [True], timeout=1000)
+
+
+class TestProgressBar:
+    """`value_changed` só dispara quando o valor muda."""
+
+    def test_skips_unchanged_value(self, qtbot) -> None:
+        bar = ProgressBar()
+        qtbot.addWidget(bar)
+        received: list[int] = []
+        bar.value_changed.connect(received.append)
+
+        bar.set_value(40)
+        bar.set_value(40)
+        bar.set_value(60)
+
+        assert received == [40, 60]
+
+
+class TestSpinner:
+    """O spinner gira por `paintEvent`, sem reaplicar stylesheet."""
+
+    def test_rotate_advances_angle_without_stylesheet(self, qtbot) -> None:
+        spinner = Spinner(size=24)
+        qtbot.addWidget(spinner)
+
+        spinner._rotate()
+        spinner._rotate()
+
+        assert spinner._angle == 60
+        assert spinner.styleSheet() == ""
+        assert spinner.size().width() == 24
+
+    def test_spinners_share_one_timer(self, qtbot) -> None:
+        first, second = Spinner(), Spinner()
+        qtbot.addWidget(first)
+        qtbot.addWidget(second)
+
+        first.start()
+        second.start()
+        assert first.is_spinning() and second.is_spinning()
+        assert Spinner._global_timer.isActive()
+
+        first.stop()
+        assert Spinner._global_timer.isActive()
+        second.stop()
+        assert not Spinner._global_timer.isActive()
@@ -0,0 +1,174 @@
+"""Testes dos componentes de formulário."""
+
+from __future__ import annotations
+
+from PySide6.QtWidgets import QLineEdit
+
+from src.components.forms import Checkbox, FormField, RadioGroup, SelectInput, TextInput
+
+
+class TestChangeSignals:
+    """Sinais de mudança disparam uma vez, e só quando o valor muda."""
+
+    def test_checkbox_emits_checked_changed_once(self, qtbot) -> None:
+        checkbox = Checkbox("Aceito")
+        qtbot.addWidget(checkbox)
+        checked: list[bool] = []
+        checkbox.checked_changed.connect(checked.append)
+
+        checkbox.set_checked(True)
+
+        assert checked == [True]
+        assert checkbox.get_prop("checked") is True
+
+    def test_radio_group_skips_reselection(self, qtbot) -> None:
+        group = RadioGroup(options=[
+            {"label": "A", "value": "a"},
+            {"label": "B", "value": "b"},
+        ])
+        qtbot.addWidget(group)
+        received: list[str] = []
+        group.selection_changed.connect(received.append)
+
+        group._buttons["b"].click()
+        group._buttons["b"].click()
+
+        assert received == ["b"]
+
+
+class TestBatchSignals:
+    """`batch_signals` adia e compacta os sinais emitidos via `_emit`."""
+
+    def test_batch_emits_last_value_once(self, qtbot) -> None:
+        group = RadioGroup(options=[
+            {"label": "A", "value": "a"},
+            {"label": "B", "value": "b"},
+        ])
+        qtbot.addWidget(group)
+        received: list[str] = []
+        group.value_changed.connect(received.append)
+
+        with group.batch_signals():
+            group._buttons["b"].click()
+            group._buttons["a"].click()
+            assert received == []
+
+        assert received == ["a"]
+
+    def test_set_options_rebuilds_buttons(self, qtbot) -> None:
+        group = RadioGroup(options=[{"label": "A", "value": "a"}])
+        qtbot.addWidget(group)
+
+        group.set_options([
+            {"label": "X", "value": "x"},
+            {"label": "Y", "value": "y"},
+        ])
+
+        assert list(group._buttons) == ["x", "y"]
+        assert group.updatesEnabled()
+        assert not group._button_group.signalsBlocked()
+
+
+class TestRadioGroup:
+    """Busca de valor por botão em O(1)."""
+
+    def test_get_value_follows_checked_button(self, qtbot) -> None:
+        group = RadioGroup(options=[
+            {"label": "A", "value": "a"},
+            {"label": "B", "value": "b"},
+        ])
+        qtbot.addWidget(group)
+        assert group.get_value() == ""
+
+        group._buttons["b"].click()
+        assert group.get_value() == "b"
+
+        group.set_options([{"label": "C", "value": "c"}])
+        group._buttons["c"].click()
+        assert group.get_value() == "c"
+
+    def test_set_options_reports_cleared_selection_once(self, qtbot) -> None:
+        group = RadioGroup(options=[{"label": "A", "value": "a"}], value="a")
+        qtbot.addWidget(group)
+        emitted: list[str] = []
+        group.selection_changed.connect(emitted.append)
+
+        group.set_options([{"label": "B", "value": "b"}])
+        group.set_options([{"label": "C", "value": "c"}])
+
+        assert emitted == [""]
+
+    def test_click_after_set_options_emits_previous_value(self, qtbot) -> None:
+        options = [{"label": "A", "value": "a"}, {"label": "C", "value": "c"}]
+        group = RadioGroup(options=options[:1], value="a")
+        qtbot.addWidget(group)
+
+        group.set_options(options)
+        assert group.get_value() == ""
+
+        with qtbot.waitSignal(group.selection_changed) as blocker:
+            group._buttons["a"].click()
+        assert blocker.args == ["a"]
+
+
+class TestFormField:
+    """`set_content` só troca o widget quando ele muda."""
+
+    def test_set_content_swaps_only_on_new_widget(self, qtbot) -> None:
+        field = FormField("Nome")
+        qtbot.addWidget(field)
+        first, second = QLineEdit(), QLineEdit()
+
+        field.set_content(first)
+        field.set_content(first)
+        assert field._content_layout.count() == 1
+        assert first.parent() is field
+
+        field.set_content(second)
+        assert field._content_layout.count() == 1
+        assert first.parent() is None
+        assert second.parent() is field
+
+
+class TestTextInput:
+    """Estilo de erro via propriedade dinâmica, sem `setStyleSheet`."""
+
+    def test_set_error_toggles_error_property(self, qtbot) -> None:
+        text_input = TextInput("Nome")
+        qtbot.addWidget(text_input)
+
+        text_input.set_error("Obrigatório")
+        assert text_input._input.property("error") is True
+        assert not text_input._error_label.isHidden()
+
+        text_input.set_error("")
+        assert text_input._input.property("error") is False
+        assert text_input._input.styleSheet() == ""
+
+
+class TestSelectInput:
+    """Opções carregadas em lote, com um único sinal de seleção."""
+
+    def test_set_options_replaces_items_and_emits_once(self, qtbot) -> None:
+        select = SelectInput("Cor", options=[{"label": "Azul", "value": "blue"}])
+        qtbot.addWidget(select)
+        received: list[str] = []
+        select.selection_changed.connect(received.append)
+
+        select.set_options([
+            {"label": "Verde", "value": "green"},
+            {"label": "Vermelho", "value": "red"},
+        ])
+
+        assert select._combo.count() == 2
+        assert select._combo.itemText(1) == "Vermelho"
+        assert select.get_value() == "green"
+        assert received == ["green"]
+
+    def test_default_options_are_not_shared(self, qtbot) -> None:
+        first, second = SelectInput("A"), SelectInput("B")
+        qtbot.addWidget(first)
+        qtbot.addWidget(second)
+
+        assert first.get_prop("options") == []
+        assert first.get_prop("options") is not second.get_prop("options")
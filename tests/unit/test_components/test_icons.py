@@ -0,0 +1,81 @@
+"""Testes do componente `Icon`."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from PySide6.QtGui import QIcon, QPixmap
+from PySide6.QtWidgets import QStyle
+
+from src.components.icons import Icon, _cache
+from src.components.icons.icon import _get_pixmap
+
+
+@pytest.fixture(autouse=True)
+def icon_cache_dir(tmp_path: Path, monkeypatch) -> Path:
+    """Mantém o cache de ícones em disco fora do diretório do usuário."""
+    monkeypatch.setattr(_cache, "get_cache_dir", lambda: tmp_path)
+    return tmp_path
+
+
+class TestIcon:
+    """Pixmaps de ícones são rasterizados uma vez por (ícone, tamanho)."""
+
+    def test_get_pixmap_reuses_cached_pixmap(self, qtbot) -> None:
+        source = QPixmap(32, 32)
+        source.fill()
+        icon = QIcon(source)
+
+        first = _get_pixmap(icon, 16)
+        second = _get_pixmap(icon, 16)
+
+        assert first.cacheKey() == second.cacheKey()
+        assert _get_pixmap(icon, 24).cacheKey() != first.cacheKey()
+
+    def test_set_size_updates_pixmap(self, qtbot) -> None:
+        icon = Icon.from_standard(QStyle.SP_DialogOkButton, size=16)
+        qtbot.addWidget(icon)
+
+        icon.set_size(32)
+
+        assert icon._label.size().width() == 32
+        assert not icon._label.pixmap().isNull()
+        assert icon.get_prop("size") == 32
+        assert icon.props["size"] == 32
+
+    def test_from_standard_memoizes_icon(self, qtbot) -> None:
+        first = Icon.from_standard(QStyle.SP_MessageBoxInformation)
+        second = Icon.from_standard(QStyle.SP_MessageBoxInformation, size=32)
+        qtbot.addWidget(first)
+        qtbot.addWidget(second)
+
+        assert first.get_prop("icon").cacheKey() == second.get_prop("icon").cacheKey()
+
+
+class TestIconDiskCache:
+    """Ícones padrão são gravados em PNG e recarregados do disco."""
+
+    def test_load_cached_renders_once(self, qtbot, icon_cache_dir: Path) -> None:
+        calls: list[int] = []
+
+        def produce() -> QPixmap:
+            calls.append(1)
+            pixmap = QPixmap(16, 16)
+            pixmap.fill()
+            return pixmap
+
+        first = _cache.load_cached("sample", 16, produce)
+        second = _cache.load_cached("sample", 16, produce)
+
+        assert calls == [1]
+        assert (icon_cache_dir / "sample_16@1x.png").is_file()
+        assert second.size() == first.size()
+
+    def test_from_standard_uses_disk_cache(self, qtbot, icon_cache_dir: Path) -> None:
+        icon = Icon.from_standard(QStyle.SP_DialogCancelButton, size=20)
+        qtbot.addWidget(icon)
+
+        assert icon.get_prop("cache_key").startswith("std-")
+        assert list(icon_cache_dir.glob("std-*_20@1x.png"))
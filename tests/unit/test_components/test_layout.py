@@ -0,0 +1,372 @@
+"""Testes dos componentes de layout."""
+
+from __future__ import annotations
+
+import pytest
+
+from PySide6.QtCore import QRect
+from PySide6.QtWidgets import QScrollArea, QWidget
+
+from src.components.layout.content_area import ContentArea
+from src.components.layout.header import Header
+from src.components.layout.sidebar import Sidebar, SidebarMenuItem
+from src.core.types import PageId
+from src.components.layout.flow_layout import FlowLayout
+from src.components.layout.grid import Grid, GridColumn, GridRow, create_responsive_columns
+
+
+def _make_flow(
+    qtbot, count: int, width: int = 100, height: int = 40, shown: bool = True
+) -> tuple[QWidget, FlowLayout]:
+    container = QWidget()
+    qtbot.addWidget(container)
+    layout = FlowLayout(container, h_spacing=10, v_spacing=10)
+    layout.setContentsMargins(0, 0, 0, 0)
+    for _ in range(count):
+        child = QWidget()
+        child.setFixedSize(width, height)
+        layout.addWidget(child)
+    if shown:
+        container.show()
+    return container, layout
+
+
+class TestFlowLayout:
+    """Quebra de linha e altura calculada pelo `FlowLayout`."""
+
+    def test_items_wrap_to_next_row(self, qtbot) -> None:
+        _, layout = _make_flow(qtbot, 3)
+
+        layout.setGeometry(QRect(0, 0, 220, 200))
+
+        geometries = [layout.itemAt(i).geometry() for i in range(3)]
+        assert [(g.x(), g.y()) for g in geometries] == [(0, 0), (110, 0), (0, 50)]
+
+    def test_height_for_width(self, qtbot) -> None:
+        _, layout = _make_flow(qtbot, 3)
+
+        assert layout.heightForWidth(400) == 40
+        assert layout.heightForWidth(220) == 90
+        assert layout.heightForWidth(100) == 140
+
+    def test_height_for_width_before_show(self, qtbot) -> None:
+        """Widgets de um pai ainda não exibido entram no cálculo."""
+        container, layout = _make_flow(qtbot, 3, shown=False)
+        assert not container.isVisible()
+
+        assert layout.heightForWidth(220) == 90
+
+    def test_explicitly_hidden_widget_is_skipped_before_show(self, qtbot) -> None:
+        _, layout = _make_flow(qtbot, 3, shown=False)
+
+        layout.itemAt(2).widget().hide()
+        assert layout.heightForWidth(220) == 40
+
+    def test_height_for_width_follows_layout_changes(self, qtbot) -> None:
+        container, layout = _make_flow(qtbot, 3)
+        assert layout.heightForWidth(220) == 90
+
+        layout.itemAt(2).widget().hide()
+        assert layout.heightForWidth(220) == 40
+
+        layout.itemAt(0).widget().setFixedHeight(80)
+        assert layout.heightForWidth(220) == 80
+
+        extra = QWidget()
+        extra.setFixedSize(100, 40)
+        layout.addWidget(extra)
+        extra.show()
+        assert layout.heightForWidth(220) == 130
+
+    def test_minimum_size_follows_layout_changes(self, qtbot) -> None:
+        _, layout = _make_flow(qtbot, 2)
+        assert layout.minimumSize().width() == 100
+
+        wide = QWidget()
+        wide.setFixedSize(150, 40)
+        layout.addWidget(wide)
+        # Widgets added to a visible container are shown on the next event loop pass
+        qtbot.waitUntil(lambda: layout.minimumSize().width() == 150)
+
+        layout.setContentsMargins(5, 5, 5, 5)
+        assert layout.minimumSize().width() == 160
+
+
+class TestGridRow:
+    """Redimensionamentos seguidos geram uma única atualização de colunas."""
+
+    def test_resize_events_are_coalesced(self, qtbot) -> None:
+        row = GridRow()
+        qtbot.addWidget(row)
+        column = row.create_column(span=6)
+        row.resize(600, 100)
+        row.show()
+        qtbot.waitUntil(lambda: column.width() == 600 // 2 - 16)
+
+        for width in (700, 800, 900):
+            row.resize(width, 100)
+
+        # Nada é recalculado até o event loop rodar
+        assert row._resize_timer.isActive()
+        assert column.width() == 600 // 2 - 16
+        qtbot.waitUntil(lambda: column.width() == 900 // 2 - 16)
+
+
+class TestGridColumn:
+    """Resolução do span pelo breakpoint da largura do container."""
+
+    @pytest.mark.parametrize(
+        ("width", "expected"),
+        [(1300, 3), (1000, 6), (800, 6), (600, 12), (300, 12)],
+    )
+    def test_span_falls_back_to_smaller_breakpoints(self, qtbot, width: int, expected: int) -> None:
+        column = GridColumn(span=4, xl=3, md=6, xs=12)
+        qtbot.addWidget(column)
+
+        assert column.get_span_for_width(width) == expected
+
+    def test_default_span_without_breakpoints(self, qtbot) -> None:
+        column = GridColumn(span=4, xl=3)
+        qtbot.addWidget(column)
+
+        assert column.get_span_for_width(800) == 4
+
+    def test_unchanged_width_skips_set_fixed_width(self, qtbot, monkeypatch) -> None:
+        column = GridColumn(span=6)
+        qtbot.addWidget(column)
+        column.update_size_for_container(1200)
+        calls: list[int] = []
+        monkeypatch.setattr(column, "setFixedWidth", calls.append)
+
+        column.update_size_for_container(1200)
+        assert calls == []
+
+        column.update_size_for_container(800)
+        assert calls == [384]
+
+    def test_repeated_update_is_skipped(self, qtbot, monkeypatch) -> None:
+        column = GridColumn(span=6)
+        qtbot.addWidget(column)
+        column.update_size_for_container(1200)
+        calls: list[int] = []
+        monkeypatch.setattr(column, "get_span_for_width", calls.append)
+
+        column.update_size_for_container(1200)
+
+        assert calls == []
+
+
+class TestGridBulk:
+    """Criação de várias colunas de uma vez."""
+
+    def test_add_columns_bulk(self, qtbot) -> None:
+        row = GridRow()
+        qtbot.addWidget(row)
+
+        columns = row.add_columns_bulk([{"span": 6}, {"span": 3, "md": 12}])
+
+        assert [c.default_span for c in columns] == [6, 3]
+        assert row._columns == columns
+        assert row._flow_layout.count() == 2
+        assert row.updatesEnabled()
+
+    def test_create_responsive_columns(self, qtbot) -> None:
+        widgets = [QWidget() for _ in range(3)]
+
+        grid = create_responsive_columns(widgets, columns_lg=4)
+        qtbot.addWidget(grid)
+
+        row = grid._rows[0]
+        assert len(row._columns) == 3
+        assert [c._layout.itemAt(0).widget() for c in row._columns] == widgets
+        assert row.uniform_mode
+        assert grid.updatesEnabled()
+
+    def test_batch_updates_suspends_repaints_once(self, qtbot) -> None:
+        grid = Grid()
+        qtbot.addWidget(grid)
+
+        with grid.batch_updates():
+            with grid.batch_updates():
+                grid.add_row().create_column(span=6).add_widget(QWidget())
+            assert not grid.updatesEnabled()
+
+        assert grid.updatesEnabled()
+
+    @pytest.mark.parametrize("width", [1300, 900, 500])
+    def test_uniform_row_matches_flow_row(self, qtbot, width: int) -> None:
+        spec = {"span": 4, "lg": 4, "md": 6, "sm": 12}
+        geometries = []
+        for uniform in (False, True):
+            row = GridRow(uniform=uniform)
+            qtbot.addWidget(row)
+            columns = row.add_columns_bulk([spec] * 5)
+            row.resize(width, 600)
+            row.show()
+            qtbot.waitUntil(lambda: row._container_width == width)
+            qtbot.wait(10)
+            row.layout().activate()
+            geometries.append([c.geometry().topLeft() for c in columns])
+
+        assert geometries[0] == geometries[1]
+
+
+class TestContentArea:
+    """O conteúdo (e a área de rolagem) só é criado no primeiro uso."""
+
+    def test_content_is_built_lazily(self, qtbot) -> None:
+        area = ContentArea()
+        qtbot.addWidget(area)
+        assert area.findChildren(QScrollArea) == []
+
+        label = QWidget()
+        area.add_widget(label)
+
+        assert len(area.findChildren(QScrollArea)) == 1
+        assert area.content_layout.indexOf(label) == 0
+
+    def test_non_scrollable_has_no_scroll_area(self, qtbot) -> None:
+        area = ContentArea(scrollable=False)
+        qtbot.addWidget(area)
+
+        area.add_stretch()
+
+        assert area.findChildren(QScrollArea) == []
+        assert area.content_layout.count() == 1
+
+    def test_clear_drops_content_and_rebuilds_on_next_use(self, qtbot) -> None:
+        area = ContentArea()
+        qtbot.addWidget(area)
+        old = QWidget()
+        area.add_widget(old)
+        destroyed: list[bool] = []
+        old.destroyed.connect(lambda: destroyed.append(True))
+
+        area.clear()
+        qtbot.waitUntil(lambda: destroyed == [True])
+
+        new = QWidget()
+        area.add_widget(new)
+        assert area.content_layout.count() == 1
+        assert area.content_layout.indexOf(new) == 0
+
+
+@pytest.mark.usefixtures("reset_services")
+class TestHeader:
+    """Botões do header: estilo pelo QSS do tema e services resolvidos uma vez."""
+
+    @pytest.fixture
+    def services(self, fresh_container):
+        from src.services.navigation_service import NavigationService
+        from src.services.theme_service import ThemeService
+
+        nav, theme = NavigationService(), ThemeService()
+        fresh_container.register_instance(NavigationService, nav)
+        fresh_container.register_instance(ThemeService, theme)
+        return nav, theme
+
+    def test_buttons_use_theme_classes(self, qtbot, services) -> None:
+        header = Header("Título")
+        qtbot.addWidget(header)
+
+        assert header._back_btn.property("class") == "header-back"
+        assert header._theme_btn.property("class") == "header-theme-toggle"
+        assert header._back_btn.styleSheet() == ""
+        assert header._theme_btn.styleSheet() == ""
+
+    def test_back_uses_service_resolved_at_init(self, qtbot, services, fresh_container) -> None:
+        nav, _ = services
+        header = Header("Título")
+        qtbot.addWidget(header)
+        fresh_container.clear()
+
+        with qtbot.waitSignal(header.back_clicked):
+            header._back_btn.click()
+
+        assert header._nav is nav
+
+
+@pytest.mark.usefixtures("reset_services")
+class TestSidebar:
+    """Marcação do item ativo da `Sidebar`."""
+
+    def test_page_changes_in_one_tick_update_once(self, qtbot, fresh_container) -> None:
+        from src.services.navigation_service import NavigationService
+
+        nav = NavigationService()
+        fresh_container.register_instance(NavigationService, nav)
+        sidebar = Sidebar()
+        qtbot.addWidget(sidebar)
+        sidebar.set_items([
+            SidebarMenuItem(PageId.HOME, "Início"),
+            SidebarMenuItem(PageId.SETTINGS, "Configurações"),
+        ])
+        updates: list[bool] = []
+        sidebar._update_timer.timeout.connect(lambda: updates.append(True))
+
+        nav.page_changed.emit(PageId.HOME, {})
+        nav.page_changed.emit(PageId.SETTINGS, {})
+        assert not sidebar._items[PageId.SETTINGS].isChecked()
+
+        qtbot.waitUntil(lambda: sidebar._items[PageId.SETTINGS].isChecked())
+        assert not sidebar._items[PageId.HOME].isChecked()
+        assert updates == [True]
+
+    def test_collapse_toggles_item_texts(self, qtbot, fresh_container) -> None:
+        from src.services.navigation_service import NavigationService
+
+        fresh_container.register_instance(NavigationService, NavigationService())
+        sidebar = Sidebar()
+        qtbot.addWidget(sidebar)
+        sidebar.set_items([
+            SidebarMenuItem(PageId.HOME, "Início  rápido", "🏠"),
+            SidebarMenuItem(PageId.SETTINGS, "Configurações"),
+        ])
+        home, settings = sidebar._items[PageId.HOME], sidebar._items[PageId.SETTINGS]
+
+        sidebar._toggle_collapse()
+        assert (home.text(), settings.text()) == ("🏠", "Configurações")
+
+        sidebar._toggle_collapse()
+        assert (home.text(), settings.text()) == ("🏠  Início  rápido", "Configurações")
+
+    def test_item_click_emits_page_id(self, qtbot, fresh_container) -> None:
+        from src.services.navigation_service import NavigationService
+
+        nav = NavigationService()
+        nav.register_page(PageId.SETTINGS, QWidget())
+        fresh_container.register_instance(NavigationService, nav)
+        sidebar = Sidebar()
+        qtbot.addWidget(sidebar)
+        sidebar.set_items([SidebarMenuItem(PageId.SETTINGS, "Configurações")])
+
+        with qtbot.waitSignal(sidebar.item_clicked) as blocker:
+            sidebar._items[PageId.SETTINGS].click()
+
+        assert blocker.args == [PageId.SETTINGS]
+        assert nav.get_current_page_id() == PageId.SETTINGS
+
+    def test_active_change_touches_only_two_items(self, qtbot, fresh_container) -> None:
+        from src.services.navigation_service import NavigationService
+
+        fresh_container.register_instance(NavigationService, NavigationService())
+        sidebar = Sidebar()
+        qtbot.addWidget(sidebar)
+        sidebar.set_items([
+            SidebarMenuItem(PageId.HOME, "Início"),
+            SidebarMenuItem(PageId.SETTINGS, "Configurações"),
+            SidebarMenuItem(PageId.SHOWCASE, "Componentes"),
+        ])
+        sidebar.set_active(PageId.HOME)
+        toggled: list[bool] = []
+        sidebar._items[PageId.SHOWCASE].toggled.connect(toggled.append)
+
+        sidebar.set_active(PageId.SETTINGS)
+        assert not sidebar._items[PageId.HOME].isChecked()
+        assert sidebar._items[PageId.SETTINGS].isChecked()
+        assert toggled == []
+
+        # Clicar de novo no item ativo não pode deixá-lo desmarcado
+        sidebar._items[PageId.SETTINGS].setChecked(False)
+        sidebar.set_active(PageId.SETTINGS)
+        assert sidebar._items[PageId.SETTINGS].isChecked()
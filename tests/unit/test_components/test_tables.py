@@ -0,0 +1,149 @@
+"""Testes dos componentes de tabela, lista e árvore."""
+
+from __future__ import annotations
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QTreeWidgetItem
+
+from src.components.tables import DataTable, ListView, TreeView
+
+
+class TestTableStyles:
+    """As views são estilizadas pelo QSS do tema, sem stylesheet próprio."""
+
+    def test_views_use_theme_classes(self, qtbot) -> None:
+        table = DataTable()
+        list_view = ListView()
+        tree = TreeView()
+        for widget in (table, list_view, tree):
+            qtbot.addWidget(widget)
+
+        assert table._table.property("class") == "data-table"
+        assert list_view._list.property("class") == "list-view"
+        assert tree._tree.property("class") == "tree-view"
+        assert not any(w.styleSheet() for w in (table._table, list_view._list, tree._tree))
+
+
+class TestTableProps:
+    """Props com lista padrão não são compartilhadas entre instâncias."""
+
+    def test_list_defaults_are_per_instance(self, qtbot) -> None:
+        for cls, keys in (
+            (DataTable, ("columns", "data")),
+            (ListView, ("items",)),
+            (TreeView, ("items", "headers")),
+        ):
+            first, second = cls(), cls()
+            qtbot.addWidget(first)
+            qtbot.addWidget(second)
+            for key in keys:
+                assert first.get_prop(key) is not second.get_prop(key)
+
+
+class TestDataTable:
+    """Preenchimento da `DataTable`."""
+
+    COLUMNS = [{"key": "name", "label": "Nome"}, {"key": "qty", "label": "Qtd"}]
+
+    def test_rows_follow_data_order(self, qtbot) -> None:
+        data = [{"name": "b", "qty": 2}, {"name": "a", "qty": 1}, {"name": "c"}]
+
+        table = DataTable(columns=self.COLUMNS, data=data, sortable=True)
+        qtbot.addWidget(table)
+
+        model = table._table.model()
+        cells = [
+            [model.index(r, c).data() for c in range(model.columnCount())]
+            for r in range(model.rowCount())
+        ]
+        assert cells == [["b", "2"], ["a", "1"], ["c", ""]]
+        assert model.headerData(1, Qt.Horizontal) == "Qtd"
+
+    def test_set_data_resets_model(self, qtbot) -> None:
+        table = DataTable(columns=self.COLUMNS, data=[{"name": "a"}])
+        qtbot.addWidget(table)
+
+        with qtbot.waitSignal(table._model.modelReset):
+            table.set_data([{"name": "x"}, {"name": "y"}])
+
+        assert table._table.model().rowCount() == 2
+
+    def test_empty_data_on_empty_table_skips_reset(self, qtbot) -> None:
+        table = DataTable()
+        qtbot.addWidget(table)
+        resets: list[bool] = []
+        table._model.modelReset.connect(lambda: resets.append(True))
+
+        table.set_data([])
+        assert resets == []
+
+        table.set_data([{"name": "a"}])
+        table.set_data([])
+        assert resets == [True, True]
+        assert table._table.model().rowCount() == 0
+
+    def test_clicks_report_source_row_after_sorting(self, qtbot) -> None:
+        data = [{"name": "b"}, {"name": "c"}, {"name": "a"}]
+        table = DataTable(columns=self.COLUMNS, data=data)
+        qtbot.addWidget(table)
+        table._table.sortByColumn(0, Qt.AscendingOrder)
+
+        view_index = table._table.model().index(0, 0)
+        with qtbot.waitSignal(table.row_clicked) as blocker:
+            table._table.clicked.emit(view_index)
+        table._table.setCurrentIndex(view_index)
+
+        assert blocker.args == [2, {"name": "a"}]
+        assert table.get_selected_row() == 2
+
+
+class TestListView:
+    """Preenchimento da `ListView`."""
+
+    def test_set_items_fills_and_clears(self, qtbot) -> None:
+        view = ListView()
+        qtbot.addWidget(view)
+
+        view.set_items(["a", {"text": "b"}])
+        assert [view._list.item(i).text() for i in range(view._list.count())] == ["a", "b"]
+
+        view.set_items([])
+        assert view._list.count() == 0
+
+
+class TestTreeView:
+    """Filhos da `TreeView` só são criados quando o nó é expandido."""
+
+    ITEMS = [
+        {"text": "raiz", "children": [{"text": "filho", "children": [{"text": "neto"}]}]},
+        {"text": "folha"},
+    ]
+
+    def test_children_are_created_on_expand(self, qtbot) -> None:
+        tree = TreeView(items=self.ITEMS)
+        qtbot.addWidget(tree)
+        root = tree._tree.topLevelItem(0)
+
+        assert tree._tree.topLevelItemCount() == 2
+        assert root.childCount() == 0
+        assert root.childIndicatorPolicy() == QTreeWidgetItem.ShowIndicator
+        assert tree._tree.topLevelItem(1).childIndicatorPolicy() != QTreeWidgetItem.ShowIndicator
+
+        with qtbot.waitSignal(tree.item_expanded) as blocker:
+            root.setExpanded(True)
+
+        assert blocker.args == [self.ITEMS[0]]
+        assert root.childCount() == 1
+        assert root.child(0).text(0) == "filho"
+        assert root.child(0).childCount() == 0
+
+    def test_expanding_twice_does_not_duplicate_children(self, qtbot) -> None:
+        tree = TreeView(items=self.ITEMS)
+        qtbot.addWidget(tree)
+        root = tree._tree.topLevelItem(0)
+
+        root.setExpanded(True)
+        root.setExpanded(False)
+        root.setExpanded(True)
+
+        assert root.childCount() == 1
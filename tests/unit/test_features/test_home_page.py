@@ -0,0 +1,28 @@
+"""Testes dos widgets da página inicial."""
+
+from __future__ import annotations
+
+from PySide6.QtCore import Qt
+
+from src.features.home.page import ClickableFrame
+
+
+class TestClickableFrame:
+    """Cards de ação clicáveis da `HomePage`."""
+
+    def test_left_click_emits_clicked(self, qtbot) -> None:
+        frame = ClickableFrame()
+        qtbot.addWidget(frame)
+
+        with qtbot.waitSignal(frame.clicked):
+            qtbot.mouseClick(frame, Qt.LeftButton)
+
+    def test_right_click_is_ignored(self, qtbot) -> None:
+        frame = ClickableFrame()
+        qtbot.addWidget(frame)
+        clicks: list[bool] = []
+        frame.clicked.connect(lambda: clicks.append(True))
+
+        qtbot.mouseClick(frame, Qt.RightButton)
+
+        assert clicks == []
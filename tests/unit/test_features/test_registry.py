@@ -0,0 +1,17 @@
+"""Testes do registro de features."""
+
+from __future__ import annotations
+
+from src.core.types import PageId
+from src.features.registry import FEATURE_METADATA, get_metadata
+
+
+class TestFeatureRegistry:
+    """Consulta de metadados por `PageId`."""
+
+    def test_get_metadata_matches_feature_list(self) -> None:
+        for meta in FEATURE_METADATA:
+            assert get_metadata(meta.page_id) is meta
+
+    def test_every_page_has_metadata(self) -> None:
+        assert all(get_metadata(page_id) is not None for page_id in PageId)
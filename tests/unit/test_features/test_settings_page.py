@@ -0,0 +1,49 @@
+"""Testes da página de configurações."""
+
+from __future__ import annotations
+
+import pytest
+
+from src.features.settings.page import SettingsPage
+
+
+@pytest.fixture
+def page(qtbot, tmp_path, fresh_container, reset_services) -> SettingsPage:
+    from src.services.config_service import ConfigService
+    from src.services.logger_service import LoggerService
+    from src.services.navigation_service import NavigationService
+    from src.services.theme_service import ThemeService
+
+    config = ConfigService()
+    # Nunca grava no settings.json real do usuário
+    config._config_dir = tmp_path
+    config._config_path = tmp_path / "settings.json"
+
+    fresh_container.register_instance(NavigationService, NavigationService())
+    fresh_container.register_instance(ConfigService, config)
+    fresh_container.register_instance(LoggerService, LoggerService())
+    fresh_container.register_instance(ThemeService, ThemeService())
+
+    page = SettingsPage()
+    qtbot.addWidget(page)
+    page.on_first_show()
+    return page
+
+
+class TestSettingsPage:
+    """Sincronização dos controles com a configuração."""
+
+    def test_reset_restores_controls_edited_by_user(self, page) -> None:
+        assert page._remember_size_check.isChecked() is True
+
+        page._remember_size_check.setChecked(False)
+        assert page.config.get("window.remember_size") is False
+
+        page._on_reset_clicked()
+
+        assert page.config.get("window.remember_size") is True
+        assert page._remember_size_check.isChecked() is True
+
+    def test_unchanged_reload_keeps_controls(self, page) -> None:
+        page.refresh()
+        assert page._remember_size_check.isChecked() is True
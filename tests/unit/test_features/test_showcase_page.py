@@ -0,0 +1,57 @@
+"""Testes da página de showcase de componentes."""
+
+from __future__ import annotations
+
+import pytest
+from PySide6.QtWidgets import QCheckBox
+
+from src.features.showcase.page import ShowcasePage
+
+
+@pytest.fixture
+def page(qtbot, fresh_container, reset_services) -> ShowcasePage:
+    from src.services.config_service import ConfigService
+    from src.services.logger_service import LoggerService
+    from src.services.navigation_service import NavigationService
+
+    fresh_container.register_instance(NavigationService, NavigationService())
+    fresh_container.register_instance(ConfigService, ConfigService())
+    fresh_container.register_instance(LoggerService, LoggerService())
+
+    page = ShowcasePage()
+    qtbot.addWidget(page)
+    return page
+
+
+class TestShowcaseTabs:
+    """Abas construídas sob demanda."""
+
+    def test_only_first_tab_is_built(self, page) -> None:
+        tabs = page._tabs
+        assert tabs.count() == 5
+        for index in range(1, tabs.count()):
+            assert tabs.widget(index).layout().count() == 0
+
+    def test_tab_is_built_once_when_selected(self, page) -> None:
+        tabs = page._tabs
+        tabs.setCurrentIndex(2)
+        placeholder = tabs.widget(2)
+        assert placeholder.layout().count() == 1
+
+        tabs.setCurrentIndex(0)
+        tabs.setCurrentIndex(2)
+        assert tabs.widget(2) is placeholder
+        assert placeholder.layout().count() == 1
+
+
+class TestShowcaseInputs:
+    """Aba Inputs."""
+
+    def test_checkbox_options(self, page) -> None:
+        page._tabs.setCurrentIndex(1)
+        checks = page._tabs.widget(1).findChildren(QCheckBox)
+
+        assert [cb.text() for cb in checks] == [
+            "Option A", "Option B (checked)", "Disabled",
+        ]
+        assert [cb.isChecked() for cb in checks] == [False, True, False]
@@ -7,38 +7,41 @@ from unittest.mock import MagicMock
 import pytest
 
 from src.core.exceptions import NavigationError
+from src.core.types import PageId
+from src.services.navigation_service import NavigationService
+
+
+class _PageStub:
+    """Página mínima: o service só chama o hook `on_navigate`."""
+
+    __slots__ = ("on_navigate",)
+
+    def __init__(self) -> None:
+        self.on_navigate = MagicMock()
 
 
 @pytest.mark.usefixtures("reset_services")
 class TestNavigationService:
     """Testes do `NavigationService` — registro, navegação e history."""
 
-    def test_register_and_navigate(self, qapp) -> None:
-        from src.core.types import PageId
-        from src.services.navigation_service import NavigationService
+    @pytest.fixture
+    def service(self, qapp) -> NavigationService:
+        return NavigationService()
 
-        service = NavigationService()
-        mock_page = MagicMock()
+    def test_register_and_navigate(self, service) -> None:
+        mock_page = _PageStub()
         service.register_page(PageId.HOME, mock_page)
 
         assert service.navigate_to(PageId.HOME) is True
         assert service.get_current_page_id() == PageId.HOME
 
-    def test_navigate_to_unregistered_raises(self, qapp) -> None:
-        from src.core.types import PageId
-        from src.services.navigation_service import NavigationService
-
-        service = NavigationService()
+    def test_navigate_to_unregistered_raises(self, service) -> None:
         with pytest.raises(NavigationError):
             service.navigate_to(PageId.HOME)
 
-    def test_history_back_and_forward(self, qapp) -> None:
-        from src.core.types import PageId
-        from src.services.navigation_service import NavigationService
-
-        service = NavigationService()
-        service.register_page(PageId.HOME, MagicMock())
-        service.register_page(PageId.SETTINGS, MagicMock())
+    def test_history_back_and_forward(self, service) -> None:
+        service.register_page(PageId.HOME, _PageStub())
+        service.register_page(PageId.SETTINGS, _PageStub())
 
         service.navigate_to(PageId.HOME)
         service.navigate_to(PageId.SETTINGS)
@@ -49,23 +52,44 @@ class TestNavigationService:
         assert service.go_forward() is True
         assert service.get_current_page_id() == PageId.SETTINGS
 
-    def test_on_navigate_callback_called(self, qapp) -> None:
-        from src.core.types import PageId
-        from src.services.navigation_service import NavigationService
-
-        service = NavigationService()
-        page = MagicMock()
+    def test_on_navigate_callback_called(self, service) -> None:
+        page = _PageStub()
         service.register_page(PageId.HOME, page)
         service.navigate_to(PageId.HOME, {"x": 1})
 
         page.on_navigate.assert_called_once_with({"x": 1})
 
-    def test_guard_blocks_navigation(self, qapp) -> None:
-        from src.core.types import PageId
-        from src.services.navigation_service import NavigationService
-
-        service = NavigationService()
-        service.register_page(PageId.HOME, MagicMock())
+    def test_guard_blocks_navigation(self, service) -> None:
+        service.register_page(PageId.HOME, _PageStub())
 
         service.add_guard(lambda _page_id, _params: False)
         assert service.navigate_to(PageId.HOME) is False
+
+    def test_page_factory_builds_on_first_navigation(self, service) -> None:
+        page = _PageStub()
+        factory = MagicMock(return_value=page)
+        service.register_page_factory(PageId.SETTINGS, factory)
+
+        assert service.is_page_registered(PageId.SETTINGS) is True
+        factory.assert_not_called()
+
+        service.navigate_to(PageId.SETTINGS)
+        service.navigate_to(PageId.SETTINGS)
+        factory.assert_called_once_with()
+        assert service.get_current_page() is page
+
+    def test_failing_page_factory_leaves_state_unchanged(self, service) -> None:
+        page = _PageStub()
+        factory = MagicMock(side_effect=[RuntimeError("falhou"), page])
+        service.register_page_factory(PageId.SETTINGS, factory)
+
+        with pytest.raises(RuntimeError, match="falhou"):
+            service.navigate_to(PageId.SETTINGS)
+
+        assert service.is_page_registered(PageId.SETTINGS) is True
+        assert service.get_history() == []
+        assert service.get_current_page_id() is None
+
+        assert service.navigate_to(PageId.SETTINGS) is True
+        assert service.get_current_page() is page
+        assert len(service.get_history()) == 1
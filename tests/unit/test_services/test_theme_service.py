@@ -0,0 +1,45 @@
+"""Testes do ThemeService."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+
+@pytest.mark.usefixtures("reset_services")
+class TestThemeService:
+    """Testes do pré-carregamento dos `.qss` no `ThemeService`."""
+
+    def test_preload_reads_all_qss_files(self) -> None:
+        from src.services.theme_service import ThemeService
+
+        service = ThemeService()
+        assert {"base.qss", "light.qss", "dark.qss"} <= set(service._qss_raw)
+        assert service._load_stylesheet("dark.qss") == (
+            service.styles_path / "dark.qss"
+        ).read_text(encoding="utf-8")
+
+    def test_preload_ignores_non_qss_files(self, tmp_path: Path) -> None:
+        from src.services.theme_service import ThemeService
+
+        (tmp_path / "custom.qss").write_text("QWidget {}", encoding="utf-8")
+        (tmp_path / "notes.txt").write_text("ignorar", encoding="utf-8")
+
+        service = ThemeService()
+        service._styles_path = tmp_path
+        assert service._preload_stylesheets() == {"custom.qss": "QWidget {}"}
+
+    def test_preload_with_missing_styles_dir(self, tmp_path: Path) -> None:
+        from src.services.theme_service import ThemeService
+
+        service = ThemeService()
+        service._styles_path = tmp_path / "nao-existe"
+        # Diretório ausente não quebra: nenhum estilo carregado
+        assert service._preload_stylesheets() == {}
+
+    def test_load_unknown_stylesheet_returns_empty(self) -> None:
+        from src.services.theme_service import ThemeService
+
+        service = ThemeService()
+        assert service._load_stylesheet("nao-existe.qss") == ""
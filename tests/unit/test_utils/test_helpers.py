@@ -0,0 +1,97 @@
+"""Testes dos helpers em `src/utils/helpers.py`."""
+
+from __future__ import annotations
+
+import pytest
+
+from src.utils.helpers import (
+    format_file_size,
+    safe_float,
+    safe_int,
+    truncate_many,
+    truncate_text,
+)
+
+
+class TestFormatFileSize:
+    """Testes do `format_file_size` — limites entre unidades."""
+
+    @pytest.mark.parametrize(
+        ("size", "expected"),
+        [
+            (0, "0.0 B"),
+            (1023, "1023.0 B"),
+            (1024, "1.0 KB"),
+            (1048575, "1024.0 KB"),
+            (1048576, "1.0 MB"),
+            (2**50, "1.0 PB"),
+            (2**60, "1024.0 PB"),
+        ],
+    )
+    def test_unit_boundaries(self, size: int, expected: str) -> None:
+        assert format_file_size(size) == expected
+
+    @pytest.mark.parametrize(
+        ("size", "expected"),
+        [
+            (float("inf"), "inf PB"),
+            (float("nan"), "nan PB"),
+            (float("-inf"), "-inf B"),
+        ],
+    )
+    def test_non_finite_values(self, size: float, expected: str) -> None:
+        assert format_file_size(size) == expected
+
+
+class TestSafeNumbers:
+    """Testes do `safe_int`/`safe_float` — fast paths e fallback."""
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            (None, 7),
+            ("", 7),
+            ("  ", 7),
+            ("+", 7),
+            ("-3", -3),
+            (" 42 ", 42),
+            ("1_000", 1000),
+            ("²", 7),
+            ("3.5", 7),
+        ],
+    )
+    def test_safe_int(self, value: object, expected: int) -> None:
+        assert safe_int(value, default=7) == expected
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            (None, 7.0),
+            ("", 7.0),
+            ("  ", 7.0),
+            ("+", 7.0),
+            ("-3", -3.0),
+            ("1_000", 1000.0),
+            ("²", 7.0),
+            ("3.5", 3.5),
+        ],
+    )
+    def test_safe_float(self, value: object, expected: float) -> None:
+        result = safe_float(value, default=7.0)
+        assert result == expected
+        assert isinstance(result, float)
+
+
+class TestTruncate:
+    """Testes do `truncate_text`/`truncate_many`."""
+
+    def test_truncate_text_default_suffix(self) -> None:
+        assert truncate_text("hello world", 8) == "hello..."
+        assert truncate_text("curto", 8) == "curto"
+
+    def test_truncate_text_custom_suffix(self) -> None:
+        assert truncate_text("hello world", 8, suffix="~") == "hello w~"
+
+    def test_truncate_many_matches_truncate_text(self) -> None:
+        texts = ["hello world", "curto", "", "exatamente"]
+        assert truncate_many(texts, 10) == [truncate_text(t, 10) for t in texts]